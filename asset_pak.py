@@ -0,0 +1,273 @@
+""" A pak archive holding every image as raw display-format pixels, plus its precomputed collision mask.
+The archive is memory-mapped copy-on-write and surfaces are created straight on top of it with
+pygame.image.frombuffer, so loading an image involves no PNG decode, no convert_alpha() and no copy. Run this file to build the
+archive. Entries whose source PNG has changed are rebuilt automatically when the archive is opened. """
+
+# Standard library
+import hashlib
+import json
+import mmap
+import os
+import struct
+import tempfile
+# Pygame
+import pygame
+# Game modules
+import build_atlas
+
+
+# Where the archive lives, and which images go in it
+PAK_PATH = 'assets/assets.pak'
+ASSET_DIRECTORY = 'assets'
+
+# File layout: magic, length of the JSON index, the index, then the pixel and mask data
+MAGIC = b'AAPAK001'
+HEADER = struct.Struct('<8sQ')
+# Data blocks start on a 16 byte boundary
+ALIGNMENT = 16
+
+# Alpha threshold the stored masks are built with, matching pygame.mask.from_surface's default
+MASK_THRESHOLD = 127
+
+
+def display_format():
+    """ Returns the pygame byte order string (E.g. 'BGRA') that matches convert_alpha() on this display. """
+    masks = pygame.Surface((1, 1), pygame.SRCALPHA).convert_alpha().get_masks()
+    channels = {masks[0]: "R", masks[1]: "G", masks[2]: "B", masks[3]: "A"}
+    # Pixels are stored as little-endian 32 bit values, so the lowest mask comes first in memory
+    return "".join(channels[mask] for mask in (0x000000ff, 0x0000ff00, 0x00ff0000, 0xff000000))
+
+
+def file_hash(path):
+    with open(path, 'rb') as f:
+        return hashlib.sha1(f.read()).hexdigest()
+
+
+def source_info(path):
+    """ Returns what is recorded about a source file so the archive can tell when it changes. """
+    stat = os.stat(path)
+    return {"size": stat.st_size, "mtime": stat.st_mtime_ns, "sha1": file_hash(path)}
+
+
+def find_images(directory=ASSET_DIRECTORY):
+    """ Returns the paths of every PNG below a directory, skipping the atlas pages. The registry only ever
+    reads those from the atlas, and they are larger than every other image put together. """
+    paths = []
+    for root, dirs, files in os.walk(directory):
+        dirs.sort()
+        if root.replace(os.sep, '/') == build_atlas.ATLAS_DIRECTORY:
+            continue
+        for name in sorted(files):
+            if name.endswith('.png'):
+                paths.append("{0}/{1}".format(root.replace(os.sep, '/'), name))
+    return paths
+
+
+def encode(path, pixel_format):
+    """ Decodes a PNG and returns (width, height, pixel bytes, mask bytes). The mask has one byte per
+    pixel, 1 where the pixel is solid enough to collide with. """
+    image = pygame.image.load(path).convert_alpha()
+    width, height = image.get_size()
+    pixels = pygame.image.tobytes(image, pixel_format)
+    mask = pygame.mask.from_surface(image, MASK_THRESHOLD)
+    mask_render = mask.to_surface(setcolor=(1, 1, 1, 255), unsetcolor=(0, 0, 0, 255))
+    mask_bytes = pygame.image.tobytes(mask_render, "RGBA")[0::4]
+    return width, height, pixels, mask_bytes
+
+
+def write(path, pixel_format, entries):
+    """ Writes an archive. entries is a dict of image path: (width, height, pixels, mask, source info). """
+    index = {"format": pixel_format, "entries": {}}
+    blocks = []
+    offset = 0
+    for image_path in sorted(entries):
+        width, height, pixels, mask, source = entries[image_path]
+        pixel_offset = offset
+        offset += -(-len(pixels) // ALIGNMENT) * ALIGNMENT
+        mask_offset = offset
+        offset += -(-len(mask) // ALIGNMENT) * ALIGNMENT
+        blocks.append((pixel_offset, pixels))
+        blocks.append((mask_offset, mask))
+        index["entries"][image_path] = {"width": width, "height": height, "pixels": pixel_offset,
+                                        "mask": mask_offset, "source": source}
+
+    index_bytes = json.dumps(index, sort_keys=True).encode('utf-8')
+    data_start = -(-(HEADER.size + len(index_bytes)) // ALIGNMENT) * ALIGNMENT
+
+    # Write alongside and swap in, so a half-written archive is never left behind. Each writer has its own
+    # temporary file, as several processes (E.g. batch.py workers) may rebuild the same stale archive at once
+    descriptor, temp_path = tempfile.mkstemp(dir=os.path.dirname(path) or '.', prefix=os.path.basename(path) + '.',
+                                             suffix='.tmp')
+    try:
+        with os.fdopen(descriptor, 'wb') as f:
+            f.write(HEADER.pack(MAGIC, len(index_bytes)))
+            f.write(index_bytes)
+            for block_offset, block in blocks:
+                f.seek(data_start + block_offset)
+                f.write(block)
+            f.truncate(data_start + offset)
+        # mkstemp only lets the owner read the file
+        os.chmod(temp_path, 0o644)
+        os.replace(temp_path, path)
+    except BaseException:
+        os.remove(temp_path)
+        raise
+
+
+def build(path=PAK_PATH, directory=ASSET_DIRECTORY):
+    """ Builds an archive from scratch containing every PNG below directory. Needs a display mode to
+    have been set, since pixels are stored in the display's format. """
+    pixel_format = display_format()
+    entries = {}
+    for image_path in find_images(directory):
+        entries[image_path] = encode(image_path, pixel_format) + (source_info(image_path),)
+    write(path, pixel_format, entries)
+    return len(entries)
+
+
+class PakFile:
+    """ A memory-mapped archive. Surfaces returned by image() point straight into the mapped file. It is
+    mapped copy-on-write, so drawing on one only changes this process's copy of those pages, never the file,
+    but the change shows up in every surface made from that entry. """
+    def __init__(self, path=PAK_PATH):
+        self.path = path
+        self.file = None
+        self.map = None
+        self.view = None
+        self.format = None
+        self.entries = {}
+        self.data_start = 0
+        self.rebuilt = 0
+        # Which file was mapped, to tell if another process has since swapped in a new one
+        self.mapped_file = None
+
+    def __contains__(self, image_path):
+        return image_path in self.entries
+
+    def open(self):
+        """ Maps the archive, rebuilding any stale entries first. Returns False if there is no archive. """
+        if not os.path.exists(self.path):
+            return False
+        self.map_file()
+        stale = self.stale_entries()
+        if len(stale) > 0 or self.format != display_format():
+            self.rebuild(stale)
+        return True
+
+    def replaced(self):
+        """ Whether the archive on disk is no longer the file that is mapped. """
+        stat = os.stat(self.path)
+        return (stat.st_ino, stat.st_mtime_ns, stat.st_size) != self.mapped_file
+
+    def map_file(self):
+        self.close()
+        self.file = open(self.path, 'rb')
+        stat = os.fstat(self.file.fileno())
+        self.mapped_file = (stat.st_ino, stat.st_mtime_ns, stat.st_size)
+        magic, index_length = HEADER.unpack(self.file.read(HEADER.size))
+        if magic != MAGIC:
+            raise ValueError("{0} is not an Asteroid Attack pak file".format(self.path))
+        index = json.loads(self.file.read(index_length).decode('utf-8'))
+        self.format = index["format"]
+        self.entries = index["entries"]
+        self.data_start = -(-(HEADER.size + index_length) // ALIGNMENT) * ALIGNMENT
+        # A read-only mapping would crash the process (rather than raise) if a surface on it were drawn on
+        self.map = mmap.mmap(self.file.fileno(), 0, access=mmap.ACCESS_COPY)
+        self.view = memoryview(self.map)
+
+    def close(self):
+        if self.view is not None:
+            self.view.release()
+            self.view = None
+        if self.map is not None:
+            self.map.close()
+            self.map = None
+        if self.file is not None:
+            self.file.close()
+            self.file = None
+
+    def stale_entries(self):
+        """ Returns the images whose source file differs from when they were stored. Size and modification
+        time are checked first, and the file is only hashed if they have changed. """
+        stale = []
+        for image_path, entry in self.entries.items():
+            source = entry["source"]
+            if not os.path.exists(image_path):
+                stale.append(image_path)
+                continue
+            stat = os.stat(image_path)
+            if stat.st_size == source["size"] and stat.st_mtime_ns == source["mtime"]:
+                continue
+            if file_hash(image_path) != source["sha1"]:
+                stale.append(image_path)
+        return stale
+
+    def rebuild(self, stale):
+        """ Re-encodes stale entries, keeping the stored data of everything else, and remaps the archive.
+        If the display format has changed, every entry is re-encoded. Entries whose source file has been
+        deleted are dropped. """
+        pixel_format = display_format()
+        # Another process may have rebuilt the archive since it was mapped. If so, use that rather than
+        # rebuilding it again
+        if self.replaced() is True:
+            self.map_file()
+            stale = self.stale_entries()
+            if len(stale) == 0 and self.format == pixel_format:
+                return
+        if pixel_format != self.format:
+            stale = list(self.entries)
+
+        entries = {}
+        for image_path, entry in self.entries.items():
+            if image_path in stale:
+                if os.path.exists(image_path):
+                    entries[image_path] = encode(image_path, pixel_format) + (source_info(image_path),)
+                    self.rebuilt += 1
+            else:
+                pixels = self.pixel_view(image_path)
+                mask = self.mask_view(image_path)
+                entries[image_path] = (entry["width"], entry["height"], bytes(pixels), bytes(mask), entry["source"])
+                # The mapping can only be closed once no views into it remain
+                pixels.release()
+                mask.release()
+        # Surfaces made from the old mapping must not outlive it, so only rebuild before handing any out
+        self.close()
+        write(self.path, pixel_format, entries)
+        self.map_file()
+
+    def pixel_view(self, image_path):
+        """ Returns a memoryview of an entry's pixel data. """
+        entry = self.entries[image_path]
+        start = self.data_start + entry["pixels"]
+        return self.view[start:start + entry["width"] * entry["height"] * 4]
+
+    def mask_view(self, image_path):
+        """ Returns a memoryview of an entry's mask data. """
+        entry = self.entries[image_path]
+        start = self.data_start + entry["mask"]
+        return self.view[start:start + entry["width"] * entry["height"]]
+
+    def image(self, image_path):
+        """ Returns a surface for an image, made directly on top of the mapped pixel data. """
+        entry = self.entries[image_path]
+        return pygame.image.frombuffer(self.pixel_view(image_path), (entry["width"], entry["height"]), self.format)
+
+    def mask(self, image_path):
+        """ Returns the collision mask for an image from its stored mask bytes. """
+        entry = self.entries[image_path]
+        mask_surface = pygame.image.frombuffer(self.mask_view(image_path), (entry["width"], entry["height"]), "P")
+        mask_surface.set_colorkey(0)
+        return pygame.mask.from_surface(mask_surface)
+
+
+def main():
+    """ Builds the archive. A hidden window is opened so pixels can be stored in the display format. """
+    pygame.init()
+    pygame.display.set_mode((1, 1), pygame.HIDDEN)
+    count = build()
+    print("Stored {0!s} images in {1}".format(count, PAK_PATH))
+
+
+# Build the archive if this file has not been imported
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,175 @@
+""" A process-wide cache of images and collision masks. Each image file is decoded and converted once,
+and every sprite that uses it is handed a shared reference to the same surface and mask. Images are taken
+from the pak archive built by asset_pak.py if there is one, then from the atlas built by build_atlas.py,
+with loose files used for anything else. """
+
+# Standard library
+import json
+import os
+# Pygame
+import pygame
+# Game modules
+import asset_pak
+
+
+# Written by build_atlas.py. If it is missing, every image is loaded from its own file
+ATLAS_INDEX = 'assets/atlas/atlas.json'
+
+
+class AssetRegistry:
+    """ Loads images and builds masks the first time they are asked for, then keeps them for the lifetime
+    of the process. Surfaces and masks handed out are shared between sprites, so they must be treated as
+    read-only. Hit and miss counters show how often a request had to go to disk or rebuild a mask. """
+    def __init__(self, atlas_index=ATLAS_INDEX, pak_path=asset_pak.PAK_PATH):
+        self.images = {}
+        self.masks = {}
+        self.animations = {}
+
+        # Atlas lookup, read on first use. Set use_atlas to False before loading anything to work from
+        # the loose files, e.g. while editing images
+        self.atlas_index = atlas_index
+        self.use_atlas = True
+        self.atlas = None
+        self.atlas_page_paths = []
+        self.atlas_pages = {}
+
+        # Pre-converted pixel archive, opened on first use. use_pak works like use_atlas
+        self.pak_path = pak_path
+        self.use_pak = True
+        self.pak = None
+
+        self.image_hits = 0
+        self.image_misses = 0
+        self.mask_hits = 0
+        self.mask_misses = 0
+        self.file_reads = 0
+
+    def image(self, path, alpha=True, angle=0):
+        """ Returns the converted surface for an image file, optionally rotated by angle degrees. The surface
+        is shared by everything that uses the image, and may be part of an atlas page or sit on the mapped pak
+        file, so never draw on it (fill, blit onto it etc). Draw on a copy() instead. """
+        key = (path, alpha, angle)
+        surface = self.images.get(key)
+        if surface is not None:
+            self.image_hits += 1
+            return surface
+
+        self.image_misses += 1
+        if angle != 0:
+            # Rotated variants are built from the cached upright image rather than the file
+            surface = pygame.transform.rotate(self.image(path, alpha), angle)
+        elif path in self.load_pak():
+            surface = self.pak.image(path)
+            if alpha is False:
+                surface = surface.convert()
+        elif alpha is True and path in self.load_atlas():
+            page, area = self.atlas[path]
+            surface = self.atlas_page(page).subsurface(area)
+        elif alpha is True:
+            self.file_reads += 1
+            surface = pygame.image.load(path).convert_alpha()
+        else:
+            self.file_reads += 1
+            surface = pygame.image.load(path).convert()
+        self.images[key] = surface
+        return surface
+
+    def load_pak(self):
+        """ Opens the pak archive if there is one, rebuilding any entries whose source image has changed.
+        Returns the archive, which can be checked with 'in' for the images it holds. """
+        if self.pak is None:
+            self.pak = asset_pak.PakFile(self.pak_path)
+            if self.use_pak is True and self.pak.open() is True:
+                self.file_reads += 1
+        return self.pak
+
+    def load_atlas(self):
+        """ Reads the atlas index if there is one, returning a dict of image path: (page, area). Pages
+        themselves are only decoded when an image on them is first needed. """
+        if self.atlas is None:
+            self.atlas = {}
+            if self.use_atlas is True and os.path.exists(self.atlas_index):
+                with open(self.atlas_index) as f:
+                    index = json.load(f)
+                directory = os.path.dirname(self.atlas_index)
+                self.atlas_page_paths = ["{0}/{1}".format(directory, name) for name in index["pages"]]
+                for path, (page, x, y, width, height) in index["sprites"].items():
+                    self.atlas[path] = (page, pygame.Rect(x, y, width, height))
+        return self.atlas
+
+    def atlas_page(self, page):
+        """ Returns a decoded atlas page. """
+        surface = self.atlas_pages.get(page)
+        if surface is None:
+            self.file_reads += 1
+            surface = pygame.image.load(self.atlas_page_paths[page]).convert_alpha()
+            self.atlas_pages[page] = surface
+        return surface
+
+    def mask(self, path, threshold=127, angle=0):
+        """ Returns the collision mask for an image file, built from the cached surface. """
+        key = (path, threshold, angle)
+        mask = self.masks.get(key)
+        if mask is not None:
+            self.mask_hits += 1
+            return mask
+
+        self.mask_misses += 1
+        if angle == 0 and threshold == asset_pak.MASK_THRESHOLD and path in self.load_pak():
+            mask = self.pak.mask(path)
+        else:
+            mask = pygame.mask.from_surface(self.image(path, angle=angle), threshold)
+        self.masks[key] = mask
+        return mask
+
+    def frames(self, directory, step=1):
+        """ Returns every PNG in a directory as a tuple of frames, in filename order. A step above 1 gives a
+        decimated copy keeping every step-th frame, for machines that struggle with the full animation. """
+        key = (directory, step)
+        frames = self.animations.get(key)
+        if frames is not None:
+            self.image_hits += 1
+            return frames
+
+        if step != 1:
+            frames = self.frames(directory)[::step]
+        else:
+            # os.listdir order is not guaranteed, so sort to keep the animation in sequence
+            names = sorted(name for name in os.listdir(directory) if name.endswith('.png'))
+            frames = tuple(self.image("{0}/{1}".format(directory, name)) for name in names)
+        self.animations[key] = frames
+        return frames
+
+    def stats(self):
+        """ Returns the hit and miss counters, how many files have been read, and how many images and masks
+        are held. """
+        return {"image_hits": self.image_hits, "image_misses": self.image_misses,
+                "mask_hits": self.mask_hits, "mask_misses": self.mask_misses,
+                "file_reads": self.file_reads, "images": len(self.images), "masks": len(self.masks)}
+
+    def reset_stats(self):
+        """ Zeroes the counters, e.g. once a level has warmed up, so later misses stand out. """
+        self.image_hits = 0
+        self.image_misses = 0
+        self.mask_hits = 0
+        self.mask_misses = 0
+        self.file_reads = 0
+
+
+# The registry shared by the whole game
+registry = AssetRegistry()
+
+
+def load_image(path, alpha=True, angle=0):
+    """ Returns a shared, converted surface for the given image file. """
+    return registry.image(path, alpha, angle)
+
+
+def load_mask(path, threshold=127, angle=0):
+    """ Returns a shared collision mask for the given image file. """
+    return registry.mask(path, threshold, angle)
+
+
+def load_frames(directory, step=1):
+    """ Returns a shared, sorted tuple of animation frames from the given directory. """
+    return registry.frames(directory, step)
@@ -9,12 +9,55 @@ and runs the main game loop. """
 # Importing required modules
 # Pygame
 import pygame
+# Standard library
+import argparse
+import time
 # Game modules
 import ui_scenes
+import game_scene
+import game_input
+import game_random
+import recording
+
+
+# Simulation ticks per second. Every speed and timer in the game is counted in ticks, and is tuned for 60, so
+# this sets how fast the game plays rather than how finely it is simulated
+SIM_RATE = 60
+# If the game falls this many ticks behind in one frame it gives up catching up, and just runs slower
+MAX_TICKS_PER_FRAME = 5
+
+
+def display_refresh_rate():
+    """ The refresh rate of the main display, or SIM_RATE if Pygame can't tell. """
+    get_rates = getattr(pygame.display, 'get_desktop_refresh_rates', None)
+    if get_rates is not None:
+        rates = get_rates()
+        if len(rates) > 0 and rates[0] > 0:
+            return rates[0]
+    return SIM_RATE
+
+
+def main(sim_rate=SIM_RATE, frame_rate=None, seed=None, record_to=None, replay=None, draw=True):
+    """ Initiates Pygame and the main game loop. The game is simulated in fixed ticks, sim_rate a second,
+    however fast frames are drawn. Speeds, spawns and level lengths are all counted in ticks, so sim_rate is a
+    game speed control: 120 plays at double speed. Frames are drawn up to frame_rate times a second (by
+    default, the display's refresh rate), with sprites placed between their positions on the last two ticks.
+
+    seed seeds the session's random generator (a random seed by default). The session's input is saved to
+    record_to if it is given, and a recording passed as replay is played back instead of live input.
+    Without draw, nothing is drawn and there is no frame cap (E.g. to replay a session as fast as possible). """
+    # A replay runs exactly as the recorded session did
+    player = None
+    if replay is not None:
+        player = recording.Player(replay)
+        game_input.use(player)
+        seed = replay.seed
+        sim_rate = replay.sim_rate
+    seed = game_random.seed(seed)
+    recorder = None
+    if record_to is not None:
+        recorder = recording.Recorder(seed, sim_rate, game_input.source)
 
-
-def main():
-    """ Initiates Pygame and the main game loop. """
     # Initiate the Pygame modules
     pygame.init()
 
@@ -30,42 +73,119 @@ def main():
     # Set up the main game loop
     clock = pygame.time.Clock()
     active_scene = ui_scenes.OpeningScene()
+    if frame_rate is None:
+        frame_rate = display_refresh_rate()
+    tick_length = 1 / sim_rate
+    # Time that has passed but not been simulated yet. Starting with one tick's worth means every scene is
+    # updated before it is first drawn
+    lag = tick_length
+    last_time = time.perf_counter()
+
+    try:
+        # Main game loop
+        while active_scene is not None:
+            now = time.perf_counter()
+            frame_seconds = now - last_time
+            lag += frame_seconds
+            last_time = now
+
+            if player is not None:
+                frame = player.next_frame()
+                if frame is None:
+                    break
+                # The window can still be closed while a recording plays
+                events = player.events()
+                events.extend(event for event in pygame.event.get() if event.type == pygame.QUIT)
+            else:
+                events = pygame.event.get()
 
-    # Main game loop
-    while active_scene is not None:
-        filtered_events = []
-        # Game-wide events that should be handled the same, no-matter what the scene is
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                active_scene.next_scene = None
-            elif event.type == pygame.KEYDOWN:
-                if event.key == pygame.K_ESCAPE:
+            filtered_events = []
+            # Game-wide events that should be handled the same, no-matter what the scene is
+            for event in events:
+                if event.type == pygame.QUIT:
                     active_scene.next_scene = None
+                elif event.type == pygame.KEYDOWN:
+                    if event.key == pygame.K_ESCAPE:
+                        active_scene.next_scene = None
+                    else:
+                        filtered_events.append(event)
                 else:
                     filtered_events.append(event)
-            else:
-                filtered_events.append(event)
-
-        # Process events in the filtered event queue
-        active_scene.handle_events(filtered_events)
-
-        # Process updates and game logic. E.g. moving sprites
-        active_scene.update()
 
-        # Draw the frame
-        active_scene.draw(screen)
-
-        # Change the scene. By default, next_scene = self i.e the scene does not change
-        active_scene = active_scene.next_scene
-
-        # Update the screen
-        pygame.display.flip()
+            # Process events in the filtered event queue
+            active_scene.handle_events(filtered_events)
+
+            # Process updates and game logic. E.g. moving sprites. Run as many ticks as have passed (or as the
+            # recording ran), stopping early if the scene has finished
+            ticks = 0
+            if player is not None:
+                while ticks < frame.ticks:
+                    active_scene.update()
+                    ticks += 1
+                alpha = 1
+            else:
+                while lag >= tick_length:
+                    active_scene.update()
+                    lag -= tick_length
+                    ticks += 1
+                    if active_scene.next_scene is not active_scene:
+                        break
+                    if ticks == MAX_TICKS_PER_FRAME:
+                        lag = 0
+                        break
+                alpha = lag / tick_length
+
+            if recorder is not None:
+                recorder.record(filtered_events, ticks, frame_seconds)
+
+            if draw is True:
+                # Draw the frame, part of the way to the next tick
+                changed = active_scene.draw_frame(screen, alpha)
+
+                # Update the screen, or just the parts that changed
+                if changed is None:
+                    pygame.display.flip()
+                else:
+                    pygame.display.update(changed)
+
+            # Change the scene. By default, next_scene = self i.e the scene does not change. Time spent loading
+            # the new scene is not simulated
+            if active_scene.next_scene is not active_scene:
+                active_scene = active_scene.next_scene
+                lag = tick_length
+                last_time = time.perf_counter()
+
+            # Don't draw more frames than the display can show. Replays keep to the recorded frame times
+            if draw is False:
+                continue
+            elif player is not None:
+                clock.tick(1 / max(frame.seconds, 0.001))
+            else:
+                clock.tick(frame_rate)
+    finally:
+        # Saved even if the game crashed, so the crash can be replayed
+        if recorder is not None:
+            recorder.recording.save(record_to)
+
+
+def parse_arguments():
+    parser = argparse.ArgumentParser(description="Asteroid Attack - a scrolling space shooter.")
+    parser.add_argument("--frame-rate", type=int, help="most frames drawn per second")
+    parser.add_argument("--seed", type=int, help="seed for the session, to make it repeatable")
+    parser.add_argument("--record", metavar="PATH", help="save the session's input to PATH, to replay with "
+                                                         "recording.py")
+    parser.add_argument("--dirty-rendering", action="store_true",
+                        help="only redraw the parts of the screen that change during levels")
+    parser.add_argument("--render-stats", action="store_true",
+                        help="show how much of the screen is redrawn each frame during levels")
+    return parser.parse_args()
 
-        # Run the game at 60 fps
-        clock.tick(60)
 
 # Run the game if this file has not been imported
 if __name__ == "__main__":
-    main()
+    arguments = parse_arguments()
+    game_scene.GameScene.dirty_rendering = arguments.dirty_rendering
+    game_scene.GameScene.show_render_stats = arguments.render_stats
+    main(frame_rate=arguments.frame_rate, seed=arguments.seed, record_to=arguments.record)
 
 
@@ -0,0 +1,50 @@
+""" The endlessly scrolling background behind a level. Rather than moving two copies of the background image
+down the screen and drawing both (plus a fill behind them) every frame, the image is laid out once as a
+tall strip with enough of itself repeated at the bottom to wrap around, and each frame the visible window
+of the strip is copied to the screen in one blit. """
+
+# Pygame
+import pygame
+
+
+SCREEN = pygame.Rect(0, 0, 1024, 768)
+
+# Strips by the image they were built from. Levels share their background images through asset_registry,
+# so each strip is only built once
+strips = {}
+
+
+def strip(image, height=SCREEN.height):
+    """ Returns the image repeated downwards until it is a screen height (height) taller than itself, so any
+    screen height window of the scrolling background is a single area of the strip. """
+    surface = strips.get(image)
+    if surface is None:
+        image_height = image.get_height()
+        surface = pygame.Surface((image.get_width(), image_height + height), 0, image)
+        for y in range(0, image_height + height, image_height):
+            surface.blit(image, (0, y))
+        strips[image] = surface
+    return surface
+
+
+class ScrollingBackground:
+    """ A background image that scrolls down the screen and repeats. y is how far it has scrolled, from 0 to
+    the height of the image. At 0, the top of the image is a screen height above the top of the screen, as
+    levels have always started. """
+    def __init__(self, image):
+        self.image = image
+        self.height = image.get_height()
+        self.strip = strip(image)
+        self.y = 0
+
+    def scroll(self, pixels=1):
+        self.y = (self.y + pixels) % self.height
+
+    def draw(self, screen, rect=None):
+        """ Draws the visible part of the background, or just the part under rect if given. """
+        if rect is None:
+            rect = SCREEN
+        else:
+            rect = rect.clip(SCREEN)
+        top = (SCREEN.height - self.y) % self.height
+        screen.blit(self.strip, rect, rect.move(0, top))
@@ -0,0 +1,113 @@
+""" Runs many headless games at once, spread over a pool of worker processes (one per core by default), to
+answer questions such as how often level 8 is survived, or how tick time grows with the number of asteroids
+in training. Every combination of seed, scene and training choices is run, and results are written to a
+CSV file as each run finishes. E.g.
+
+    python batch.py --scenes level_8 boss_2 --seeds 1000 --out results.csv
+    python batch.py --scenes training --seeds 200 --training "[0, 10, 10, 0, 0, 10, 0, 0, 10, 1, 0, 10, 0, 3, 100]" \\
+        --training "[0, 40, 10, 0, 0, 10, 0, 0, 10, 1, 0, 10, 0, 3, 100]" """
+
+# Standard library
+import argparse
+import csv
+import itertools
+import json
+import multiprocessing
+import time
+# Game modules
+import headless
+
+
+# Columns of the results file
+FIELDS = ["scene", "training", "seed", "players", "frames", "score", "lives", "deaths", "ended", "seconds",
+          "p50_ms", "p90_ms", "p99_ms", "max_ms"]
+
+
+def make_jobs(scenes, seeds, training_choices=None, frames=5000, players=1):
+    """ Returns a job for every combination of scene, seed and (for training only) training choices. """
+    if not training_choices:
+        training_choices = [None]
+    jobs = []
+    for scene, seed in itertools.product(scenes, seeds):
+        if scene == "training":
+            for choices in training_choices:
+                jobs.append((scene, seed, frames, players, choices))
+        else:
+            jobs.append((scene, seed, frames, players, None))
+    return jobs
+
+
+def run_job(job):
+    """ Runs one game in a worker process, returning a row for the results file. """
+    scene, seed, frames, players, training_choices = job
+    result = headless.run(scene, seed, frames, players, training_choices)
+    if training_choices is None:
+        result["training"] = ""
+    else:
+        result["training"] = " ".join(str(choice) for choice in training_choices)
+    for field in ("seconds", "p50_ms", "p90_ms", "p99_ms", "max_ms"):
+        result[field] = round(result[field], 4)
+    return {field: result[field] for field in FIELDS}
+
+
+def run_batch(jobs, path, processes=None):
+    """ Runs jobs over a pool of processes (one per core if processes is None), writing each result to a
+    CSV file at path as soon as it comes back. Each worker starts Pygame and loads the assets once, and
+    is handed one job at a time so a long run can't hold up a queue of others. Returns a summary for each
+    scene and set of training choices. """
+    summary = {}
+    with multiprocessing.Pool(processes, initializer=headless.start) as pool, open(path, 'w', newline='') as f:
+        writer = csv.DictWriter(f, FIELDS)
+        writer.writeheader()
+        for row in pool.imap_unordered(run_job, jobs):
+            writer.writerow(row)
+            group = summary.setdefault((row["scene"], row["training"]), {"runs": 0, "survived": 0, "score": 0,
+                                                                         "frames": 0, "seconds": 0})
+            group["runs"] += 1
+            if row["lives"] > 0:
+                group["survived"] += 1
+            group["score"] += row["score"]
+            group["frames"] += row["frames"]
+            group["seconds"] += row["seconds"]
+        # Let the workers finish and exit, rather than being terminated when the pool is left
+        pool.close()
+        pool.join()
+    return summary
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run a batch of headless Asteroid Attack games in parallel.")
+    parser.add_argument("--scenes", nargs="+", default=["level_8"],
+                        help="campaign levels (E.g. level_3), boss_1, boss_2 or training")
+    parser.add_argument("--seeds", type=int, default=100, help="how many seeds to run each scene with")
+    parser.add_argument("--first-seed", type=int, default=0)
+    parser.add_argument("--training", action="append", type=json.loads,
+                        help="a list of 15 training choices, as TrainingSetupScene builds. Can be repeated")
+    parser.add_argument("--frames", type=int, default=5000, help="most ticks to simulate each run")
+    parser.add_argument("--players", type=int, choices=(1, 2), default=1)
+    parser.add_argument("--processes", type=int, help="worker processes (by default, one per core)")
+    parser.add_argument("--out", default="results.csv", help="where to write the results")
+    args = parser.parse_args()
+
+    for choices in args.training or []:
+        if len(choices) != 15:
+            parser.error("training choices need 15 values, not {0!s}".format(len(choices)))
+
+    seeds = range(args.first_seed, args.first_seed + args.seeds)
+    jobs = make_jobs(args.scenes, seeds, args.training, args.frames, args.players)
+    start_time = time.perf_counter()
+    summary = run_batch(jobs, args.out, args.processes)
+    seconds = time.perf_counter() - start_time
+
+    total_frames = sum(group["frames"] for group in summary.values())
+    print("{0!s} runs, {1!s} frames in {2:.1f}s ({3:.0f} frames per second). Results in {4!s}".format(
+        len(jobs), total_frames, seconds, total_frames / max(seconds, 1e-9), args.out))
+    for (scene, training), group in sorted(summary.items()):
+        print("{0!s} {1!s}: survived {2:.0%} of {3!s} runs, mean score {4:.1f}, {5:.0f} frames per second".format(
+            scene, training, group["survived"] / group["runs"], group["runs"], group["score"] / group["runs"],
+            group["frames"] / max(group["seconds"], 1e-9)))
+
+
+# Run if this file has not been imported
+if __name__ == "__main__":
+    main()
@@ -3,20 +3,24 @@
 # Pygame
 import pygame
 # Game modules
+import asset_registry
 import game_scene
 import ui_scenes
 import gameplay_items
 import ui_items
-import constants
+import text_cache
 
 
 class BossTwo(game_scene.GameScene):
     """ Class for a level with 1 boss. """
+    # The boss fires far more lasers than aliens do, and each hit on it is an explosion
+    pool_sizes = {"laser": 10, "alien_laser": 60, "explosion": 24, "fragment": 0}
+
     def __init__(self, settings, ship, ship_2, score, lives):
         self.settings = settings
         self.player = ship
         self.player_2 = ship_2
-        super().__init__(pygame.image.load('assets/black_stars.png').convert())
+        super().__init__(asset_registry.load_image('assets/black_stars.png', alpha=False))
         self.score = score
         self.lives = lives
 
@@ -25,6 +29,7 @@ class BossTwo(game_scene.GameScene):
 
         # Level unique UI items
         self.boss_health_bar = ui_items.HealthBar()
+        self.add_to_layer("hud", self.draw_hud)
         self.ending_timer = 0
 
     def handle_events(self, events):
@@ -45,17 +50,19 @@ class BossTwo(game_scene.GameScene):
 
         self.boss_health_bar.update()
 
-    def draw(self, screen):
-        super().draw(screen)
-        self.all_sprites.draw(screen)
-        self.collectible_stars.draw(screen)
+    def overlay_areas(self):
+        # The boss health bar, with the phase underneath
+        bar = self.boss_health_bar
+        return super().overlay_areas() + [pygame.Rect(bar.x, bar.y, bar.width, bar.height + 40)]
 
-        # Drawing UI text needs to be done after everything else so that it is on top
-        game_scene.GameScene.draw_text(self, screen, True)
+    def draw_hud(self, screen):
+        blits = self.draw_text(screen, True)
         # Level unique UI
         self.boss_health_bar.draw(screen)
-        phase_render = self.score_font.render("Phase: {0!s}".format(self.boss.display_phase), True, constants.WHITE)
+        phase_render = text_cache.render("Phase: {0!s}".format(self.boss.display_phase), self.score_text_size)
         phase_render_rect = phase_render.get_rect()
         x = (1024 / 2) - (phase_render_rect.width / 2)
         y = self.boss_health_bar.y + self.boss_health_bar.height + 10
         screen.blit(phase_render, (x, y))
+        # The health bar's two bars and number, and the phase
+        return blits + 4
@@ -0,0 +1,107 @@
+""" Packs the game's sprite images into a few large atlas pages plus a JSON index of where each image sits.
+Run this after adding or changing any image in assets/. When the atlas is present the asset registry
+hands out views into it, so startup reads a handful of files instead of one per sprite. Delete
+assets/atlas to go back to loading the loose files. """
+
+# Standard library
+import json
+import os
+# Pygame
+import pygame
+
+
+# Where to look for images, and where to write the atlas
+ASSET_DIRECTORY = 'assets'
+ATLAS_DIRECTORY = 'assets/atlas'
+ATLAS_INDEX = 'assets/atlas/atlas.json'
+
+# Size of each atlas page
+PAGE_SIZE = 2048
+# Images larger than this in either direction (backgrounds, banners) are left as loose files
+MAX_IMAGE_SIZE = 512
+# Transparent gap between packed images
+PADDING = 1
+
+
+def find_images(directory):
+    """ Returns the paths of every packable PNG below a directory, skipping the atlas itself. """
+    paths = []
+    for root, dirs, files in os.walk(directory):
+        dirs.sort()
+        if root.replace(os.sep, '/') == ATLAS_DIRECTORY:
+            continue
+        for name in sorted(files):
+            if name.endswith('.png'):
+                paths.append("{0}/{1}".format(root.replace(os.sep, '/'), name))
+    return paths
+
+
+def pack(sizes, page_size=PAGE_SIZE, padding=PADDING):
+    """ Shelf packer. Takes a dict of path: (width, height) and returns a dict of path: (page, x, y),
+    placing the tallest images first so each shelf wastes as little height as possible. """
+    placements = {}
+    page = 0
+    x = 0
+    y = 0
+    shelf_height = 0
+    for path in sorted(sizes, key=lambda item: (-sizes[item][1], -sizes[item][0], item)):
+        width, height = sizes[path]
+        # Start a new shelf if this image does not fit on the current one
+        if x + width > page_size:
+            x = 0
+            y += shelf_height + padding
+            shelf_height = 0
+        # Start a new page if the new shelf would run off the bottom
+        if y + height > page_size:
+            page += 1
+            x = 0
+            y = 0
+            shelf_height = 0
+        placements[path] = (page, x, y)
+        x += width + padding
+        shelf_height = max(shelf_height, height)
+    return placements
+
+
+def build(asset_directory=ASSET_DIRECTORY, atlas_directory=ATLAS_DIRECTORY, index_path=ATLAS_INDEX):
+    """ Builds the atlas pages and index. Returns the index that was written. """
+    images = {}
+    for path in find_images(asset_directory):
+        image = pygame.image.load(path)
+        width, height = image.get_size()
+        if width <= MAX_IMAGE_SIZE and height <= MAX_IMAGE_SIZE:
+            images[path] = image
+
+    placements = pack({path: image.get_size() for path, image in images.items()})
+    page_count = max(page for page, x, y in placements.values()) + 1
+
+    pages = [pygame.Surface((PAGE_SIZE, PAGE_SIZE), pygame.SRCALPHA) for i in range(page_count)]
+    sprites = {}
+    for path, (page, x, y) in placements.items():
+        pages[page].blit(images[path], (x, y))
+        width, height = images[path].get_size()
+        sprites[path] = [page, x, y, width, height]
+
+    os.makedirs(atlas_directory, exist_ok=True)
+    page_names = []
+    for number, page in enumerate(pages):
+        name = "atlas_{0!s}.png".format(number)
+        pygame.image.save(page, "{0}/{1}".format(atlas_directory, name))
+        page_names.append(name)
+
+    index = {"pages": page_names, "sprites": sprites}
+    with open(index_path, 'w') as f:
+        json.dump(index, f, indent=1, sort_keys=True)
+    return index
+
+
+def main():
+    """ Builds the atlas and reports how many files it replaces. """
+    index = build()
+    print("Packed {0!s} images into {1!s} atlas page(s) in {2}".format(len(index["sprites"]), len(index["pages"]),
+                                                                      ATLAS_DIRECTORY))
+
+
+# Build the atlas if this file has not been imported
+if __name__ == "__main__":
+    main()
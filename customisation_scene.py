@@ -9,6 +9,7 @@ import gameplay_items
 import ui_items
 import ui_scenes
 import test_level
+import game_input
 
 
 class CustomisationScene(generic_scene.GenericScene):
@@ -140,11 +141,11 @@ class CustomisationScene(generic_scene.GenericScene):
             # Testing
             elif event.type == pygame.KEYDOWN:
                 if event.key == pygame.K_t:
-                    self.next_scene = test_level.TestLevel(self.ship)
+                    self.next_scene = test_level.TestLevel(self.ship, self.settings)
 
     def update(self):
         for button in self.buttons:
-            button.mouse_on_button(pygame.mouse.get_pos())
+            button.mouse_on_button(game_input.mouse_pos())
 
         self.same_tooltip.update()
         if self.ships_same is True and self.start_button.mouse_over is True:
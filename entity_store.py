@@ -0,0 +1,278 @@
+""" Array-backed storage for the objects that fall down the screen (asteroids, powerups and collectible
+stars). Their positions, speeds, type ids and health live in NumPy arrays, and the whole lot is moved and
+wrapped back to the top of the screen with a single vectorised step each tick. They are drawn from the store
+too, by a StoreView for each layer they are drawn in, so a frame costs about the same however many are waiting
+above the screen. The sprite classes in gameplay_items are thin views onto a slot in the store. """
+
+# Pygame
+import pygame
+# NumPy
+import numpy
+# Game modules
+import game_random
+
+
+# Objects that fall past this are sent back above the top of the screen
+SCREEN_WIDTH = 1024
+SCREEN_HEIGHT = 768
+SCREEN = pygame.Rect(0, 0, SCREEN_WIDTH, SCREEN_HEIGHT)
+# Objects that moved further than this in one tick were sent somewhere new, so are not smoothed when drawn
+TELEPORT_DISTANCE = 100
+# Rect methods that change the rect they are called on
+IN_PLACE_METHODS = ("move_ip", "inflate_ip", "scale_by_ip", "update", "clamp_ip", "union_ip", "unionall_ip",
+                    "normalize", "__setitem__")
+
+
+class EntityStore:
+    """ Holds every falling object in a scene. Each object is given a slot index when it is added. Slots
+    freed by kill() are only reused after the next step(), so a sprite can still read its position in the
+    same tick it was destroyed (E.g. to place an explosion or fragments). """
+    def __init__(self, capacity=64):
+        self.x = numpy.zeros(capacity, numpy.int32)
+        self.y = numpy.zeros(capacity, numpy.int32)
+        # Positions before the last step, for drawing between ticks
+        self.previous_x = numpy.zeros(capacity, numpy.int32)
+        self.previous_y = numpy.zeros(capacity, numpy.int32)
+        self.width = numpy.zeros(capacity, numpy.int32)
+        self.height = numpy.zeros(capacity, numpy.int32)
+        self.speed = numpy.zeros(capacity, numpy.int32)
+        # Range of heights (above the screen) an object is sent back to once it falls off the bottom
+        self.respawn_min = numpy.zeros(capacity, numpy.int32)
+        self.respawn_max = numpy.ones(capacity, numpy.int32)
+        self.type_id = numpy.zeros(capacity, numpy.int32)
+        self.health = numpy.zeros(capacity, numpy.int32)
+        self.active = numpy.zeros(capacity, bool)
+        # What each object is drawn with, and the id of the layer it is drawn in. Images are looked up for every
+        # object on the screen at once, so they are kept in an object array
+        self.images = numpy.empty(capacity, object)
+        self.layer = numpy.zeros(capacity, numpy.int32)
+        self.sprites = [None] * capacity
+
+        # Slots below size have been used at least once
+        self.size = 0
+        self.free = []
+        self.released = []
+
+        # Type names (E.g. "BrownAsteroid") and layer names (E.g. "pickups"), and their ids
+        self.type_ids = {}
+        self.layer_ids = {}
+
+        # Seeded from the session's generator, so seeding that also makes respawn positions repeatable
+        self.rng = numpy.random.default_rng(game_random.getrandbits(64))
+
+    def __len__(self):
+        return int(numpy.count_nonzero(self.active[:self.size]))
+
+    def add(self, sprite, image, x, y, speed, respawn_min, respawn_max, health=1, layer=None):
+        """ Stores a new object, drawn with image by the StoreView of layer, and returns its slot index. """
+        if len(self.free) > 0:
+            index = self.free.pop()
+        else:
+            if self.size == len(self.x):
+                self.grow()
+            index = self.size
+            self.size += 1
+        self.x[index] = x
+        self.y[index] = y
+        self.previous_x[index] = x
+        self.previous_y[index] = y
+        self.set_image(index, image)
+        self.speed[index] = speed
+        self.respawn_min[index] = respawn_min
+        self.respawn_max[index] = respawn_max
+        self.type_id[index] = self.type_ids.setdefault(type(sprite).__name__, len(self.type_ids))
+        self.health[index] = health
+        self.layer[index] = self.layer_id(layer)
+        self.active[index] = True
+        self.sprites[index] = sprite
+        return index
+
+    def remove(self, sprite):
+        """ Stops an object moving. Its slot is handed back at the end of the next step(). """
+        index = sprite.store_index
+        if index is not None and self.sprites[index] is sprite and self.active[index]:
+            self.active[index] = False
+            self.released.append(index)
+
+    def layer_id(self, layer):
+        return self.layer_ids.setdefault(layer, len(self.layer_ids))
+
+    def grow(self):
+        """ Doubles the capacity of every array. """
+        capacity = len(self.x) * 2
+        for name in ("x", "y", "previous_x", "previous_y", "width", "height", "speed", "respawn_min",
+                     "respawn_max", "type_id", "health", "active", "images", "layer"):
+            old = getattr(self, name)
+            new = numpy.zeros(capacity, old.dtype)
+            new[:len(old)] = old
+            setattr(self, name, new)
+        self.respawn_max[self.size:] = 1
+        self.sprites.extend([None] * (capacity - len(self.sprites)))
+
+    def step(self):
+        """ Moves every active object down by its speed, and sends anything that has fallen off the bottom
+        of the screen back to a random position above the top. """
+        size = self.size
+        active = self.active[:size]
+        self.previous_x[:size] = self.x[:size]
+        self.previous_y[:size] = self.y[:size]
+        y = self.y[:size]
+        y += self.speed[:size] * active
+
+        wrapped = numpy.flatnonzero(active & (y > SCREEN_HEIGHT))
+        if len(wrapped) > 0:
+            self.y[wrapped] = self.rng.integers(self.respawn_min[wrapped], self.respawn_max[wrapped])
+            self.x[wrapped] = self.rng.integers(0, SCREEN_WIDTH, len(wrapped))
+
+        for index in self.released:
+            self.sprites[index] = None
+            self.images[index] = None
+            self.free.append(index)
+        self.released = []
+
+    def indexes_in(self, area, layer=None):
+        """ Slot indexes of every active object overlapping a rect (only those in a layer if one is given),
+        found with one vectorised test rather than by building a rect for each object. """
+        size = self.size
+        x = self.x[:size]
+        y = self.y[:size]
+        overlapping = (self.active[:size] & (x < area.right) & (x + self.width[:size] > area.left) &
+                       (y < area.bottom) & (y + self.height[:size] > area.top))
+        if layer is not None:
+            overlapping &= self.layer[:size] == self.layer_id(layer)
+        return numpy.flatnonzero(overlapping)
+
+    def sprites_in(self, area):
+        """ Returns the sprites of every active object overlapping a rect. """
+        return [self.sprites[index] for index in self.indexes_in(area).tolist()]
+
+    def rects_in(self, area):
+        """ Returns a (sprite, rect) pair for every active object overlapping a rect, with the rects built
+        from the arrays in one go rather than by reading each sprite's rect. """
+        indexes = self.indexes_in(area)
+        sprites = self.sprites
+        return [(sprites[index], pygame.Rect(x, y, width, height)) for index, x, y, width, height in
+                zip(indexes.tolist(), self.x[indexes].tolist(), self.y[indexes].tolist(),
+                    self.width[indexes].tolist(), self.height[indexes].tolist())]
+
+    def interpolate(self, alpha):
+        """ Moves every object alpha (0 to 1) of the way from where it was before the last step to where it is
+        now, for drawing a frame between ticks. Objects that jumped (E.g. wrapped back to the top) are left
+        where they are. Returns the real positions, to be put back with restore() once drawing is done. """
+        real = (self.x, self.y)
+        size = self.size
+        for name in ("x", "y"):
+            position = getattr(self, name)
+            previous = getattr(self, "previous_" + name)[:size]
+            moved = position[:size] - previous
+            smoothed = previous + numpy.rint(moved * alpha).astype(numpy.int32)
+            drawn = position.copy()
+            drawn[:size] = numpy.where(numpy.abs(moved) > TELEPORT_DISTANCE, position[:size], smoothed)
+            setattr(self, name, drawn)
+        return real
+
+    def restore(self, real):
+        self.x, self.y = real
+
+    def rect(self, index):
+        """ A StoreRect of where an object is, which moves it if changed in place. """
+        rect = StoreRect(int(self.x[index]), int(self.y[index]), int(self.width[index]), int(self.height[index]))
+        rect.attach(self, index)
+        return rect
+
+    def set_rect(self, index, rect):
+        self.x[index] = rect.x
+        self.y[index] = rect.y
+        self.width[index] = rect.width
+        self.height[index] = rect.height
+
+    def set_image(self, index, image):
+        """ Changes what an object is drawn with, and its size to match. """
+        self.images[index] = image
+        self.width[index], self.height[index] = image.get_size()
+
+    def set_pos(self, index, x, y):
+        self.x[index] = x
+        self.y[index] = y
+
+    def respawn(self, index):
+        """ Sends a single object back above the top of the screen, E.g. once it has been collected. """
+        self.y[index] = self.rng.integers(self.respawn_min[index], self.respawn_max[index])
+        self.x[index] = self.rng.integers(0, SCREEN_WIDTH)
+
+
+class StoreRect(pygame.Rect):
+    """ The rect of an object in an entity store. Changing it in place (E.g. rect.x += 5, rect.topleft = (0, 0)
+    or rect.move_ip(0, 5)) writes the change back to the store, for as long as the slot still belongs to the
+    object it was read from. Rects made from it (E.g. by move() or copy()) are ordinary detached rects. """
+    store = None
+    index = None
+    sprite = None
+
+    def attach(self, store, index):
+        # Set through __dict__, since setting attributes normally writes the rect back
+        self.__dict__.update(store=store, index=index, sprite=store.sprites[index])
+
+    def __setattr__(self, name, value):
+        super().__setattr__(name, value)
+        self.write_back()
+
+    def write_back(self):
+        store = self.store
+        if store is not None and store.sprites[self.index] is self.sprite:
+            store.set_rect(self.index, self)
+
+
+def write_back_after(method):
+    """ Wraps a Rect method that changes the rect in place, so a StoreRect writes the change back. """
+    def changed_in_place(self, *args, **kwargs):
+        result = method(self, *args, **kwargs)
+        self.write_back()
+        return result
+    changed_in_place.__name__ = method.__name__
+    changed_in_place.__doc__ = method.__doc__
+    return changed_in_place
+
+
+for method_name in IN_PLACE_METHODS:
+    # scale_by_ip only exists from Pygame 2.3
+    if hasattr(pygame.Rect, method_name):
+        setattr(StoreRect, method_name, write_back_after(getattr(pygame.Rect, method_name)))
+
+
+class StoreView:
+    """ The objects of one layer in an entity store, drawn like a starfield. The ones at least partly within
+    bounds are picked out with one vectorised test, and sent to the screen with one Surface.blits call in
+    slot order. """
+    def __init__(self, store, layer, bounds=SCREEN):
+        self.store = store
+        self.layer = layer
+        self.bounds = bounds
+
+    def visible(self):
+        return self.store.indexes_in(self.bounds, self.layer)
+
+    def rects(self):
+        """ The parts of bounds each visible object covers. """
+        store = self.store
+        bounds = self.bounds
+        visible = self.visible()
+        left = numpy.maximum(store.x[visible], bounds.left)
+        top = numpy.maximum(store.y[visible], bounds.top)
+        right = numpy.minimum(store.x[visible] + store.width[visible], bounds.right)
+        bottom = numpy.minimum(store.y[visible] + store.height[visible], bounds.bottom)
+        return [pygame.Rect(x, y, width, height) for x, y, width, height in
+                zip(left.tolist(), top.tolist(), (right - left).tolist(), (bottom - top).tolist())]
+
+    def blit_sequence(self):
+        """ An (image, position) pair for every visible object, for Surface.blits. """
+        store = self.store
+        visible = self.visible()
+        positions = zip(store.x[visible].tolist(), store.y[visible].tolist())
+        return list(zip(store.images[visible].tolist(), positions))
+
+    def draw(self, screen):
+        """ Draws every visible object, returning how many that was. """
+        sequence = self.blit_sequence()
+        screen.blits(sequence, False)
+        return len(sequence)
@@ -0,0 +1,242 @@
+""" A Gym-style environment around the game, for training and evaluating automated players against the
+real game logic. An action holds down one of the WASD keys (or none) and optionally fires, exactly as a
+player would through GameScene.handle_events. VectorEnv steps several games at once in worker processes
+and returns their observations as one NumPy array. Nothing is drawn unless asked for. E.g.
+
+    with VectorEnv(8, "level_8") as env:
+        observations = env.reset(seed=0)
+        observations, rewards, dones, infos = env.step([random.randrange(ACTION_COUNT) for i in range(8)]) """
+
+# Pygame
+import pygame
+# Standard library
+import atexit
+import multiprocessing
+# NumPy
+import numpy
+# Game modules
+import headless
+import game_input
+import game_random
+import gameplay_items
+
+
+# Each action is the movement key held down (None for no movement) and whether to fire a laser
+MOVES = [None, pygame.K_w, pygame.K_s, pygame.K_a, pygame.K_d]
+ACTIONS = [(key, fire) for fire in (False, True) for key in MOVES]
+ACTION_COUNT = len(ACTIONS)
+
+# The nearest objects to the ship that are included in an observation, and how each kind is labelled
+OBSERVED_OBJECTS = 16
+KINDS = {"asteroid": 1, "alien": 2, "alien_laser": 3, "powerup": 4, "star": 5}
+# Ship x, y, health, laser charges, shield and lives, then x, y and kind for each object
+OBSERVATION_SIZE = 6 + OBSERVED_OBJECTS * 3
+
+SCREEN = pygame.Rect(0, 0, 1024, 768)
+
+
+class AsteroidAttackEnv:
+    """ A single player game of one scene (see headless.build_scene), stepped an action at a time. Each step
+    holds the action for frame_skip ticks. The reward is the score gained, less the fraction of health lost
+    and 1 for every life lost. The game is done when the scene ends (E.g. game over) or after max_frames
+    ticks.
+
+    The game's random generator and input (game_random and game_input) are shared by the whole process, so
+    only one environment should be stepped per process. VectorEnv gives each its own. """
+    def __init__(self, scene="level_1", max_frames=5000, frame_skip=1, render=False):
+        self.scene_name = scene
+        self.max_frames = max_frames
+        self.frame_skip = frame_skip
+        self.render_enabled = render
+        self.screen = None
+
+        self.scene = None
+        self.seed = None
+        self.key = None
+        self.frames = 0
+        self.observation = None
+        self.reward = 0
+        self.done = True
+
+    # The environment is the game's input source, with no mouse or controller
+    def mouse_pos(self):
+        return 0, 0
+
+    def joystick_count(self):
+        return 0
+
+    def joystick_axis(self, axis):
+        return 0
+
+    def reset(self, seed=None):
+        """ Starts a new game, returning the first observation. """
+        if self.screen is None:
+            self.screen = pygame.display.get_surface()
+            if self.screen is None:
+                self.screen = headless.start(self.render_enabled)
+        self.seed = game_random.seed(seed)
+        game_input.use(self)
+        self.scene = headless.build_scene(self.scene_name, dict(headless.SETTINGS), gameplay_items.PlayerShip(),
+                                          None)
+        self.key = None
+        self.frames = 0
+        self.reward = 0
+        self.done = False
+        self.observation = self.observe()
+        return self.observation
+
+    def step(self, action):
+        """ Plays an action (an index into ACTIONS), returning (observation, reward, done, info). """
+        key, fire = ACTIONS[action]
+        events = []
+        if key != self.key:
+            if self.key is not None:
+                events.append(pygame.event.Event(pygame.KEYUP, key=self.key))
+            if key is not None:
+                events.append(pygame.event.Event(pygame.KEYDOWN, key=key))
+            self.key = key
+        if fire is True:
+            events.append(pygame.event.Event(pygame.KEYDOWN, key=pygame.K_SPACE))
+
+        scene = self.scene
+        score = scene.score
+        health = scene.player.health
+        lives = scene.lives
+        scene.handle_events(events)
+        for i in range(self.frame_skip):
+            scene.update()
+            self.frames += 1
+            if scene.next_scene is not scene or self.frames >= self.max_frames:
+                self.done = True
+                break
+
+        self.reward = (scene.score - score) + min(scene.player.health - health, 0) / 100 - (lives - scene.lives)
+        self.observation = self.observe()
+        return self.observation, self.reward, self.done, self.info()
+
+    def info(self):
+        ended = None
+        if self.scene.next_scene is not self.scene:
+            ended = type(self.scene.next_scene).__name__
+        return {"score": self.scene.score, "lives": self.scene.lives, "frames": self.frames, "seed": self.seed,
+                "ended": ended}
+
+    def observe(self):
+        """ The ship's state, then the position (relative to the ship, and scaled to the screen) and kind of
+        the nearest objects on screen, as a float32 array. Unused object slots are zero. """
+        scene = self.scene
+        player = scene.player
+        observation = numpy.zeros(OBSERVATION_SIZE, numpy.float32)
+        observation[:6] = (player.rect.centerx / SCREEN.width, player.rect.centery / SCREEN.height,
+                           player.health / 100, player.lasers / 5, player.shield is not None, scene.lives / 3)
+
+        objects = []
+        for sprite in scene.falling_objects.sprites_in(SCREEN):
+            if isinstance(sprite, gameplay_items.PowerUp):
+                objects.append((sprite.rect, KINDS["powerup"]))
+            elif isinstance(sprite, gameplay_items.CollectStar):
+                objects.append((sprite.rect, KINDS["star"]))
+            else:
+                objects.append((sprite.rect, KINDS["asteroid"]))
+        # Aliens wait above the screen until it is their turn
+        objects.extend((sprite.rect, KINDS["alien"]) for sprite in scene.aliens if SCREEN.colliderect(sprite.rect))
+        objects.extend((sprite.rect, KINDS["alien_laser"]) for sprite in scene.projectiles.enemy_lasers)
+        if len(objects) == 0:
+            return observation
+
+        found = numpy.array([(rect.centerx - player.rect.centerx, rect.centery - player.rect.centery, kind)
+                             for rect, kind in objects], numpy.float32)
+        nearest = numpy.argsort(found[:, 0] ** 2 + found[:, 1] ** 2)[:OBSERVED_OBJECTS]
+        found = found[nearest]
+        found[:, 0] /= SCREEN.width
+        found[:, 1] /= SCREEN.height
+        found[:, 2] /= len(KINDS)
+        observation[6:6 + found.size] = found.ravel()
+        return observation
+
+    def render(self):
+        """ Draws the game as it is now. Needs render=True for the window to be seen. """
+        self.scene.draw_frame(self.screen, 1)
+        pygame.display.flip()
+        pygame.event.pump()
+
+
+def worker(connection, scene, max_frames, frame_skip, seed_stride):
+    """ Runs one environment in a worker process, taking commands from VectorEnv. A finished game is
+    started again straight away with the next of its seeds, and its last observation is put in the info. """
+    env = AsteroidAttackEnv(scene, max_frames, frame_skip)
+    while True:
+        try:
+            command, argument = connection.recv()
+        except EOFError:
+            # VectorEnv has gone without closing the worker
+            break
+        if command == "step":
+            observation, reward, done, info = env.step(argument)
+            if done is True:
+                info["final_observation"] = observation
+                observation = env.reset(env.seed + seed_stride)
+            connection.send((observation, reward, done, info))
+        elif command == "reset":
+            connection.send(env.reset(argument))
+        elif command == "close":
+            connection.close()
+            break
+
+
+class VectorEnv:
+    """ count environments, each in its own process, stepped together. Observations come back as a
+    (count, OBSERVATION_SIZE) array, and rewards and dones as arrays of count. Environment i is seeded with
+    seed + i, and each time its game ends it moves on by count, so no two games share a seed.
+
+    The workers are stopped by close(), on leaving a with block, or at the latest when Python exits. """
+    def __init__(self, count, scene="level_1", max_frames=5000, frame_skip=1):
+        self.count = count
+        self.connections = []
+        self.processes = []
+        self.closed = False
+        atexit.register(self.close)
+        for i in range(count):
+            connection, worker_connection = multiprocessing.Pipe()
+            process = multiprocessing.Process(target=worker,
+                                              args=(worker_connection, scene, max_frames, frame_skip, count),
+                                              daemon=True)
+            process.start()
+            worker_connection.close()
+            self.connections.append(connection)
+            self.processes.append(process)
+
+    def reset(self, seed=0):
+        for i, connection in enumerate(self.connections):
+            connection.send(("reset", seed + i))
+        return numpy.stack([connection.recv() for connection in self.connections])
+
+    def step(self, actions):
+        """ Plays one action in each environment. Returns (observations, rewards, dones, infos). """
+        for connection, action in zip(self.connections, actions):
+            connection.send(("step", action))
+        results = [connection.recv() for connection in self.connections]
+        observations, rewards, dones, infos = zip(*results)
+        return (numpy.stack(observations), numpy.array(rewards, numpy.float32), numpy.array(dones, bool),
+                list(infos))
+
+    def close(self):
+        if self.closed is True:
+            return
+        self.closed = True
+        atexit.unregister(self.close)
+        for connection in self.connections:
+            try:
+                connection.send(("close", None))
+            except OSError:
+                # The worker has already gone
+                pass
+            connection.close()
+        for process in self.processes:
+            process.join()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
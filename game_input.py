@@ -0,0 +1,51 @@
+""" Where the game reads the state of the mouse and controller from. Scenes ask this module rather than
+Pygame, so the live input can be swapped for a recording being replayed (see recording.py) or a script
+(see headless.py), and the game can't tell the difference. Events still come through the main loop. """
+
+# Pygame
+import pygame
+
+
+class LiveInput:
+    """ Reads the mouse and the first controller through Pygame. The controller is opened the first time it
+    is looked for, as Pygame only sends its button events once it is open. """
+    def __init__(self):
+        self.joystick = None
+
+    def mouse_pos(self):
+        return pygame.mouse.get_pos()
+
+    def joystick_count(self):
+        count = pygame.joystick.get_count()
+        if count >= 1 and self.joystick is None:
+            self.joystick = pygame.joystick.Joystick(0)
+            self.joystick.init()
+        return count
+
+    def joystick_axis(self, axis):
+        if self.joystick is None and self.joystick_count() == 0:
+            return 0
+        return self.joystick.get_axis(axis)
+
+
+# The input the game is currently reading
+source = LiveInput()
+
+
+def use(new_source):
+    """ Makes the game read from new_source. It needs mouse_pos, joystick_count and joystick_axis methods. """
+    global source
+    source = new_source
+
+
+def mouse_pos():
+    return source.mouse_pos()
+
+
+def joystick_count():
+    return source.joystick_count()
+
+
+def joystick_axis(axis):
+    """ The position (-1 to 1) of an axis of the first controller, or 0 if there isn't one. """
+    return source.joystick_axis(axis)
@@ -0,0 +1,31 @@
+""" The random number generator for everything that happens in a game session. Gameplay code draws from
+this rather than the random module, so seeding it once at the start of a session makes the whole session
+repeatable (E.g. when it is replayed), and nothing else that uses random can throw it off. """
+
+# Standard library
+import random
+
+
+# The session's generator, and the seed it was last given
+session = random.Random()
+session_seed = None
+
+
+def seed(value=None):
+    """ Seeds the session generator, with a new random seed if value is None. Returns the seed used, so it
+    can be recorded. """
+    global session_seed
+    if value is None:
+        value = random.getrandbits(64)
+    session.seed(value)
+    session_seed = value
+    return value
+
+
+def randrange(*args):
+    return session.randrange(*args)
+
+
+def getrandbits(k):
+    """ Used to seed generators of other kinds (E.g. NumPy's) from the session. """
+    return session.getrandbits(k)
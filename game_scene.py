@@ -1,20 +1,63 @@
 """ A baseplate game scene, which game levels inherit from. """
 
-# Standard library
-import os
 # Pygame
 import pygame
+# NumPy
+import numpy
 # Game modules
 import generic_scene
 import gameplay_items
 import constants
 import scene_tools
 import ui_scenes
+import sound_bank
+import asset_registry
+import spatial_hash
+import entity_store
+import object_pool
+import projectiles
+import scheduler
+import game_input
+import hud
+import text_cache
+import background
+import starfield
+import sprite_batch
+
+
+SCREEN = pygame.Rect(0, 0, 1024, 768)
+RENDER_STATS_AREA = pygame.Rect(784, 740, 240, 28)
+
+
+def between(previous, current, alpha):
+    """ A position alpha (0 to 1) of the way from previous to current, or current if it jumped there. """
+    if abs(current - previous) > entity_store.TELEPORT_DISTANCE:
+        return current
+    return previous + round((current - previous) * alpha)
 
 
 class GameScene(generic_scene.GenericScene):
     """ A starter class for a game level. Includes a scrolling background image, upper and lower
     scrolling stars, a player ship, powerups, scores etc. """
+    # How many of each pooled sprite to make when the level starts. Levels with more going on override this
+    pool_sizes = {"laser": 10, "alien_laser": 20, "explosion": 12, "fragment": 4}
+
+    # Only repaint (and send to the display) the parts of the screen that changed, rather than whole frames.
+    # Also turned on by a 'dirty_rendering' setting
+    dirty_rendering = False
+    # Show what fraction of the screen was sent to the display each frame
+    show_render_stats = False
+    # With dirty rendering the background is drawn in steps of this many pixels. Each step changes the whole
+    # screen, but between steps only the sprites and text need repainting
+    background_step = 8
+    # What a frame is made of, drawn bottom to top. Scenes add what they draw with add_to_layer
+    layer_names = ("background", "back_stars", "enemies", "projectiles", "player", "pickups", "front_stars", "hud")
+    # How many stars are in each layer. Drawing costs little more with thousands
+    star_counts = {"bottom": 30, "top": 20}
+    # Send the sprites and stars of neighbouring layers to the screen together, skipping any off the screen (see
+    # sprite_batch). Can be turned off to compare against drawing group by group
+    batch_rendering = True
+
     def __init__(self, background_image):
         super().__init__()
         self.player.game_scene = self
@@ -23,33 +66,36 @@ class GameScene(generic_scene.GenericScene):
         pygame.mouse.set_visible(False)
 
         # Text and scores
-        self.score_font = pygame.font.Font(None, 25)
+        self.score_text_size = 25
+        self.status_hud = hud.Hud(self.score_text_size)
+        self.ship_hud = hud.Hud(self.score_text_size)
         self.timer = 0
 
-        # Preloading explosion GFX
-        self.images = []
-        mypath = os.path.join(os.path.dirname(__file__), 'assets', 'explosion')
-        for file in os.listdir(mypath):
-            myfile = "assets/explosion/{0}".format(file)
-            self.images.append(pygame.image.load(myfile).convert_alpha())
+        # Timed events (spawns, the end of the level etc). Levels register theirs after calling this
+        self.scheduler = scheduler.Scheduler()
+        # Level ending beeps
+        for tick in (4700, 4760, 4820, 4880, 4940):
+            self.scheduler.at(tick, sound_bank.play, "ending_beep")
+
+        # Explosion GFX, shared by every level. Low-end machines can use a decimated set of frames, with each
+        # frame held for longer so explosions last just as long
+        self.explosion_frame_step = self.settings.get('explosion_frame_step', 1)
+        self.images = asset_registry.load_frames('assets/explosion', self.explosion_frame_step)
+
+        # Dirty rendering. What was drawn last frame has to be painted over this frame
+        self.dirty_rendering = self.settings.get('dirty_rendering', self.dirty_rendering)
+        self.repaint_background = True
+        self.drawn_background_y = None
+        self.drawn_rects = []
+        self.updated_pixels = numpy.zeros((SCREEN.height, SCREEN.width), bool)
+        self.render_stats = {"frames": 0, "updated": 0.0, "total_updated": 0.0}
 
         # Endlessly scrolling stars background
-        self.background = background_image
-        self.background_y = -768
-        self.background_2 = background_image
-        self.background_2_y = -2304
-
-        # Create two lists of star objects. One will be drawn before the ship and the other after
-        # to give an illusion of depth
-        self.bottom_stars = []
-        for i in range(30):
-            star = gameplay_items.Star()
-            self.bottom_stars.append(star)
-
-        self.top_stars = []
-        for i in range(20):
-            star = gameplay_items.Star()
-            self.top_stars.append(star)
+        self.background = background.ScrollingBackground(background_image)
+
+        # Two layers of stars. One will be drawn before the ship and the other after to give an illusion of depth
+        self.bottom_stars = starfield.Starfield(self.star_counts["bottom"])
+        self.top_stars = starfield.Starfield(self.star_counts["top"])
 
         # Create a container to hold all *sprites*. Images, drawings etc will not be in here
         self.all_sprites = pygame.sprite.Group()
@@ -57,6 +103,25 @@ class GameScene(generic_scene.GenericScene):
         self.asteroids = pygame.sprite.Group()
         self.aliens = pygame.sprite.Group()
 
+        # Positions of asteroids, powerups and collectible stars. Moved all at once each tick, and drawn straight
+        # from the store rather than from sprite groups
+        self.falling_objects = entity_store.EntityStore()
+
+        # Lasers, explosions and asteroid fragments are reused rather than made fresh each time
+        self.laser_pool = object_pool.ObjectPool(lambda: gameplay_items.Laser(self), self.pool_sizes["laser"])
+        self.alien_laser_pool = object_pool.ObjectPool(lambda: gameplay_items.AlienLaser(self),
+                                                       self.pool_sizes["alien_laser"])
+        self.explosion_pool = object_pool.ObjectPool(lambda: gameplay_items.Explosion(self.images, self),
+                                                     self.pool_sizes["explosion"])
+        self.fragment_pool = object_pool.ObjectPool(lambda: gameplay_items.FragmentedAsteroid(self),
+                                                    self.pool_sizes["fragment"])
+
+        # Every laser in flight, whoever fired it. Lasers are killed as soon as they leave the screen
+        self.projectiles = projectiles.ProjectileManager()
+
+        # Collision broadphase. Rebuilt every tick so sprites only mask test against nearby sprites
+        self.collision_grid = spatial_hash.SpatialHash()
+
         # Create a player ship object, and place near the bottom of the screen
         self.player.update_pos(50, 600)
         self.all_sprites.add(self.player)
@@ -67,42 +132,52 @@ class GameScene(generic_scene.GenericScene):
         # Spawn powerups
         self.pups = pygame.sprite.Group()
         # Create a speed powerup
-        self.powerup = gameplay_items.PowerUp("speed")
-        self.all_sprites.add(self.powerup)
+        self.powerup = gameplay_items.PowerUp("speed", self.falling_objects)
         self.pups.add(self.powerup)
         # Create a laser ammo powerup
-        self.powerup = gameplay_items.PowerUp("laser")
-        self.all_sprites.add(self.powerup)
+        self.powerup = gameplay_items.PowerUp("laser", self.falling_objects)
         self.pups.add(self.powerup)
         # Create a health powerup
-        self.powerup = gameplay_items.PowerUp("health")
-        self.all_sprites.add(self.powerup)
+        self.powerup = gameplay_items.PowerUp("health", self.falling_objects)
         self.pups.add(self.powerup)
         # Create a shield powerup
-        self.powerup = gameplay_items.PowerUp("shield")
-        self.all_sprites.add(self.powerup)
+        self.powerup = gameplay_items.PowerUp("shield", self.falling_objects)
         self.pups.add(self.powerup)
 
-        # Spawn stars. These are not added to all_sprites so they can be rendered on top.
+        # Spawn stars. These are drawn in the pickups layer, so they are rendered on top of the ships.
         self.collectible_stars = pygame.sprite.Group()
         for i in range(2):
-            star = gameplay_items.CollectStar("gold")
+            star = gameplay_items.CollectStar("gold", self.falling_objects)
             self.collectible_stars.add(star)
         for i in range(5):
-            star = gameplay_items.CollectStar("silver")
+            star = gameplay_items.CollectStar("silver", self.falling_objects)
             self.collectible_stars.add(star)
         for i in range(11):
-            star = gameplay_items.CollectStar("bronze")
+            star = gameplay_items.CollectStar("bronze", self.falling_objects)
             self.collectible_stars.add(star)
 
-        # Level ending beep
-        self.ending_beep = pygame.mixer.Sound('music/zap.ogg')
-
         # Player 2 handling
-        self.joystick_count = pygame.joystick.get_count()
-        if self.joystick_count >= 1:
-            self.my_joystick = pygame.joystick.Joystick(0)
-            self.my_joystick.init()
+        self.joystick_count = game_input.joystick_count()
+
+        # Everything is drawn once a frame, by layer. Ships share the player layer with the rest of all_sprites
+        # (shields and explosions), drawn over the asteroids and powerups. Levels add their HUD
+        self.falling_object_views = [entity_store.StoreView(self.falling_objects, "player"),
+                                     entity_store.StoreView(self.falling_objects, "pickups")]
+        self.layers = {name: [] for name in self.layer_names}
+        self.layer_stats = {name: {"draw_calls": 0, "blits": 0} for name in self.layer_names}
+        self.sprite_batch = sprite_batch.SpriteBatch(SCREEN)
+        self.add_to_layer("background", self.draw_background_layer)
+        self.add_to_layer("back_stars", self.bottom_stars)
+        self.add_to_layer("enemies", self.aliens)
+        self.add_to_layer("projectiles", self.projectiles.enemy_lasers)
+        for player in self.players():
+            self.add_to_layer("projectiles", player.lasers_group)
+        self.add_to_layer("player", self.falling_object_views[0])
+        self.add_to_layer("player", self.all_sprites)
+        self.add_to_layer("pickups", self.falling_object_views[1])
+        self.add_to_layer("front_stars", self.top_stars)
+
+        self.remember_positions()
 
     def handle_events(self, events):
         for event in events:
@@ -136,8 +211,8 @@ class GameScene(generic_scene.GenericScene):
         # Player 2 movement handling
         if self.player_2 is not None:
             # Movement
-            horiz_axis_pos = self.my_joystick.get_axis(0)
-            vert_axis_pos = self.my_joystick.get_axis(1)
+            horiz_axis_pos = game_input.joystick_axis(0)
+            vert_axis_pos = game_input.joystick_axis(1)
             if vert_axis_pos < -0.5:
                 self.player_2.y_speed = -self.player_2.speed
             elif vert_axis_pos > 0.5:
@@ -153,102 +228,306 @@ class GameScene(generic_scene.GenericScene):
                 self.player_2.x_speed = 0
 
     def update(self):
+        self.remember_positions()
         self.timer += 1
         if self.timer % 300 == 0:
             self.score += 1
 
         # Background scrolling
-        self.background_y += 1
-        self.background_2_y += 1
-        if self.background_y >= 768:
-            self.background_y = self.background_2_y - 1536
-        if self.background_2_y >= 768:
-            self.background_2_y = self.background_y - 1536
+        self.background.scroll()
 
-        for star in self.bottom_stars:
-            star.update_pos()
-
-        for star in self.top_stars:
-            star.update_pos()
-
-        # Level ending beeps
-        if self.timer == 4700 or self.timer == 4760 or self.timer == 4820 or self.timer == 4880 or self.timer == 4940:
-            self.ending_beep.play()
+        self.bottom_stars.step()
+        self.top_stars.step()
 
+        # Move everything, then deal with whatever has ended up touching
+        self.falling_objects.step()
         self.all_sprites.update()
-        self.collectible_stars.update()
         self.aliens.update(self.timer)
+        self.projectiles.update()
+        self.resolve_collisions()
+
+        # Anything due this tick. Spawns happen last, so new sprites start moving next tick
+        self.scheduler.run(self.timer)
+
+    def remember_positions(self):
+        """ Notes where everything that moves is before a tick, so frames can be drawn between ticks. Falling
+        objects and stars are remembered by the entity store and starfields themselves. """
+        moving = self.players()
+        moving.extend(player.shield for player in self.players() if player.shield is not None)
+        moving.extend(self.aliens)
+        moving.extend(self.projectiles.projectiles)
+        self.previous_positions = [(sprite.rect, sprite.rect.x, sprite.rect.y) for sprite in moving]
+        self.previous_background_y = self.background.y
+
+    def draw_frame(self, screen, alpha):
+        """ Draws the scene with everything that moves alpha of the way between where it was on the last tick
+        and where it is now, then puts it all back. Returns the parts of the screen that changed, or None if
+        all of it did. """
+        real_positions = []
+        for rect, x, y in self.previous_positions:
+            real_positions.append((rect, rect.x, rect.y))
+            rect.x = between(x, rect.x, alpha)
+            rect.y = between(y, rect.y, alpha)
+        real_falling_objects = self.falling_objects.interpolate(alpha)
+        real_background_y = self.background.y
+        self.background.y = between(self.previous_background_y, self.background.y, alpha)
+        real_bottom_star_y = self.bottom_stars.interpolate(alpha)
+        real_top_star_y = self.top_stars.interpolate(alpha)
+
+        changed = self.render(screen)
+
+        for rect, x, y in real_positions:
+            rect.x = x
+            rect.y = y
+        self.falling_objects.restore(real_falling_objects)
+        self.background.y = real_background_y
+        self.bottom_stars.restore(real_bottom_star_y)
+        self.top_stars.restore(real_top_star_y)
+        return changed
+
+    def render(self, screen):
+        """ Draws the frame. With dirty rendering, only the parts of the screen that were drawn on last frame or
+        are drawn on this frame (sprites, stars and overlays) are painted over with the background and redrawn,
+        unless the background has moved. Returns the changed parts of the screen, or None if all of it did. """
+        if self.dirty_rendering is False:
+            self.draw(screen)
+            self.record_render_stats(None)
+            self.draw_render_stats(screen)
+            return None
+
+        self.background.y -= self.background.y % self.background_step
+        background_y = self.background.y
+        sprite_rects = self.sprite_rects()
+        if background_y != self.drawn_background_y:
+            changed = None
+        else:
+            changed = sprite_rects + self.drawn_rects
+            for rect in changed:
+                self.draw_background(screen, rect)
+            self.repaint_background = False
+        self.record_render_stats(changed)
+        self.draw(screen)
+        self.draw_render_stats(screen)
+        self.repaint_background = True
+        self.drawn_background_y = background_y
+        # Overlays (E.g. the HUD) are only known once drawn. They are painted over before they are drawn next
+        # frame, so if one changes size, wherever it was before is also updated
+        overlays = self.overlay_areas()
+        if changed is not None:
+            changed.extend(overlays)
+        self.drawn_rects = sprite_rects + overlays
+        return changed
+
+    def sprite_rects(self):
+        """ The on screen parts of everything drawn at a different place each frame. """
+        rects = []
+        groups = [self.all_sprites, self.aliens, self.projectiles.enemy_lasers]
+        groups.extend(player.lasers_group for player in self.players())
+        for group in groups:
+            for sprite in group:
+                rect = sprite.rect.clip(SCREEN)
+                if rect.width > 0 and rect.height > 0:
+                    rects.append(rect)
+        for view in self.falling_object_views:
+            rects.extend(view.rects())
+        rects.extend(self.bottom_stars.rects())
+        rects.extend(self.top_stars.rects())
+        return rects
+
+    def overlay_areas(self):
+        """ Parts of the screen that are drawn on every frame other than by sprites, E.g. text. Scenes that draw
+        more add theirs. """
+        areas = [hud_panel.rect for hud_panel in (self.status_hud, self.ship_hud) if hud_panel.rect is not None]
+        if self.show_render_stats is True:
+            areas.append(RENDER_STATS_AREA)
+        return areas
+
+    def draw_background(self, screen, rect=None):
+        """ Draws the scrolling background, over just rect if given. """
+        self.background.draw(screen, rect)
+
+    def record_render_stats(self, changed):
+        """ Works out what fraction of the screen changed. """
+        if changed is None:
+            updated = 1.0
+        else:
+            updated_pixels = self.updated_pixels
+            updated_pixels[:] = False
+            for rect in changed:
+                rect = rect.clip(SCREEN)
+                updated_pixels[rect.top:rect.bottom, rect.left:rect.right] = True
+            updated = numpy.count_nonzero(updated_pixels) / updated_pixels.size
+        stats = self.render_stats
+        stats["frames"] += 1
+        stats["updated"] = updated
+        stats["total_updated"] += updated
+
+    def draw_render_stats(self, screen):
+        if self.show_render_stats is True:
+            stats = self.render_stats
+            text = "Screen updated: {0:.1%} (mean {1:.1%})".format(stats["updated"],
+                                                                 stats["total_updated"] / stats["frames"])
+            screen.blit(text_cache.render(text, 22, constants.WHITE),
+                        (RENDER_STATS_AREA.x + 5, RENDER_STATS_AREA.y + 5))
+
+    def explode(self, x, y):
+        """ Starts an explosion animation with its top left corner at x, y. """
+        self.all_sprites.add(self.explosion_pool.acquire(x, y))
+
+    def pool_stats(self):
+        """ Returns the statistics of each sprite pool, for sizing pool_sizes. """
+        return {"laser": self.laser_pool.stats(), "alien_laser": self.alien_laser_pool.stats(),
+                "explosion": self.explosion_pool.stats(), "fragment": self.fragment_pool.stats()}
+
+    def players(self):
+        if self.player_2 is None:
+            return [self.player]
+        return [self.player, self.player_2]
+
+    def resolve_collisions(self):
+        """ The collision phase, run once per tick after all movement. Candidate pairs for every layer are
+        gathered from the broadphase in one batch, then hits are applied in a fixed order: player lasers on
+        enemies, enemies (and friendly fire) on players, pickups, then deaths. Pairs whose sprite has been
+        destroyed by an earlier hit in the same tick are skipped. """
+        self.rebuild_collision_grid()
+        grid = self.collision_grid
+        players = self.players()
+
+        laser_pairs = []
+        enemy_pairs = []
+        powerup_pairs = []
+        star_pairs = []
+        for player in players:
+            for laser in player.lasers_group:
+                for enemy in grid.query(laser.rect, "asteroids") + grid.query(laser.rect, "aliens"):
+                    laser_pairs.append((laser, enemy))
+
+            # The shield, if there is one, covers the ship
+            hit_rect = player.collision_rect()
+            for layer in ("asteroids", "aliens", "alien_lasers"):
+                for enemy in grid.query(hit_rect, layer):
+                    enemy_pairs.append((player, enemy))
+            for other_player in players:
+                if other_player is not player:
+                    for laser in other_player.lasers_group:
+                        if hit_rect.colliderect(laser.rect):
+                            enemy_pairs.append((player, laser))
+
+            for pup in grid.query(player.rect, "pups"):
+                powerup_pairs.append((player, pup))
+            for star in grid.query(player.rect, "collectible_stars"):
+                star_pairs.append((player, star))
+
+        for laser, enemy in laser_pairs:
+            if laser.alive() and enemy.alive():
+                laser.hit(enemy)
+        for player, enemy in enemy_pairs:
+            if enemy.alive():
+                player.hit_by(enemy)
+        # Pickups move away once collected, so the second player to reach one in a tick misses it
+        for player, pup in powerup_pairs:
+            player.collect_powerup(pup)
+        for player, star in star_pairs:
+            player.collect_star(star)
+        for player in players:
+            player.check_death()
+
+    def rebuild_collision_grid(self):
+        """ Re-buckets everything the players and their lasers can collide with. """
+        # Most falling objects are waiting above the screen, so let the entity store pick out the few that
+        # could be hit, and their rects, in one go rather than looking at each one
+        placed = []
+        for sprite, rect in self.falling_objects.rects_in(self.collision_grid.bounds):
+            if isinstance(sprite, gameplay_items.PowerUp):
+                placed.append(("pups", sprite, rect))
+            elif isinstance(sprite, gameplay_items.CollectStar):
+                placed.append(("collectible_stars", sprite, rect))
+            else:
+                placed.append(("asteroids", sprite, rect))
+
+        self.collision_grid.rebuild({"aliens": self.aliens, "alien_lasers": self.projectiles.enemy_lasers},
+                                    placed)
+
+    def add_to_layer(self, name, content):
+        """ Adds something to be drawn every frame in a layer, on top of what is already there. content is a
+        sprite group, a starfield or entity store view, or a function that draws onto the screen it is passed and returns how many
+        blits (or shapes) it drew. """
+        self.layers[name].append(content)
 
     def draw(self, screen):
-        # Background
-        screen.fill(constants.BLACK)
-        screen.blit(self.background, (0, self.background_y))
-        screen.blit(self.background_2, (0, self.background_2_y))
-        for star in self.bottom_stars:
-            star.draw(screen)
-
-        self.aliens.draw(screen)
-        for alien in self.aliens:
-            alien.draw_lasers(screen)
-        self.all_sprites.draw(screen)
-
-        for star in self.top_stars:
-            star.draw(screen)
-
-        self.player.lasers_group.draw(screen)
-        if self.player_2 is not None:
-            self.player_2.lasers_group.draw(screen)
+        """ Draws every layer, bottom to top, adding to each layer's draw call and blit counts. With batch
+        rendering, groups and starfields are queued in sprite_batch, and only sent to the screen when a function
+        has to draw over them or the frame is done. """
+        batch = self.sprite_batch
+        for name in self.layer_names:
+            stats = self.layer_stats[name]
+            for content in self.layers[name]:
+                if isinstance(content, pygame.sprite.AbstractGroup):
+                    if self.batch_rendering is True:
+                        blits = batch.add_sprites(content)
+                    else:
+                        content.draw(screen)
+                        blits = len(content)
+                elif isinstance(content, (starfield.Starfield, entity_store.StoreView)):
+                    if self.batch_rendering is True:
+                        blits = batch.add(content.blit_sequence())
+                    else:
+                        blits = content.draw(screen)
+                else:
+                    batch.flush(screen)
+                    blits = content(screen)
+                stats["draw_calls"] += 1
+                stats["blits"] += blits
+        batch.flush(screen)
+
+    def reset_layer_stats(self):
+        for stats in self.layer_stats.values():
+            stats["draw_calls"] = 0
+            stats["blits"] = 0
+
+    def draw_background_layer(self, screen):
+        # With dirty rendering, render() may already have drawn the background where needed
+        if self.repaint_background is False:
+            return 0
+        self.draw_background(screen)
+        return 1
 
     def draw_text(self, screen, display_progress=False):
+        """ Draws the HUD, returning how many blits that took. The text is kept rendered in status_hud (top left)
+        and ship_hud (bottom left), and only rendered again when it changes. """
         if display_progress is False:
             progress_shift = 30
         else:
             progress_shift = 0
+        status = {}
+        ship = {}
         # Top left
         if display_progress is False:
-            progress_text = "Progress through asteroid field: {0!s}%".format(int((self.timer / 100) * 2))
-            progress_render = self.score_font.render(progress_text, True, constants.WHITE)
-            screen.blit(progress_render, (10, 10))
-        score_text = "Score: {0!s}".format(self.score)
-        score_render = self.score_font.render(score_text, True, constants.WHITE)
-        screen.blit(score_render, (10, 10 + progress_shift))
+            status[(10, 10)] = "Progress through asteroid field: {0!s}%".format(int((self.timer / 100) * 2))
+        status[(10, 10 + progress_shift)] = "Score: {0!s}".format(self.score)
         if self.player_2 is None:
-            health_text = "Health: {0!s}".format(self.player.health)
+            status[(10, 40 + progress_shift)] = "Health: {0!s}".format(self.player.health)
         else:
-            health_text = "Player 1 Health: {0!s}".format(self.player.health)
-        health_render = self.score_font.render(health_text, True, constants.WHITE)
-        screen.blit(health_render, (10, 40 + progress_shift))
+            status[(10, 40 + progress_shift)] = "Player 1 Health: {0!s}".format(self.player.health)
         # Lives at bottom if no player 2
         if self.player_2 is None:
-            lives_text = "Lives: {0!s}".format(self.lives)
-            lives_render = self.score_font.render(lives_text, True, constants.WHITE)
-            screen.blit(lives_render, (10, 70 + progress_shift))
+            status[(10, 70 + progress_shift)] = "Lives: {0!s}".format(self.lives)
         # Display player 2 health if present
         if self.player_2 is not None:
-            health_text_2 = "Player 2 Health: {0!s}".format(self.player_2.health)
-            health_render_2 = self.score_font.render(health_text_2, True, constants.WHITE)
-            screen.blit(health_render_2, (10, 70 + progress_shift))
-            lives_text = "Lives: {0!s}".format(self.lives)
-            lives_render = self.score_font.render(lives_text, True, constants.WHITE)
-            screen.blit(lives_render, (10, 100 + progress_shift))
+            status[(10, 70 + progress_shift)] = "Player 2 Health: {0!s}".format(self.player_2.health)
+            status[(10, 100 + progress_shift)] = "Lives: {0!s}".format(self.lives)
         # Bottom left
         if self.player_2 is None:
             if self.player.speed_boosted is True:
-                speed_boost_render = self.score_font.render("Speed boosted!", True, constants.WHITE)
-                screen.blit(speed_boost_render, (10, 680))
+                ship[(10, 680)] = "Speed boosted!"
         else:
             if self.player.speed_boosted is True and self.player_2.speed_boosted is False:
-                speed_boost_render = self.score_font.render("Player 1 Speed Boosted!", True, constants.WHITE)
-                screen.blit(speed_boost_render, (10, 620))
+                ship[(10, 620)] = "Player 1 Speed Boosted!"
             elif self.player.speed_boosted is False and self.player_2.speed_boosted is True:
-                speed_boost_render = self.score_font.render("Player 2 Speed Boosted!", True, constants.WHITE)
-                screen.blit(speed_boost_render, (10, 620))
+                ship[(10, 620)] = "Player 2 Speed Boosted!"
             elif self.player.speed_boosted is True and self.player_2.speed_boosted is True:
-                speed_boost_render = self.score_font.render("Player 1 Speed Boosted!", True, constants.WHITE)
-                screen.blit(speed_boost_render, (10, 590))
-
-                speed_boost_render = self.score_font.render("Player 2 Speed Boosted!", True, constants.WHITE)
-                screen.blit(speed_boost_render, (10, 620))
+                ship[(10, 590)] = "Player 1 Speed Boosted!"
+                ship[(10, 620)] = "Player 2 Speed Boosted!"
 
         x_speed = self.player.x_speed
         y_speed = self.player.y_speed
@@ -257,13 +536,9 @@ class GameScene(generic_scene.GenericScene):
         elif y_speed > 0:
             y_speed = - y_speed
         if self.player_2 is None:
-            speed_text = "Ship Speed: {0!s} / {1!s}".format(int(y_speed), int(x_speed))
-            speed_render = self.score_font.render(speed_text, True, constants.WHITE)
-            screen.blit(speed_render, (10, 710))
+            ship[(10, 710)] = "Ship Speed: {0!s} / {1!s}".format(int(y_speed), int(x_speed))
         else:
-            speed_text = "Player 1 Speed: {0!s} / {1!s}".format(int(y_speed), int(x_speed))
-            speed_render = self.score_font.render(speed_text, True, constants.WHITE)
-            screen.blit(speed_render, (10, 650))
+            ship[(10, 650)] = "Player 1 Speed: {0!s} / {1!s}".format(int(y_speed), int(x_speed))
 
             x_speed = self.player_2.x_speed
             y_speed = self.player_2.y_speed
@@ -272,21 +547,16 @@ class GameScene(generic_scene.GenericScene):
             elif y_speed > 0:
                 y_speed = - y_speed
 
-            speed_text = "Player 2 Speed: {0!s} / {1!s}".format(int(y_speed), int(x_speed))
-            speed_render = self.score_font.render(speed_text, True, constants.WHITE)
-            screen.blit(speed_render, (10, 680))
+            ship[(10, 680)] = "Player 2 Speed: {0!s} / {1!s}".format(int(y_speed), int(x_speed))
 
         if self.player_2 is None:
-            lasers_text = "Laser Charges: {0!s}".format(self.player.lasers)
-            lasers_render = self.score_font.render(lasers_text, True, constants.WHITE)
-            screen.blit(lasers_render, (10, 740))
+            ship[(10, 740)] = "Laser Charges: {0!s}".format(self.player.lasers)
         else:
-            lasers_text = "Player 1 Laser Charges: {0!s}".format(self.player.lasers)
-            lasers_render = self.score_font.render(lasers_text, True, constants.WHITE)
-            screen.blit(lasers_render, (10, 710))
+            ship[(10, 710)] = "Player 1 Laser Charges: {0!s}".format(self.player.lasers)
+            ship[(10, 740)] = "Player 2 Laser Charges: {0!s}".format(self.player_2.lasers)
 
-            lasers_text = "Player 2 Laser Charges: {0!s}".format(self.player_2.lasers)
-            lasers_render = self.score_font.render(lasers_text, True, constants.WHITE)
-            screen.blit(lasers_render, (10, 740))
+        self.status_hud.update(status)
+        self.ship_hud.update(ship)
+        return self.status_hud.draw(screen) + self.ship_hud.draw(screen)
 
 
@@ -4,11 +4,13 @@ obstacles (E.g. asteroids), powerups (E.g. speed boost) and scenery (E.g. stars)
 # Pygame
 import pygame
 # Standard library
-import random
 import math
 import inspect
 # Game modules
 import scene_tools
+import asset_registry
+import sound_bank
+import game_random
 
 
 # Gameplay
@@ -16,9 +18,9 @@ class PlayerShip(pygame.sprite.Sprite):
     """ Player ship. Instantiated in a game scene. Moves around, can generate a shield. """
     def __init__(self):
         super().__init__()
-        self.image = pygame.image.load('assets/blue_ship.png').convert_alpha()
+        self.image = asset_registry.load_image('assets/blue_ship.png')
         self.rect = self.image.get_rect()
-        self.mask = pygame.mask.from_surface(self.image)
+        self.mask = asset_registry.load_mask('assets/blue_ship.png')
         self.speed = 4
         self.x_speed = 0
         self.y_speed = 0
@@ -37,16 +39,6 @@ class PlayerShip(pygame.sprite.Sprite):
         self.game_scene = None
 
         self.alert_played = False
-        self.alarm = pygame.mixer.Sound('music/alarm.wav')
-
-
-        # Powerup sound
-        self.powerup_sound = pygame.mixer.Sound('music/bonus.wav')
-
-
-        # Star sound
-        self.star_sound = pygame.mixer.Sound('music/coin.ogg')
-
 
         self.health = 100
 
@@ -55,75 +47,18 @@ class PlayerShip(pygame.sprite.Sprite):
         self.rect.y = y
 
     def update(self):
-        if self.game_scene is not None:
-            self.alarm.set_volume(self.game_scene.settings['sound_volume'] / 100)
-            self.powerup_sound.set_volume(self.game_scene.settings['sound_volume'] / 100)
-            self.star_sound.set_volume(self.game_scene.settings['sound_volume'] / 100)
-
+        """ Movement only. Collisions are handled by the game scene once everything has moved. """
         self.rect.x += self.x_speed
         self.rect.y += self.y_speed
 
-        if self.shield is not None:
-            self.shield.update_pos(self)
-
-        if self.game_scene is not None:
-            self.collision_detection(self.game_scene.asteroids)
-            self.collision_detection(self.game_scene.aliens)
-            for alien in self.game_scene.aliens:
-                self.collision_detection(alien.lasers)
-
-            # Check if this is player one
-            if self.game_scene.player is self:
-                # Check if there is a player 2
-                if self.game_scene.player_2 is not None:
-                    self.collision_detection(self.game_scene.player_2.lasers_group)
-            # Check if this is player two
-            if self.game_scene.player_2 is self:
-                self.collision_detection(self.game_scene.player.lasers_group)
-
-            # Powerup collision detection
-            for pup in self.game_scene.pups:
-                if pygame.sprite.collide_mask(self, pup):
-                    self.game_scene.score += 10
-                    if pup.type == "speed":
-                        self.speed_boosted = True
-                    elif pup.type == "laser":
-                        laser_count = self.lasers
-                        laser_count += 3
-                        if laser_count > 5:
-                            laser_count = 5
-                        self.lasers = laser_count
-                    elif pup.type == "health":
-                        self.health += 50
-                        if self.health > 100:
-                            self.health = 100
-                    elif pup.type == "shield":
-                        if self.shield is None:
-                            self.create_shield(self.game_scene.all_sprites)
-
-                    pup.reset_pos()
-                    self.powerup_sound.play()
-
-            # Powerup effects
-            if self.speed_boosted is True:
-                self.speed = 8
-                self.speed_boost_timer += 1
-                if self.speed_boost_timer == 600:
-                    self.speed_boosted = False
-                    self.speed = 4
-                    self.speed_boost_timer = 0
-
-            # Collectible star collision detection
-            for star in self.game_scene.collectible_stars:
-                if pygame.sprite.collide_mask(self, star):
-                    if star.star_type == "bronze":
-                        self.game_scene.score += 2
-                    elif star.star_type == "silver":
-                        self.game_scene.score += 4
-                    elif star.star_type == "gold":
-                        self.game_scene.score += 10
-                    star.reset_pos()
-                    self.star_sound.play()
+        # Powerup effects
+        if self.speed_boosted is True:
+            self.speed = 8
+            self.speed_boost_timer += 1
+            if self.speed_boost_timer == 600:
+                self.speed_boosted = False
+                self.speed = 4
+                self.speed_boost_timer = 0
 
         # Don't let the ship move outside the screen
         if self.rect[0] <= 0:
@@ -135,17 +70,8 @@ class PlayerShip(pygame.sprite.Sprite):
         elif self.rect[1] >= (768 - self.rect.height):
             self.update_pos(self.rect.x, 768 - self.rect.height)
 
-
-        # Death
-        if self.health <= 0:
-            self.game_scene.lives -= 1
-            self.game_scene.all_sprites.add(Explosion(self.rect.x, self.rect.y, self.game_scene.images, self.game_scene))
-            scene_tools.death_scene_reset([self.game_scene.asteroids, self.game_scene.pups,
-                                           self.game_scene.collectible_stars], self, self.game_scene.player_2)
-            self.health = 100
-            self.alert_played = False
-
-        self.lasers_group.update()
+        if self.shield is not None:
+            self.shield.update_pos(self)
 
     def create_shield(self, sprite_group):
         self.shield = Shield(self)
@@ -153,32 +79,82 @@ class PlayerShip(pygame.sprite.Sprite):
         sprite_group.add(self.shield)
 
     def update_appearance(self, image):
-        self.image = pygame.image.load(image).convert_alpha()
+        self.image = asset_registry.load_image(image)
         x = self.rect.x
         y = self.rect.y
         self.rect = self.image.get_rect()
         self.rect.x = x
         self.rect.y = y
-        self.mask = pygame.mask.from_surface(self.image)
-
-    def collision_detection(self, enemies):
-        for enemy in enemies:
-            if self.shield is None:
-                if pygame.sprite.collide_mask(enemy, self):
-                    enemy.collision()
-                    if self.health - enemy.health_decrease < 25 and self.alert_played is False:
-                        self.alarm.play()
-                        self.alert_played = True
-                    self.health -= enemy.health_decrease
-            elif self.shield is not None:
-                if pygame.sprite.collide_mask(enemy, self.shield):
-                    enemy.collision()
-                    self.shield.kill()
-                    self.shield = None
+        self.mask = asset_registry.load_mask(image)
+
+    def collision_rect(self):
+        """ The area that can be hit. The shield, if there is one, otherwise the ship. """
+        if self.shield is not None:
+            return self.shield.rect
+        return self.rect
+
+    def hit_by(self, enemy):
+        """ Damages the ship if an enemy touches it. A shield takes the hit instead, and is used up. """
+        if self.shield is None:
+            if pygame.sprite.collide_mask(enemy, self):
+                enemy.collision()
+                if self.health - enemy.health_decrease < 25 and self.alert_played is False:
+                    sound_bank.play("alarm")
+                    self.alert_played = True
+                self.health -= enemy.health_decrease
+        elif self.shield is not None:
+            if pygame.sprite.collide_mask(enemy, self.shield):
+                enemy.collision()
+                self.shield.kill()
+                self.shield = None
+
+    def collect_powerup(self, pup):
+        if pygame.sprite.collide_mask(self, pup):
+            self.game_scene.score += 10
+            if pup.type == "speed":
+                self.speed_boosted = True
+            elif pup.type == "laser":
+                laser_count = self.lasers
+                laser_count += 3
+                if laser_count > 5:
+                    laser_count = 5
+                self.lasers = laser_count
+            elif pup.type == "health":
+                self.health += 50
+                if self.health > 100:
+                    self.health = 100
+            elif pup.type == "shield":
+                if self.shield is None:
+                    self.create_shield(self.game_scene.all_sprites)
+
+            pup.reset_pos()
+            sound_bank.play("powerup")
+
+    def collect_star(self, star):
+        if pygame.sprite.collide_mask(self, star):
+            if star.star_type == "bronze":
+                self.game_scene.score += 2
+            elif star.star_type == "silver":
+                self.game_scene.score += 4
+            elif star.star_type == "gold":
+                self.game_scene.score += 10
+            star.reset_pos()
+            sound_bank.play("star")
+
+    def check_death(self):
+        """ Loses a life and resets the scene if the ship has run out of health. """
+        if self.health <= 0:
+            self.game_scene.lives -= 1
+            self.game_scene.explode(self.rect.x, self.rect.y)
+            scene_tools.death_scene_reset([self.game_scene.asteroids, self.game_scene.pups,
+                                           self.game_scene.collectible_stars], self, self.game_scene.player_2)
+            self.health = 100
+            self.alert_played = False
 
     def fire_laser(self):
         if self.lasers > 0:
-            self.lasers_group.add(Laser(self.game_scene, self.rect.x + 53, self.rect.y + 10))
+            laser = self.game_scene.laser_pool.acquire(self.rect.x + 53, self.rect.y + 10)
+            self.game_scene.projectiles.add(laser, self.lasers_group)
             self.lasers -= 1
 
 
@@ -186,252 +162,228 @@ class Shield(pygame.sprite.Sprite):
     """ Appears around a PlayerShip() instance. """
     def __init__(self, ship):
         super().__init__()
-        self.image = pygame.image.load('assets/shield.png').convert_alpha()
+        self.image = asset_registry.load_image('assets/shield.png')
         self.rect = self.image.get_rect()
-        self.mask = pygame.mask.from_surface(self.image, 10)
+        self.mask = asset_registry.load_mask('assets/shield.png', 10)
 
     def update_pos(self, ship):
         self.rect.x = ship.rect.x - 17
         self.rect.y = ship.rect.y - 32
 
 
-class Laser(pygame.sprite.Sprite):
-    """ Moves upwards. Instantiated at player ship location. """
-    def __init__(self, game_scene, x, y):
+class PooledSprite(pygame.sprite.Sprite):
+    """ A sprite handed out by an object_pool.ObjectPool. spawn() sets it up each time it is taken from the
+    pool, and killing it puts it back. """
+    pool = None
+
+    def kill(self):
+        super().kill()
+        if self.pool is not None:
+            self.pool.release(self)
+
+
+class Laser(PooledSprite):
+    """ Moves upwards. Taken from the game scene's laser pool at the player ship location. """
+    def __init__(self, game_scene):
         super().__init__()
         self.game_scene = game_scene
-        self.image = pygame.image.load('assets/laser_red.png').convert_alpha()
+        self.image = asset_registry.load_image('assets/laser_red.png')
         self.rect = self.image.get_rect()
-        self.mask = pygame.mask.from_surface(self.image)
+        self.mask = asset_registry.load_mask('assets/laser_red.png')
         self.speed = -7
-        self.rect.x = x
-        self.rect.y = y
-        self.sound = pygame.mixer.Sound('music/laser.ogg')
-        self.sound.set_volume(self.game_scene.settings['sound_volume'] / 100)
-        self.sound.play()
 
         self.health_decrease = 20
 
+    def spawn(self, x, y):
+        self.rect.x = x
+        self.rect.y = y
+        sound_bank.play("laser")
+
     def update(self):
+        # The scene's projectile manager kills the laser once it leaves the screen
         self.rect.y += self.speed
-        if self.rect.y < -100:
-            self.kill()
-
-        self.collision_detection(self.game_scene.asteroids)
-        self.collision_detection(self.game_scene.aliens)
 
-    def collision_detection(self, enemies):
-        for enemy in enemies:
-            if pygame.sprite.collide_mask(enemy, self):
-                self.kill()
-                enemy.collision()
-                self.game_scene.score += enemy.score_increase
+    def hit(self, enemy):
+        """ Destroys the laser and damages the enemy if they touch. """
+        if pygame.sprite.collide_mask(enemy, self):
+            self.kill()
+            enemy.collision()
+            self.game_scene.score += enemy.score_increase
 
     def collision(self):
-        self.game_scene.all_sprites.add(Explosion(self.rect.x, self.rect.y, self.game_scene.images, self.game_scene))
+        self.game_scene.explode(self.rect.x, self.rect.y)
         self.kill()
 
 
-class BrownAsteroid(pygame.sprite.Sprite):
+class FallingObject(pygame.sprite.Sprite):
+    """ Base for sprites that fall down the screen. Position, speed, health and image live in the scene's
+    entity store, which moves every falling object in one step and draws them in draw_layer, so these sprites
+    have no update() of their own and are not put in all_sprites. rect is worked out from the store each time
+    it is read, and changing it in place (E.g. rect.x = 10) moves the object in the store. """
+    draw_layer = "player"
+
+    def __init__(self, store, image_path, speed, respawn_min=-2000, respawn_max=-200, health=1, stored=True):
+        super().__init__()
+        self.store = store
+        self.store_index = None
+        self.image = asset_registry.load_image(image_path)
+        self.mask = asset_registry.load_mask(image_path)
+        self.speed = speed
+        self.respawn_min = respawn_min
+        self.respawn_max = respawn_max
+        if stored is True:
+            self.add_to_store(0, 0, health)
+
+    def add_to_store(self, x, y, health=1):
+        """ Gives the object a slot in the store. Pooled objects get a new slot each time they are reused. """
+        self.store_index = self.store.add(self, self.image, x, y, self.speed, self.respawn_min, self.respawn_max,
+                                          health, self.draw_layer)
+
+    @property
+    def image(self):
+        return self.stored_image
+
+    @image.setter
+    def image(self, image):
+        self.stored_image = image
+        if self.store_index is not None:
+            self.store.set_image(self.store_index, image)
+
+    @property
+    def rect(self):
+        return self.store.rect(self.store_index)
+
+    @rect.setter
+    def rect(self, rect):
+        self.store.set_rect(self.store_index, rect)
+
+    @property
+    def health(self):
+        return int(self.store.health[self.store_index])
+
+    @health.setter
+    def health(self, health):
+        self.store.health[self.store_index] = health
+
+    def update_pos(self, x, y):
+        self.store.set_pos(self.store_index, x, y)
+
+    def set_image(self, image_path):
+        """ Swaps the image and mask, keeping the top left corner where it is. """
+        self.image = asset_registry.load_image(image_path)
+        self.mask = asset_registry.load_mask(image_path)
+
+    def kill(self):
+        super().kill()
+        self.store.remove(self)
+
+
+class BrownAsteroid(FallingObject):
     """ Large sprite that moves slowly down the screen. """
     def __init__(self, game_scene):
-        super().__init__()
+        image_path = 'assets/meteor_brown_big_{0!s}.png'.format(game_random.randrange(0, 4) + 1)
+        super().__init__(game_scene.falling_objects, image_path, 3)
         self.game_scene = game_scene
-        randnum = random.randrange(0, 4)
-        if randnum == 0:
-            self.image = pygame.image.load('assets/meteor_brown_big_1.png').convert_alpha()
-        elif randnum == 1:
-            self.image = pygame.image.load('assets/meteor_brown_big_2.png').convert_alpha()
-        elif randnum == 2:
-            self.image = pygame.image.load('assets/meteor_brown_big_3.png').convert_alpha()
-        else:
-            self.image = pygame.image.load('assets/meteor_brown_big_4.png').convert_alpha()
-        self.rect = self.image.get_rect()
-        self.mask = pygame.mask.from_surface(self.image)
-        self.y_speed = 3
 
         self.score_increase = 30
         self.health_decrease = 30
 
-    def update(self):
-        self.rect.y += self.y_speed
-        if self.rect.y > 768:
-            self.rect.y = random.randrange(-2000, -200)
-            self.rect.x = random.randrange(0, 1024)
-
     def collision(self):
-        self.game_scene.all_sprites.add(Explosion(self.rect.x, self.rect.y, self.game_scene.images, self.game_scene))
+        self.game_scene.explode(self.rect.x, self.rect.y)
         self.kill()
 
 
-class GreyAsteroid(pygame.sprite.Sprite):
+class GreyAsteroid(FallingObject):
     """ Large sprite that moves down the screen at med speed. """
     def __init__(self, game_scene):
-        super().__init__()
+        image_path = 'assets/meteor_grey_big_{0!s}.png'.format(game_random.randrange(0, 4) + 1)
+        super().__init__(game_scene.falling_objects, image_path, 5)
         self.game_scene = game_scene
-        randnum = random.randrange(0, 4)
-        if randnum == 0:
-            self.image = pygame.image.load('assets/meteor_grey_big_1.png').convert_alpha()
-        elif randnum == 1:
-            self.image = pygame.image.load('assets/meteor_grey_big_2.png').convert_alpha()
-        elif randnum == 2:
-            self.image = pygame.image.load('assets/meteor_grey_big_3.png').convert_alpha()
-        else:
-            self.image = pygame.image.load('assets/meteor_grey_big_4.png').convert_alpha()
-        self.rect = self.image.get_rect()
-        self.mask = pygame.mask.from_surface(self.image)
-        self.y_speed = 5
 
         self.score_increase = 30
         self.health_decrease = 30
 
-    def update(self):
-        self.rect.y += self.y_speed
-        if self.rect.y > 768:
-            self.rect.y = random.randrange(-2000, -200)
-            self.rect.x = random.randrange(0, 1024)
-
     def collision(self):
-        self.game_scene.all_sprites.add(Explosion(self.rect.x, self.rect.y, self.game_scene.images, self.game_scene))
+        self.game_scene.explode(self.rect.x, self.rect.y)
         self.kill()
 
 
-class MedAsteroid(pygame.sprite.Sprite):
+class MedAsteroid(FallingObject):
     """ Small sprite that moves down the screen quickly. """
     def __init__(self, game_scene):
-        super().__init__()
+        image_path = 'assets/meteor_brown_med_{0!s}.png'.format(game_random.randrange(0, 2) + 1)
+        super().__init__(game_scene.falling_objects, image_path, 8)
         self.game_scene = game_scene
-        randnum = random.randrange(0, 2)
-        if randnum == 0:
-            self.image = pygame.image.load('assets/meteor_brown_med_1.png').convert_alpha()
-        else:
-            self.image = pygame.image.load('assets/meteor_brown_med_2.png').convert_alpha()
-        self.rect = self.image.get_rect()
-        self.mask = pygame.mask.from_surface(self.image)
-        self.y_speed = 8
 
         self.score_increase = 30
         self.health_decrease = 30
 
-    def update(self):
-        self.rect.y += self.y_speed
-        if self.rect.y > 768:
-            self.rect.y = random.randrange(-2000, -200)
-            self.rect.x = random.randrange(0, 1024)
-
     def collision(self):
-        self.game_scene.all_sprites.add(Explosion(self.rect.x, self.rect.y, self.game_scene.images, self.game_scene))
+        self.game_scene.explode(self.rect.x, self.rect.y)
         self.kill()
 
 
-class FragmentingAsteroid(pygame.sprite.Sprite):
+class FragmentingAsteroid(FallingObject):
     """ A large asteroid. When hit, it breaks into multiple smaller asteroids. """
     def __init__(self, game_scene):
-        super().__init__()
-        randnum = random.randrange(1, 5)
-        self.image = pygame.image.load('assets/meteor_dark_brown_big_{0!s}.png'.format(randnum)).convert_alpha()
-        self.rect = self.image.get_rect()
-        self.mask = pygame.mask.from_surface(self.image)
-        self.rect.y = random.randrange(-2000, -200)
-        self.rect.x = random.randrange(0, 1024)
-
-        self.y_speed = 4
+        image_path = 'assets/meteor_dark_brown_big_{0!s}.png'.format(game_random.randrange(1, 5))
+        super().__init__(game_scene.falling_objects, image_path, 4)
+        self.update_pos(game_random.randrange(0, 1024), game_random.randrange(-2000, -200))
 
         self.game_scene = game_scene
 
         self.score_increase = 30
         self.health_decrease = 30
 
-    def update(self):
-        self.rect.y += self.y_speed
-        if self.rect.y > 768:
-            self.rect.y = random.randrange(-2000, -200)
-            self.rect.x = random.randrange(0, 1024)
-
     def collision(self):
-        self.game_scene.all_sprites.add(Explosion(self.rect.x, self.rect.y, self.game_scene.images, self.game_scene))
+        rect = self.rect
+        self.game_scene.explode(rect.x, rect.y)
         self.kill()
-        ast1 = FragmentedAsteroid(self.game_scene)
-        ast1.rect.x = self.rect.x + (self.rect.width / 2 - ast1.rect.width / 2) + 40
-        ast1.rect.y = self.rect.y
-        self.game_scene.all_sprites.add(ast1)
+        ast1 = self.game_scene.fragment_pool.acquire(rect.x, rect.y)
+        ast1.update_pos(rect.x + (rect.width / 2 - ast1.rect.width / 2) + 40, rect.y)
         self.game_scene.asteroids.add(ast1)
-        ast2 = FragmentedAsteroid(self.game_scene)
-        ast2.rect.x = self.rect.x + (self.rect.width / 2 - ast1.rect.width / 2) - 40
-        ast2.rect.y = self.rect.y + 30
-        self.game_scene.all_sprites.add(ast2)
+        ast2 = self.game_scene.fragment_pool.acquire(rect.x, rect.y)
+        ast2.update_pos(rect.x + (rect.width / 2 - ast1.rect.width / 2) - 40, rect.y + 30)
         self.game_scene.asteroids.add(ast2)
 
 
-class FragmentedAsteroid(pygame.sprite.Sprite):
-    """ A smaller asteroid spawned when a fragmenting asteroid is destroyed. """
+class FragmentedAsteroid(PooledSprite, FallingObject):
+    """ A smaller asteroid spawned when a fragmenting asteroid is destroyed. Taken from the game scene's
+    fragment pool, and only given a slot in the entity store while in use. """
     def __init__(self, game_scene):
-        super().__init__()
-        self.image = pygame.image.load('assets/meteor_brown_med_1.png').convert_alpha()
-        self.rect = self.image.get_rect()
-        self.mask = pygame.mask.from_surface(self.image)
-        self.y_speed = 7
-
-        self.rect.y = random.randrange(-2000, -200)
-        self.rect.x = random.randrange(0, 1024)
+        super().__init__(game_scene.falling_objects, 'assets/meteor_brown_med_1.png', 7, stored=False)
 
         self.game_scene = game_scene
 
         self.score_increase = 30
         self.health_decrease = 30
 
-    def update(self):
-        self.rect.y += self.y_speed
-        if self.rect.y > 768:
-            self.rect.y = random.randrange(-2000, -200)
-            self.rect.x = random.randrange(0, 1024)
+    def spawn(self, x, y):
+        self.add_to_store(x, y)
 
     def collision(self):
-        self.game_scene.all_sprites.add(Explosion(self.rect.x, self.rect.y, self.game_scene.images, self.game_scene))
+        self.game_scene.explode(self.rect.x, self.rect.y)
         self.kill()
 
 
-class StrongAsteroid(pygame.sprite.Sprite):
+class StrongAsteroid(FallingObject):
     """ An asteroid that takes several hits to destroy. """
     def __init__(self, game_scene):
-        super().__init__()
-        self.randnum = random.randrange(1, 5)
-        self.image = pygame.image.load('assets/meteor_purple_big_{0!s}.png'.format(self.randnum)).convert_alpha()
-        self.rect = self.image.get_rect()
-        self.mask = pygame.mask.from_surface(self.image)
+        self.randnum = game_random.randrange(1, 5)
+        image_path = 'assets/meteor_purple_big_{0!s}.png'.format(self.randnum)
+        super().__init__(game_scene.falling_objects, image_path, 2, health=3)
 
         self.game_scene = game_scene
-        self.y_speed = 2
         self.score_increase = 30
         self.health_decrease = 30
 
-        self.health = 3
-
-    def update(self):
-        self.rect.y += self.y_speed
-        if self.rect.y > 768:
-            self.rect.y = random.randrange(-2000, -200)
-            self.rect.x = random.randrange(0, 1024)
-
     def collision(self):
-        self.game_scene.all_sprites.add(Explosion(self.rect.x, self.rect.y, self.game_scene.images, self.game_scene))
+        self.game_scene.explode(self.rect.x, self.rect.y)
         self.health -= 1
         if self.health == 2:
-            y = self.rect.y
-            x = self.rect.x
-            self.image = pygame.image.load('assets/meteor_purple_big_{0!s}_damaged_1.png'.format(self.randnum)).convert_alpha()
-            self.rect = self.image.get_rect()
-            self.rect.y = y
-            self.rect.x = x
-            self.mask = pygame.mask.from_surface(self.image)
+            self.set_image('assets/meteor_purple_big_{0!s}_damaged_1.png'.format(self.randnum))
         elif self.health == 1:
-            y = self.rect.y
-            x = self.rect.x
-            self.image = pygame.image.load('assets/meteor_purple_big_{0!s}_damaged_2.png'.format(self.randnum)).convert_alpha()
-            self.rect = self.image.get_rect()
-            self.rect.y = y
-            self.rect.x = x
-            self.mask = pygame.mask.from_surface(self.image)
+            self.set_image('assets/meteor_purple_big_{0!s}_damaged_2.png'.format(self.randnum))
         elif self.health == 0:
             self.kill()
 
@@ -442,30 +394,29 @@ class Alien(pygame.sprite.Sprite):
         super().__init__()
         self.game_scene = game_scene
         self.speed = 4
-        rand_num = random.randrange(0, 4)
+        rand_num = game_random.randrange(0, 4)
         if rand_num == 0:
-            self.image = pygame.image.load('assets/alien_red.png').convert_alpha()
+            image_path = 'assets/alien_red.png'
         elif rand_num == 1:
-            self.image = pygame.image.load('assets/alien_blue.png').convert_alpha()
+            image_path = 'assets/alien_blue.png'
         elif rand_num == 2:
-            self.image = pygame.image.load('assets/alien_yellow.png').convert_alpha()
+            image_path = 'assets/alien_yellow.png'
         else:
-            self.image = pygame.image.load('assets/alien_green.png').convert_alpha()
+            image_path = 'assets/alien_green.png'
+        self.image = asset_registry.load_image(image_path)
         self.rect = self.image.get_rect()
-        self.mask = pygame.mask.from_surface(self.image)
+        self.mask = asset_registry.load_mask(image_path)
 
         self.x_speed = 4
         self.y_speed = 4
 
         (self.straight, self.x_min, self.x_max) = self.gen_min_max()
 
-        self.rect.x = random.randrange(self.x_min, self.x_max)
-        self.rect.y = random.randrange(-1000, -200)
+        self.rect.x = game_random.randrange(self.x_min, self.x_max)
+        self.rect.y = game_random.randrange(-1000, -200)
 
         self.change_time = 0
 
-        self.lasers = pygame.sprite.Group()
-
         self.score_increase = 40
         self.health_decrease = 30
 
@@ -486,21 +437,17 @@ class Alien(pygame.sprite.Sprite):
 
         self.rect.x += self.x_speed
 
-        time = random.randrange(100, 400)
+        time = game_random.randrange(100, 400)
         if timer % time == 0 and self.rect.y > -400:
             self.shoot()
 
-        self.lasers.update()
-
-    def draw_lasers(self, screen):
-        self.lasers.draw(screen)
-
     def shoot(self):
-        self.lasers.add(AlienLaser(self.rect.x + 45, self.rect.y + 45, self.game_scene))
+        laser = self.game_scene.alien_laser_pool.acquire(self.rect.x + 45, self.rect.y + 45)
+        self.game_scene.projectiles.add_enemy_laser(laser)
 
     def gen_min_max(self):
-        num_1 = random.randrange(0, 1000)
-        num_2 = random.randrange(0, 1000)
+        num_1 = game_random.randrange(0, 1000)
+        num_2 = game_random.randrange(0, 1000)
 
         if num_1 > num_2:
             x_max = num_1
@@ -521,33 +468,34 @@ class Alien(pygame.sprite.Sprite):
 
     def reset_pos(self):
         (self.straight, self.x_min, self.x_max) = self.gen_min_max()
-        self.rect.y = random.randrange(-10000, -200)
-        self.rect.x = random.randrange(self.x_min, self.x_max)
+        self.rect.y = game_random.randrange(-10000, -200)
+        self.rect.x = game_random.randrange(self.x_min, self.x_max)
 
     def collision(self):
-        self.game_scene.all_sprites.add(Explosion(self.rect.x, self.rect.y, self.game_scene.images))
+        self.game_scene.explode(self.rect.x, self.rect.y)
         self.kill()
 
 
-class AlienLaser(pygame.sprite.Sprite):
-    """ Sprite that moves down the screen. Used by the Alien class. """
-    def __init__(self, x, y, game_scene, angle=0):
+class AlienLaser(PooledSprite):
+    """ Sprite that moves down the screen. Taken from the game scene's alien laser pool by the Alien and
+    Boss classes. """
+    def __init__(self, game_scene):
         super().__init__()
         self.game_scene = game_scene
-        self.image = pygame.image.load('assets/laser_green.png').convert_alpha()
-
         self.speed = 8
         self.health_decrease = 30
+        self.image = asset_registry.load_image('assets/laser_green.png')
+        self.rect = self.image.get_rect()
+        self.mask = asset_registry.load_mask('assets/laser_green.png')
 
-        self.laser_sound = pygame.mixer.Sound('music/laser_alien.ogg')
-        self.laser_sound.set_volume(self.game_scene.settings['sound_volume'] / 100)
-        self.laser_sound.play()
+    def spawn(self, x, y, angle=0):
+        sound_bank.play("alien_laser")
 
-        # Angle and rotation
+        # Angle and rotation. Each rotated image is built once and shared between lasers
         self.angle = angle
-        self.image = pygame.transform.rotate(self.image, self.angle)
+        self.image = asset_registry.load_image('assets/laser_green.png', angle=self.angle)
         self.rect = self.image.get_rect()
-        self.mask = pygame.mask.from_surface(self.image)
+        self.mask = asset_registry.load_mask('assets/laser_green.png', angle=self.angle)
         self.rect.x = x
         self.rect.y = y
         self.x_speed = self.speed * math.sin(math.radians(self.angle))
@@ -562,11 +510,8 @@ class AlienLaser(pygame.sprite.Sprite):
         self.rect.x = round(self.real_x)
         self.rect.y = round(self.real_y)
 
-        if (0 > self.rect.y > 768) or (0 > self.rect.x > 1024):
-            self.kill()
-
     def collision(self):
-        self.game_scene.all_sprites.add(Explosion(self.rect.x, self.rect.y, self.game_scene.images, self.game_scene))
+        self.game_scene.explode(self.rect.x, self.rect.y)
         self.kill()
 
 
@@ -582,9 +527,9 @@ class Boss(pygame.sprite.Sprite):
 
         # Req for all sprites
         if self.boss_type == 1:
-            self.image = pygame.image.load("assets/big_red_saucer.png").convert_alpha()
+            self.image = asset_registry.load_image("assets/big_red_saucer.png")
         elif self.boss_type == 2:
-            self.image = pygame.image.load("assets/big_green_saucer.png").convert_alpha()
+            self.image = asset_registry.load_image("assets/big_green_saucer.png")
         self.rect = self.image.get_rect()
 
         # Set location and speed
@@ -595,9 +540,6 @@ class Boss(pygame.sprite.Sprite):
 
         self.health = 100
 
-        # This will hold the lasers the boss has fired
-        self.lasers = pygame.sprite.Group()
-
         # How much to increase player score by if hit by laser
         self.score_increase = 7
 
@@ -738,7 +680,7 @@ class Boss(pygame.sprite.Sprite):
                         self.shoot()
                 # Random gap location for the run, if needed
                 if self.gap_needed is True:
-                    self.gap_start = random.randrange(200, 800)
+                    self.gap_start = game_random.randrange(200, 800)
                     self.gap_needed = False
                 # If inside the gap, don't fire
                 if self.rect.x <= self.gap_start + 100:
@@ -797,7 +739,7 @@ class Boss(pygame.sprite.Sprite):
             if self.radial_fire_checked is True:
                 if self.radial_retreating is False:
                     if self.radial_position_needed is True:
-                        self.radial_position = random.randrange(200, 800)
+                        self.radial_position = game_random.randrange(200, 800)
                         self.radial_position_needed = False
                     if (self.radial_position - 10) < self.rect.x < (self.radial_position + 10):
                         if self.old_speed_needed is True:
@@ -823,28 +765,21 @@ class Boss(pygame.sprite.Sprite):
                         self.speed = self.old_speed
                         self.radial_position_needed = True
 
-        self.lasers.update()
-
         # Update the health bar
         self.game_scene.boss_health_bar.current_health = self.health
 
         if self.health <= 0:
             self.kill()
-            self.game_scene.all_sprites.add(Explosion(self.rect.center[0], self.rect.center[1], self.game_scene.images,
-                                                      self.game_scene))
-            for laser in self.lasers:
-                laser.kill()
+            self.game_scene.explode(self.rect.center[0], self.rect.center[1])
+            self.game_scene.projectiles.clear_enemy_lasers()
 
     def shoot(self, angle=0):
-        self.lasers.add(AlienLaser(self.rect.center[0], self.rect.center[1], self.game_scene, angle))
-
-    def draw_lasers(self, screen):
-        self.lasers.draw(screen)
+        laser = self.game_scene.alien_laser_pool.acquire(self.rect.center[0], self.rect.center[1], angle)
+        self.game_scene.projectiles.add_enemy_laser(laser)
 
     def collision(self):
         """ Called if there is a collision with a player laser. """
-        self.game_scene.all_sprites.add(Explosion(self.rect.center[0], self.rect.center[1], self.game_scene.images,
-                                                  self.game_scene))
+        self.game_scene.explode(self.rect.center[0], self.rect.center[1])
         self.health -= 10
 
     def reset(self):
@@ -859,68 +794,57 @@ class Boss(pygame.sprite.Sprite):
             return False
 
 
-class Explosion(pygame.sprite.Sprite):
-    """ An explosion animation. """
-    def __init__(self, x, y, images, game_scene):
+class Explosion(PooledSprite):
+    """ An explosion animation. Taken from the game scene's explosion pool. """
+    def __init__(self, images, game_scene):
         super().__init__()
         self.game_scene = game_scene
         self.images = images
+        self.image = self.images[1]
+        self.rect = self.image.get_rect()
+        self.index = 0
+
+    def spawn(self, x, y):
         self.image = self.images[1]
         self.rect = self.image.get_rect()
         self.rect.y = y
         self.rect.x = x
         self.index = 0
 
-        explosion = pygame.mixer.Sound('music/explosion.wav')
-        explosion.set_volume(self.game_scene.settings['sound_volume'] / 100)
-        explosion.play()
+        sound_bank.play("explosion")
 
     def update(self):
-        pass
         self.index += 1
-        if self.index < len(self.images):
-            self.image = self.images[self.index]
+        frame = self.index // self.game_scene.explosion_frame_step
+        if frame < len(self.images):
+            self.image = self.images[frame]
         else:
             self.kill()
 
 
-class PowerUp(pygame.sprite.Sprite):
+class PowerUp(FallingObject):
     """Sprites that move down the screen, and reset position when they reach the bottom.
     Different images depending on what is passed to the constructor.
     Has a timer that can be used to time effets. """
-    def __init__(self, powerup_type):
-        super().__init__()
-        self.y_min = -10000
-        self.speed = 4
+    def __init__(self, powerup_type, store):
         self.timer = 0
         if powerup_type == "speed":
             self.type = "speed"
-            self.image = pygame.image.load('assets/green_square_bolt.png').convert_alpha()
+            image_path = 'assets/green_square_bolt.png'
         elif powerup_type == "laser":
             self.type = "laser"
-            self.image = pygame.image.load('assets/red_square_star.png').convert_alpha()
+            image_path = 'assets/red_square_star.png'
         elif powerup_type == "health":
             self.type = "health"
-            self.image = pygame.image.load('assets/yellow_square_pill.png').convert_alpha()
+            image_path = 'assets/yellow_square_pill.png'
         elif powerup_type == "shield":
             self.type = "shield"
-            self.image = pygame.image.load('assets/blue_square_shield.png').convert_alpha()
-
-        self.rect = self.image.get_rect()
-        self.rect.y = random.randrange(self.y_min, -200)
-        self.rect.x = random.randrange(0, 1024)
-        self.mask = pygame.mask.from_surface(self.image)
-
-    def update(self):
-        self.rect.y += self.speed
-        if self.rect.y > 768:
-            self.rect.y = random.randrange(self.y_min, -200)
-            self.rect.x = random.randrange(0, 1024)
+            image_path = 'assets/blue_square_shield.png'
+        super().__init__(store, image_path, 4, -10000, -200)
+        self.update_pos(game_random.randrange(0, 1024), game_random.randrange(-10000, -200))
 
     def reset_pos(self):
-        self.rect.y = random.randrange(self.y_min, -200)
-        self.rect.x = random.randrange(0, 1024)
-
+        self.store.respawn(self.store_index)
 
     def powerup_over(self):
         self.timer += 1
@@ -928,61 +852,26 @@ class PowerUp(pygame.sprite.Sprite):
             return True
 
 
-class CollectStar(pygame.sprite.Sprite):
+class CollectStar(FallingObject):
     """Sprites that move down the screen and reset position when they reach the bottom.
-    Different images depending on what is passed to the constructor. """
-    def __init__(self, star_type):
-        super().__init__()
+    Different images depending on what is passed to the constructor. Drawn over the ships. """
+    draw_layer = "pickups"
+
+    def __init__(self, star_type, store):
         self.star_type = star_type
         if star_type == "bronze":
-            self.image = pygame.image.load('assets/star_bronze.png').convert_alpha()
-            self.speed = 3
-            self.y_min = -5000
-            self.y_max = -100
+            image_path = 'assets/star_bronze.png'
+            speed = 3
         elif star_type == "silver":
-            self.image = pygame.image.load('assets/star_silver.png').convert_alpha()
-            self.speed = 4
-            self.y_min = -5000
-            self.y_max = -100
+            image_path = 'assets/star_silver.png'
+            speed = 4
         elif star_type == "gold":
-            self.image = pygame.image.load('assets/star_gold.png').convert_alpha()
-            self.speed = 5
-            self.y_min = -5000
-            self.y_max = -100
-        self.rect = self.image.get_rect()
-        self.mask = pygame.mask.from_surface(self.image)
-        self.rect.y = random.randrange(self.y_min, self.y_max)
-        self.rect.x = random.randrange(0, 1024)
-
-    def update(self):
-        self.rect.y += self.speed
-        if self.rect.y > 768:
-            self.rect.y = random.randrange(self.y_min, -200)
-            self.rect.x = random.randrange(0, 1024)
+            image_path = 'assets/star_gold.png'
+            speed = 5
+        super().__init__(store, image_path, speed, -5000, -200)
+        self.update_pos(game_random.randrange(0, 1024), game_random.randrange(-5000, -100))
 
     def reset_pos(self):
-        self.rect.y = random.randrange(self.y_min, -200)
-        self.rect.x = random.randrange(self.y_min, self.y_max)
-
-
-# Scenery
-class Star:
-    """"Small dots that move down the screen."""
-    def __init__(self, min_r=230, max_r=255, min_g=230, max_g=255, min_b=230, max_b=255, min_size=1, max_size=3,
-                 min_speed=1, max_speed=4):
-        self.x = random.randrange(0, 1024)
-        self.y = random.randrange(0, 768)
-        self.color = (random.randrange(min_r, max_r), random.randrange(min_g, max_g), random.randrange(min_b, max_b))
-        self.speed = random.randrange(min_speed, max_speed)
-        self.size = random.randrange(min_size, max_size)
-
-    def update_pos(self):
-        self.y += self.speed
-        if self.y > 768:
-            self.y = random.randrange(-100, 0)
-            self.x = random.randrange(0, 1024)
-
-    def draw(self, screen):
-        pygame.draw.circle(screen, self.color, (self.x, self.y), self.size)
+        self.store.respawn(self.store_index)
 
 
@@ -29,4 +29,11 @@ class GenericScene:
         """ Draw the frame. E.g. blitting sprites and text. Updating the screen and
          handling the loop is taken care of in the main loop. """
         # Print an error message so overridding this is not forgotten.
-        print("Info - draw in GenericScene has not been overridden.")
\ No newline at end of file
+        print("Info - draw in GenericScene has not been overridden.")
+
+    def draw_frame(self, screen, alpha):
+        """ Called by the main loop to draw a frame that is alpha (0 to 1) of the way from the last tick to
+        the next. Scenes with moving sprites override this to smooth their movement, others just draw.
+        Returns a list of the rects that changed, or None if the whole screen may have. """
+        self.draw(screen)
+        return None
\ No newline at end of file
@@ -0,0 +1,168 @@
+""" Runs a level without a window, sound or frame cap, stepping the simulation as fast as the CPU allows.
+Used for balance testing and timing the simulation. Players are controlled by a script rather than the
+keyboard and a controller, so two player levels run without a joystick plugged in. E.g.
+
+    python headless.py level_8 --seed 3 --frames 5000 --players 2 """
+
+# Pygame
+import pygame
+# Standard library
+import argparse
+import os
+import random
+import time
+# NumPy
+import numpy
+# Game modules
+# ui_scenes has to be imported before the levels, as it imports them itself
+import ui_scenes
+import gameplay_items
+import game_input
+import game_random
+import level_loader
+import sound_bank
+import training_scene
+
+
+# Scenes that aren't campaign levels in levels/, by the name they are run with
+SCENES = {"boss_1": "boss_1.BossOne",
+          "boss_2": "boss_2.BossTwo"}
+
+# What TrainingSetupScene would pass with every option on. Index 13 (lives) is set when the scene is built
+TRAINING_CHOICES = [0, 10, 10, 0, 10, 10, 0, 10, 10, 0, 3, 10, 0, 3, 100]
+
+SETTINGS = {"sound_volume": 0, "music_volume": 0, "menu_music_playing": False, "level_music_playing": False,
+            "explosion_frame_step": 1}
+
+# Keys that move player 1, and the axis and direction each moves player 2 in
+MOVES = [(pygame.K_w, 1, -1), (pygame.K_s, 1, 1), (pygame.K_a, 0, -1), (pygame.K_d, 0, 1)]
+
+
+class ScriptedInput:
+    """ Plays both players. Each changes direction every move_every ticks and fires every fire_every
+    ticks. Directions are picked by the script's own random generator, so a run depends only on its seed.
+    It is also an input source (see game_input), so player 2 moves with a controller that isn't there. """
+    def __init__(self, seed, move_every=50, fire_every=30):
+        self.random = random.Random(seed)
+        self.move_every = move_every
+        self.fire_every = fire_every
+        self.axes = [0, 0]
+        self.key = None
+
+    def mouse_pos(self):
+        return 0, 0
+
+    def joystick_count(self):
+        return 1
+
+    def joystick_axis(self, axis):
+        return self.axes[axis]
+
+    def events(self, tick):
+        """ Returns the events for a tick, as the main loop would pass them to handle_events. """
+        events = []
+        if tick % self.move_every == 0:
+            if self.key is not None:
+                events.append(pygame.event.Event(pygame.KEYUP, key=self.key))
+            self.key = self.random.choice(MOVES)[0]
+            events.append(pygame.event.Event(pygame.KEYDOWN, key=self.key))
+
+            key, axis, direction = self.random.choice(MOVES)
+            self.axes = [0, 0]
+            self.axes[axis] = direction
+        if tick % self.fire_every == 0:
+            events.append(pygame.event.Event(pygame.KEYDOWN, key=pygame.K_SPACE))
+            events.append(pygame.event.Event(pygame.JOYBUTTONDOWN, button=1, joy=0, instance_id=0))
+        return events
+
+
+def start(window=False):
+    """ Starts Pygame, with SDL's dummy drivers unless a window is wanted. Images are converted for the
+    display when loaded, so there is always a screen, even if it is never shown. Returns the screen. """
+    # SDL reads these when Pygame starts. Its own SIGTERM handler would swallow the signal a process pool (or
+    # multiprocessing at exit) uses to stop worker processes, leaving them running
+    os.environ['SDL_NO_SIGNAL_HANDLERS'] = '1'
+    if window is False:
+        os.environ['SDL_VIDEODRIVER'] = 'dummy'
+        os.environ['SDL_AUDIODRIVER'] = 'dummy'
+    pygame.init()
+    screen = pygame.display.set_mode((1024, 768))
+    sound_bank.bank.load()
+    sound_bank.set_volume(SETTINGS["sound_volume"])
+    return screen
+
+
+def build_scene(name, settings, ship, ship_2, training_choices=None):
+    """ Builds a campaign level (E.g. "level_3"), "boss_1", "boss_2" or "training", with the lives a
+    new game would have. training_choices is the list TrainingSetupScene would build, by default
+    TRAINING_CHOICES. """
+    if ship_2 is None:
+        lives = 3
+    else:
+        lives = 2
+    if name == "training":
+        if training_choices is None:
+            training_choices = list(TRAINING_CHOICES)
+            training_choices[13] = lives
+        return training_scene.TrainingScene(settings, ship, ship_2, training_choices)
+    return level_loader.resolve(SCENES.get(name, name))(settings, ship, ship_2, 0, lives)
+
+
+def run(name, seed=0, frames=5000, players=1, training_choices=None):
+    """ Runs a scene for up to frames ticks, stopping early if it ends (E.g. the level is complete or the
+    game is over). Nothing is drawn. Returns a dict of results, including percentiles of how long each tick
+    took in milliseconds. """
+    game_random.seed(seed)
+    script = ScriptedInput(seed)
+    game_input.use(script)
+    ship = gameplay_items.PlayerShip()
+    ship_2 = None
+    if players == 2:
+        ship_2 = gameplay_items.PlayerShip()
+    scene = build_scene(name, dict(SETTINGS), ship, ship_2, training_choices)
+    starting_lives = scene.lives
+
+    tick = 0
+    tick_times = []
+    start_time = time.perf_counter()
+    tick_start = start_time
+    while tick < frames and scene.next_scene is scene:
+        scene.handle_events(script.events(tick))
+        scene.update()
+        tick += 1
+        tick_end = time.perf_counter()
+        tick_times.append(tick_end - tick_start)
+        tick_start = tick_end
+    seconds = time.perf_counter() - start_time
+    p50, p90, p99, slowest = numpy.percentile(numpy.array(tick_times or [0]) * 1000, (50, 90, 99, 100))
+
+    if scene.next_scene is scene:
+        ended = "frame limit"
+    else:
+        ended = type(scene.next_scene).__name__
+    return {"scene": name, "seed": seed, "players": players, "frames": tick, "seconds": seconds,
+            "fps": tick / max(seconds, 1e-9), "score": scene.score, "lives": scene.lives,
+            "deaths": starting_lives - scene.lives, "ended": ended, "p50_ms": p50, "p90_ms": p90, "p99_ms": p99,
+            "max_ms": slowest}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run an Asteroid Attack level headless, as fast as possible.")
+    parser.add_argument("scene", help="a campaign level (E.g. level_3), boss_1, boss_2 or training")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--frames", type=int, default=5000, help="most ticks to simulate")
+    parser.add_argument("--players", type=int, choices=(1, 2), default=1)
+    args = parser.parse_args()
+
+    start()
+    result = run(args.scene, args.seed, args.frames, args.players)
+    print("{0!s} (seed {1!s}, {2!s} player): {3!s} frames in {4:.2f}s, {5:.0f} frames per second".format(
+        result["scene"], result["seed"], result["players"], result["frames"], result["seconds"], result["fps"]))
+    print("Score: {0!s}  Lives: {1!s}  Ended: {2!s}".format(result["score"], result["lives"], result["ended"]))
+    print("Tick time: {0:.3f}ms median, {1:.3f}ms 99th percentile, {2:.3f}ms slowest".format(
+        result["p50_ms"], result["p99_ms"], result["max_ms"]))
+
+
+# Run if this file has not been imported
+if __name__ == "__main__":
+    main()
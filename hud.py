@@ -0,0 +1,51 @@
+""" Heads-up display text that stays rendered. Scores, health, laser charges etc. change only now and then,
+so rather than drawing every line of text every frame, the lines are composited onto a single panel surface
+that is only rebuilt when one of them changes. Lines are rendered through text_cache, so text that has been
+shown before isn't rendered again either. Drawing the HUD is then one blit. """
+
+# Pygame
+import pygame
+# Game modules
+import constants
+import text_cache
+
+
+class Hud:
+    """ Lines of text drawn over a scene, kept on one pre-blended panel. Each frame the scene passes every line
+    it wants shown, keyed by position, and the panel is only rebuilt when a line changes, appears or goes.
+    rect is where the panel is drawn (None when empty). """
+    def __init__(self, text_size, color=constants.WHITE):
+        self.text_size = text_size
+        self.color = color
+        self.shown = {}
+        self.panel = None
+        self.rect = None
+        self.rebuilds = 0
+
+    def update(self, lines):
+        """ Sets what the HUD says. lines is a dict of (x, y) to text. """
+        if lines != self.shown:
+            self.shown = dict(lines)
+            self.rebuild()
+
+    def rebuild(self):
+        """ Composites the shown lines onto the panel. Lines never overlap, so they are copied onto it as they
+        are (alpha included), which draws exactly the same as blitting each line onto the screen. """
+        self.rebuilds += 1
+        if len(self.shown) == 0:
+            self.panel = None
+            self.rect = None
+            return
+        renders = [text_cache.render(text, self.text_size, self.color) for text in self.shown.values()]
+        rects = [render.get_rect(topleft=position) for render, position in zip(renders, self.shown)]
+        self.rect = rects[0].unionall(rects[1:])
+        self.panel = pygame.Surface(self.rect.size, pygame.SRCALPHA)
+        for render, rect in zip(renders, rects):
+            self.panel.blit(render, (rect.x - self.rect.x, rect.y - self.rect.y), special_flags=pygame.BLEND_RGBA_MAX)
+
+    def draw(self, screen):
+        """ Draws the panel, returning how many blits that took (none if the HUD is empty). """
+        if self.panel is None:
+            return 0
+        screen.blit(self.panel, self.rect)
+        return 1
@@ -0,0 +1,144 @@
+""" Levels described by data rather than code. Each file in levels/ gives a level's background, the
+objects it starts with, how often new ones are spawned and which level comes next. A definition is read
+and compiled into a spawn timeline once, and DataLevel runs it. The next level is looked up by name only
+when the level is finished, so levels do not have to import each other. """
+
+# Standard library
+import functools
+import importlib
+import json
+import os
+# Game modules
+import asset_registry
+import game_scene
+import gameplay_items
+import scene_tools
+import ui_scenes
+
+
+# Where level definitions are kept, as <name>.json
+LEVEL_DIRECTORY = 'levels'
+
+# Sprite types a level can contain, and the names of the scene's sprite groups each is added to
+SPRITE_TYPES = {"BrownAsteroid": (gameplay_items.BrownAsteroid, ("asteroids",)),
+                "GreyAsteroid": (gameplay_items.GreyAsteroid, ("asteroids",)),
+                "MedAsteroid": (gameplay_items.MedAsteroid, ("asteroids",)),
+                "FragmentingAsteroid": (gameplay_items.FragmentingAsteroid, ("asteroids",)),
+                "StrongAsteroid": (gameplay_items.StrongAsteroid, ("asteroids",)),
+                "Alien": (gameplay_items.Alien, ("aliens",))}
+
+
+def level_path(name):
+    return "{0}/{1}.json".format(LEVEL_DIRECTORY, name)
+
+
+def check_type(name, sprite_type):
+    if sprite_type not in SPRITE_TYPES:
+        raise ValueError("Level {0} uses unknown sprite type {1}".format(name, sprite_type))
+    return sprite_type
+
+
+def compile_timeline(name, spawns, length):
+    """ Turns spawn rates into a tuple of (tick, sprite types) for every tick something is spawned on,
+    in tick order. Sprites due on the same tick keep the order they are listed in. """
+    ticks = {}
+    for spawn in spawns:
+        sprite_type = check_type(name, spawn["type"])
+        every = spawn["every"]
+        if every < 1:
+            raise ValueError("Level {0} spawns {1} every {2!s} ticks".format(name, sprite_type, every))
+        for tick in range(spawn.get("start", every), length, every):
+            ticks.setdefault(tick, []).append(sprite_type)
+    return tuple((tick, tuple(ticks[tick])) for tick in sorted(ticks))
+
+
+class LevelDefinition:
+    """ A compiled level file. length is in ticks, and pool_sizes overrides GameScene.pool_sizes. """
+    def __init__(self, name, data):
+        self.name = name
+        self.background = data["background"]
+        self.length = data.get("length", 5000)
+        self.next_level = data["next"]
+        self.pool_sizes = data.get("pools", {})
+        self.initial = tuple((check_type(name, item["type"]), item["count"]) for item in data.get("initial", []))
+        self.timeline = compile_timeline(name, data.get("spawns", []), self.length)
+
+
+# Definitions that have already been compiled, by name
+definitions = {}
+
+
+def load(name):
+    """ Returns the compiled definition of a level, reading it the first time it is asked for. """
+    definition = definitions.get(name)
+    if definition is None:
+        with open(level_path(name)) as f:
+            definition = LevelDefinition(name, json.load(f))
+        definitions[name] = definition
+    return definition
+
+
+def resolve(name):
+    """ Returns something that builds the named level when called with (settings, ship, ship_2, score,
+    lives). A name with a file in levels/ is a DataLevel, anything else is a module.Class path (E.g.
+    "boss_1.BossOne"). """
+    if os.path.exists(level_path(name)):
+        return functools.partial(DataLevel, level_name=name)
+    module_name, class_name = name.rsplit('.', 1)
+    return getattr(importlib.import_module(module_name), class_name)
+
+
+class DataLevel(game_scene.GameScene):
+    """ A level built from a definition in levels/. Subclasses only need to set level_name. """
+    level_name = None
+
+    def __init__(self, settings, ship, ship_2=None, score=0, lives=None, level_name=None):
+        if level_name is not None:
+            self.level_name = level_name
+        self.definition = load(self.level_name)
+
+        self.settings = settings
+        self.player = ship
+        # If there is only one player, self.player_2 = None
+        self.player_2 = ship_2
+        self.score = score
+        if lives is None:
+            if self.player_2 is None:
+                lives = 3
+            else:
+                lives = 2
+        self.lives = lives
+
+        self.pool_sizes = dict(game_scene.GameScene.pool_sizes, **self.definition.pool_sizes)
+        super().__init__(asset_registry.load_image(self.definition.background, alpha=False))
+        self.add_to_layer("hud", self.draw_text)
+
+        for sprite_type, count in self.definition.initial:
+            for i in range(count):
+                self.spawn(sprite_type)
+        for tick, sprite_types in self.definition.timeline:
+            self.scheduler.at(tick, self.spawn_all, sprite_types)
+
+        # Move on once the level is over
+        self.scheduler.at(self.definition.length, self.level_complete)
+
+    def spawn(self, sprite_type):
+        obj_class, group_names = SPRITE_TYPES[sprite_type]
+        groups = [getattr(self, group_name) for group_name in group_names]
+        scene_tools.spawn_falling_object(obj_class, *groups, argument=self)
+
+    def spawn_all(self, sprite_types):
+        for sprite_type in sprite_types:
+            self.spawn(sprite_type)
+
+    def handle_events(self, events):
+        super().handle_events(events)
+
+    def update(self):
+        super().update()
+        if self.lives == 0:
+            self.next_scene = ui_scenes.GameOverScene(self.score, "lose", self.player_2, self.settings)
+
+    def level_complete(self):
+        self.next_scene = ui_scenes.LevelCompleteScene(self.settings, self.player, self.player_2, self.score,
+                                                       self.lives, resolve(self.definition.next_level))
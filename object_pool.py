@@ -0,0 +1,53 @@
+""" Pools of reusable sprites. Lasers, explosions and asteroid fragments are created and destroyed many
+times a second, so rather than building a new sprite each time, a game scene keeps a pool of each and
+hands out one that has been killed and released back to it. """
+
+
+class ObjectPool:
+    """ Holds spare instances made by factory. acquire() hands one out, making a new one only if the pool
+    is empty, and calls its spawn() method with the given arguments. Pooled sprites give themselves back
+    with release() when they are killed. The high-water mark and misses show how big the pool needs to be
+    for a level. """
+    def __init__(self, factory, size=0):
+        self.factory = factory
+        self.free = []
+        self.created = 0
+        self.in_use = 0
+        self.high_water = 0
+        self.misses = 0
+
+        # Fill the pool up front, so the level does not allocate until it has used these up
+        for i in range(size):
+            self.free.append(self.new_object())
+
+    def new_object(self):
+        obj = self.factory()
+        obj.pool = self
+        obj.pooled = True
+        self.created += 1
+        return obj
+
+    def acquire(self, *args):
+        if len(self.free) > 0:
+            obj = self.free.pop()
+        else:
+            self.misses += 1
+            obj = self.new_object()
+        obj.pooled = False
+        self.in_use += 1
+        if self.in_use > self.high_water:
+            self.high_water = self.in_use
+        obj.spawn(*args)
+        return obj
+
+    def release(self, obj):
+        """ Returns an object to the pool. Releasing an object that is already in the pool does nothing, so
+        a sprite that is killed twice is not handed out twice. """
+        if obj.pooled is False:
+            obj.pooled = True
+            self.in_use -= 1
+            self.free.append(obj)
+
+    def stats(self):
+        return {"created": self.created, "free": len(self.free), "in_use": self.in_use,
+                "high_water": self.high_water, "misses": self.misses}
@@ -0,0 +1,56 @@
+""" Central ownership of every laser in flight. The game scene's projectile manager moves all lasers, and
+kills any that leave the screen or outlive an optional maximum lifetime, so lasers are always reclaimed
+no matter which ship fired them or whether it is still alive. """
+
+# Pygame
+import pygame
+
+
+class ProjectileManager:
+    """ Tracks player and enemy lasers. Player lasers are also kept in their ship's lasers_group (so the
+    scene knows whose laser hit what), and enemy lasers in enemy_lasers. A projectile is reclaimed once its
+    rect no longer touches bounds, or once it is max_lifetime ticks old if that is set. """
+    def __init__(self, bounds=pygame.Rect(-100, -100, 1024 + 200, 768 + 200), max_lifetime=None):
+        self.bounds = bounds
+        self.max_lifetime = max_lifetime
+
+        self.projectiles = pygame.sprite.Group()
+        self.enemy_lasers = pygame.sprite.Group()
+
+        # Counters, so leaks show up
+        self.fired = 0
+        self.left_screen = 0
+        self.expired = 0
+
+    def __len__(self):
+        return len(self.projectiles)
+
+    def add(self, projectile, group):
+        """ Starts tracking a newly fired projectile, also adding it to its owner's group. """
+        projectile.age = 0
+        self.projectiles.add(projectile)
+        group.add(projectile)
+        self.fired += 1
+
+    def add_enemy_laser(self, laser):
+        self.add(laser, self.enemy_lasers)
+
+    def update(self):
+        """ Moves every projectile, then kills those that are off screen or too old. """
+        self.projectiles.update()
+        for projectile in self.projectiles:
+            projectile.age += 1
+            if not self.bounds.colliderect(projectile.rect):
+                self.left_screen += 1
+                projectile.kill()
+            elif self.max_lifetime is not None and projectile.age > self.max_lifetime:
+                self.expired += 1
+                projectile.kill()
+
+    def clear_enemy_lasers(self):
+        for laser in self.enemy_lasers:
+            laser.kill()
+
+    def stats(self):
+        return {"live": len(self.projectiles), "enemy_lasers": len(self.enemy_lasers), "fired": self.fired,
+                "left_screen": self.left_screen, "expired": self.expired}
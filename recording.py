@@ -0,0 +1,137 @@
+""" Recording and replaying play sessions. While recording, the main loop stores every frame's input: the
+events it passed to the scene, how many ticks it ran, and the mouse and controller state scenes read. As
+the session's random generator is seeded from the recording too, playing it back repeats the session
+exactly, either in real time or as fast as possible without a window (to time it). E.g.
+
+    python asteroid_attack.py --record session.replay
+    python recording.py session.replay --fast """
+
+# Pygame
+import pygame
+# Standard library
+import argparse
+import os
+import pickle
+import time
+
+
+# Event attributes of these types are saved. Others (E.g. window objects) can't be, and the game doesn't read
+# them anyway
+SAVED_TYPES = (int, float, str, bool, tuple, type(None))
+
+
+class Frame:
+    """ The input for one frame of the main loop. seconds is how long the frame took when it was recorded,
+    so hitches can be found. """
+    def __init__(self, events, ticks, mouse_pos, joystick_count, joystick_axes, seconds):
+        self.events = events
+        self.ticks = ticks
+        self.mouse_pos = mouse_pos
+        self.joystick_count = joystick_count
+        self.joystick_axes = joystick_axes
+        self.seconds = seconds
+
+
+class Recording:
+    """ A whole session. seed is what game_random was seeded with, and sim_rate the ticks per second. """
+    def __init__(self, seed, sim_rate):
+        self.seed = seed
+        self.sim_rate = sim_rate
+        self.frames = []
+
+    def ticks(self):
+        return sum(frame.ticks for frame in self.frames)
+
+    def slowest_frames(self, count=5):
+        """ Returns (frame number, frame) for the slowest frames, slowest first. """
+        return sorted(enumerate(self.frames), key=lambda item: item[1].seconds, reverse=True)[:count]
+
+    def save(self, path):
+        with open(path, 'wb') as f:
+            pickle.dump(self, f)
+
+
+def load(path):
+    with open(path, 'rb') as f:
+        return pickle.load(f)
+
+
+def saved_event(event):
+    """ An event as a (type, attributes) pair that can be pickled. """
+    return event.type, {name: value for name, value in event.dict.items() if isinstance(value, SAVED_TYPES)}
+
+
+class Recorder:
+    """ Builds a recording a frame at a time, reading the mouse and controller from source (E.g. the live
+    input) as the scene saw them. """
+    def __init__(self, seed, sim_rate, source):
+        self.recording = Recording(seed, sim_rate)
+        self.source = source
+
+    def record(self, events, ticks, seconds):
+        source = self.source
+        self.recording.frames.append(Frame([saved_event(event) for event in events], ticks, source.mouse_pos(),
+                                           source.joystick_count(),
+                                           (source.joystick_axis(0), source.joystick_axis(1)), seconds))
+
+
+class Player:
+    """ An input source (see game_input) that plays a recording back. The main loop calls next_frame() at the
+    start of each frame, and runs the events and number of ticks it returns. Until then (E.g. while the
+    first scene is built), the mouse and controller are as they were in the first frame. """
+    def __init__(self, recording):
+        self.recording = recording
+        self.frame_number = -1
+        self.frame = None
+        if len(recording.frames) > 0:
+            self.frame = recording.frames[0]
+
+    def next_frame(self):
+        """ Moves on to the next frame, returning it, or None at the end of the recording. """
+        self.frame_number += 1
+        if self.frame_number >= len(self.recording.frames):
+            return None
+        self.frame = self.recording.frames[self.frame_number]
+        return self.frame
+
+    def events(self):
+        return [pygame.event.Event(event_type, attributes) for event_type, attributes in self.frame.events]
+
+    def mouse_pos(self):
+        return self.frame.mouse_pos
+
+    def joystick_count(self):
+        return self.frame.joystick_count
+
+    def joystick_axis(self, axis):
+        return self.frame.joystick_axes[axis]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Replay a recorded Asteroid Attack session.")
+    parser.add_argument("path", help="a recording made with asteroid_attack.py --record")
+    parser.add_argument("--fast", action="store_true", help="replay without a window, as fast as possible")
+    args = parser.parse_args()
+
+    recording = load(args.path)
+    if args.fast is True:
+        # SDL reads these when Pygame starts
+        os.environ['SDL_VIDEODRIVER'] = 'dummy'
+        os.environ['SDL_AUDIODRIVER'] = 'dummy'
+    # Imported here, as asteroid_attack imports this module
+    import asteroid_attack
+
+    start_time = time.perf_counter()
+    asteroid_attack.main(replay=recording, draw=not args.fast)
+    seconds = time.perf_counter() - start_time
+
+    print("Replayed {0!s} frames ({1!s} ticks) in {2:.2f}s".format(len(recording.frames), recording.ticks(),
+                                                                    seconds))
+    print("Slowest frames when recorded:")
+    for frame_number, frame in recording.slowest_frames():
+        print("  Frame {0!s}: {1:.1f}ms, {2!s} ticks".format(frame_number, frame.seconds * 1000, frame.ticks))
+
+
+# Run if this file has not been imported
+if __name__ == "__main__":
+    main()
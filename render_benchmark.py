@@ -0,0 +1,89 @@
+""" Times drawing the busiest scenes with and without batched sprite rendering (see sprite_batch), and counts
+the blit calls each makes. Each scene is played by headless.ScriptedInput with the same seed both ways, and a
+frame is drawn after every tick onto an off-screen surface. E.g.
+
+    python render_benchmark.py --scenes level_8 boss_1 boss_2 --frames 2000 """
+
+# Pygame
+import pygame
+# Standard library
+import argparse
+import time
+# Game modules
+import headless
+import game_input
+import game_random
+import game_scene
+import gameplay_items
+
+
+class CountingSurface(pygame.Surface):
+    """ A screen sized surface that counts the blit and blits calls made on it, and the surfaces blitted. """
+    def __init__(self):
+        super().__init__((1024, 768))
+        self.calls = 0
+        self.blitted = 0
+
+    def blit(self, source, dest, area=None, special_flags=0):
+        self.calls += 1
+        self.blitted += 1
+        return super().blit(source, dest, area, special_flags)
+
+    def blits(self, blit_sequence, doreturn=1):
+        # Sprite groups pass a generator
+        blit_sequence = list(blit_sequence)
+        self.calls += 1
+        self.blitted += len(blit_sequence)
+        return super().blits(blit_sequence, doreturn)
+
+
+def run(name, batch, seed=0, frames=2000):
+    """ Plays a scene for up to frames ticks, drawing each one. Returns the mean draw time in milliseconds,
+    and the mean blit calls and surfaces blitted per frame. """
+    game_scene.GameScene.batch_rendering = batch
+    game_random.seed(seed)
+    script = headless.ScriptedInput(seed)
+    game_input.use(script)
+    scene = headless.build_scene(name, dict(headless.SETTINGS), gameplay_items.PlayerShip(), None)
+    surface = CountingSurface()
+
+    tick = 0
+    seconds = 0
+    while tick < frames and scene.next_scene is scene:
+        scene.handle_events(script.events(tick))
+        scene.update()
+        start_time = time.perf_counter()
+        scene.draw_frame(surface, 1)
+        seconds += time.perf_counter() - start_time
+        tick += 1
+    tick = max(tick, 1)
+    return {"frames": tick, "draw_ms": seconds / tick * 1000, "calls": surface.calls / tick,
+            "blitted": surface.blitted / tick}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare drawing Asteroid Attack scenes with and without "
+                                                 "batched sprite rendering.")
+    parser.add_argument("--scenes", nargs="+", default=["level_8", "boss_1", "boss_2"],
+                        help="campaign levels (E.g. level_3), boss_1, boss_2 or training")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--frames", type=int, default=2000, help="most ticks to play and draw")
+    args = parser.parse_args()
+
+    headless.start()
+    print("{0:<10} {1:>9} {2:>12} {3:>14} {4:>10}".format("scene", "rendering", "draw ms", "blit calls",
+                                                          "blitted"))
+    for name in args.scenes:
+        for batch in (False, True):
+            result = run(name, batch, args.seed, args.frames)
+            if batch is True:
+                rendering = "batched"
+            else:
+                rendering = "by group"
+            print("{0:<10} {1:>9} {2:>12.3f} {3:>14.1f} {4:>10.1f}".format(name, rendering, result["draw_ms"],
+                                                                         result["calls"], result["blitted"]))
+
+
+# Run if this file has not been imported
+if __name__ == "__main__":
+    main()
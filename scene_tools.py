@@ -1,21 +1,17 @@
 """ Helper functions, useful when creating scenes."""
 
-# Pygame
-import pygame
-# Standard library
-import random
 # Game modules
 import gameplay_items
+import game_random
+import text_cache
 
 
 def multiline_text(text_list, x, y, screen, color, size):
     """ Accepts a list of text and draws each item on a new line. """
     spacing = 10
-    font = pygame.font.Font(None, size)
     for line in text_list:
-        size = font.size(line)
-        line_height = size[1]
-        render = font.render(line, True, color)
+        render = text_cache.render(line, size, color)
+        line_height = render.get_height()
         screen.blit(render, (x, y))
         y += line_height
         y += spacing
@@ -25,34 +21,30 @@ def initial_falling_objects(count, obj_class, container_1, container_2=None, con
                             min_y=-2000, max_y=-200, argument=None):
     """ Creates a given number of existing sprite objects, and adds them to sprite groups. """
     for i in range(count):
-        if argument is None:
-            funcobj = obj_class()
-        else:
-            funcobj = obj_class(argument)
-        funcobj.rect.x = random.randrange(0, 1024)
-        funcobj.rect.y = random.randrange(min_y, max_y)
-        container_1.add(funcobj)
-        if container_2 is not None:
-            container_2.add(funcobj)
-        if container_3 is not None:
-            container_3.add(funcobj)
+        spawn_falling_object(obj_class, container_1, container_2, container_3, min_y, max_y, argument)
 
 
-def add_falling_object(timer, time, obj_class, container_1, container_2=None,
-                       container_3=None, min_x=-2000, max_x = -200, argument=None):
-    """ Creates a given existing sprite every x time and adds it to sprite groups. """
-    if timer % time == 0:
-        if argument is None:
-            funcobj = obj_class()
-        else:
-            funcobj = obj_class(argument)
-        funcobj.rect.x = random.randrange(0, 1024)
-        funcobj.rect.y = random.randrange(min_x, max_x)
-        container_1.add(funcobj)
-        if container_2 is not None:
-            container_2.add(funcobj)
-        if container_3 is not None:
-            container_3.add(funcobj)
+def spawn_falling_object(obj_class, container_1, container_2=None, container_3=None, min_y=-2000, max_y=-200,
+                         argument=None):
+    """ Creates a given existing sprite somewhere above the screen and adds it to sprite groups. """
+    if argument is None:
+        funcobj = obj_class()
+    else:
+        funcobj = obj_class(argument)
+    funcobj.rect.x = game_random.randrange(0, 1024)
+    funcobj.rect.y = game_random.randrange(min_y, max_y)
+    container_1.add(funcobj)
+    if container_2 is not None:
+        container_2.add(funcobj)
+    if container_3 is not None:
+        container_3.add(funcobj)
+
+
+def schedule_falling_object(scheduler, time, obj_class, container_1, container_2=None, container_3=None,
+                            min_y=-2000, max_y=-200, argument=None, jitter=0):
+    """ Registers a spawn of a given existing sprite every time ticks with a scene's scheduler. """
+    return scheduler.every(time, spawn_falling_object, obj_class, container_1, container_2, container_3, min_y,
+                           max_y, argument, jitter=jitter)
 
 
 def death_scene_reset(groups, player, player_2):
@@ -60,9 +52,9 @@ def death_scene_reset(groups, player, player_2):
     scene after death. """
     for group in groups:
         for sprite in group:
-            sprite.rect.y -= 1000
+            sprite.rect = sprite.rect.move(0, -1000)
 
-    x = random.randrange(200, 800)
+    x = game_random.randrange(200, 800)
     player.update_pos(x, 600)
     player.speed_boosted = False
 
@@ -0,0 +1,80 @@
+""" A priority queue of timed game events. Levels register recurring spawns and one-shot events (E.g. the
+end of the level) against the game scene's tick counter, and each tick only the events that are due are
+popped, so the cost depends on how many events fire rather than how many are registered. """
+
+# Standard library
+import heapq
+import random
+# Game modules
+import game_random
+
+
+class Event:
+    """ A registered action. interval is None for one-shot events. """
+    def __init__(self, order, tick, action, args, interval=None, jitter=0):
+        self.order = order
+        self.tick = tick
+        self.action = action
+        self.args = args
+        self.interval = interval
+        self.jitter = jitter
+        self.cancelled = False
+
+
+class Scheduler:
+    """ Runs actions at given ticks. Events due on the same tick run in the order they were registered.
+    Recurring events can have their interval jittered by up to +/- jitter ticks, using the scheduler's own
+    random generator. Pass a seed to make jitter repeatable, otherwise it is seeded from the session's
+    generator in game_random (so seeding that is enough). """
+    def __init__(self, seed=None):
+        if seed is None:
+            seed = game_random.getrandbits(64)
+        self.random = random.Random(seed)
+        self.queue = []
+        self.registered = 0
+        self.fired = 0
+
+    def __len__(self):
+        return len(self.queue)
+
+    def add(self, event):
+        heapq.heappush(self.queue, (event.tick, event.order, event))
+        return event
+
+    def at(self, tick, action, *args):
+        """ Runs action(*args) once, on the given tick. """
+        self.registered += 1
+        return self.add(Event(self.registered, tick, action, args))
+
+    def every(self, interval, action, *args, jitter=0, start=None):
+        """ Runs action(*args) every interval ticks. The first run is on tick start, or after one interval
+        if start is not given. """
+        self.registered += 1
+        if start is None:
+            start = self.next_tick(0, interval, jitter)
+        return self.add(Event(self.registered, start, action, args, interval, jitter))
+
+    def cancel(self, event):
+        """ Stops an event from running again. It is dropped from the queue when it next comes up. """
+        event.cancelled = True
+
+    def next_tick(self, tick, interval, jitter):
+        if jitter > 0:
+            interval += self.random.randint(-jitter, jitter)
+        return tick + max(interval, 1)
+
+    def run(self, tick):
+        """ Runs every event due on or before tick, re-queueing recurring ones. Returns how many ran. """
+        count = 0
+        queue = self.queue
+        while len(queue) > 0 and queue[0][0] <= tick:
+            due, order, event = heapq.heappop(queue)
+            if event.cancelled is True:
+                continue
+            if event.interval is not None:
+                event.tick = self.next_tick(due, event.interval, event.jitter)
+                self.add(event)
+            event.action(*event.args)
+            count += 1
+        self.fired += count
+        return count
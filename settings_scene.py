@@ -7,6 +7,8 @@ import generic_scene
 import ui_items
 import constants
 import ui_scenes
+import sound_bank
+import game_input
 # Standard library
 import pickle
 
@@ -22,8 +24,7 @@ class SettingsScene(generic_scene.GenericScene):
         self.return_button = ui_items.RectangleHoverButton("Return", 300, 90, 362, 640, constants.LIGHT_GREY,
                                                            constants.DARK_GREY)
         self.buttons = [self.return_button]
-        self.button_sound = pygame.mixer.Sound('music/button.ogg')
-        self.button_sound.set_volume(self.settings['sound_volume'] / 100)
+        self.button_sound = sound_bank.get("button")
 
         # Text
         self.header_font = pygame.font.Font(None, 45)
@@ -50,9 +51,8 @@ class SettingsScene(generic_scene.GenericScene):
                     self.next_scene = ui_scenes.TitleScene(self.settings)
 
     def update(self):
-        self.button_sound.set_volume(self.settings['sound_volume'] / 100)
         for button in self.buttons:
-            button.mouse_on_button(pygame.mouse.get_pos())
+            button.mouse_on_button(game_input.mouse_pos())
 
         for slider in self.sliders:
             slider.update()
@@ -74,6 +74,7 @@ class SettingsScene(generic_scene.GenericScene):
     def save_settings(self):
         self.settings["sound_volume"] = self.sound_slider.value
         self.settings["music_volume"] = self.music_slider.value
+        sound_bank.set_volume(self.settings["sound_volume"])
         f = open('asteroid-attack-program-settings.p', 'wb')
         pickle.dump(self.settings, f)
         f.close()
\ No newline at end of file
@@ -0,0 +1,68 @@
+""" A shared bank of sound effects. Every effect is decoded once and the same pygame Sound is played
+by every sprite or scene that needs it, with the sound effect volume set in one place. """
+
+# Pygame
+import pygame
+
+
+# Effect names and the files they are decoded from
+EFFECTS = {"alarm": 'music/alarm.wav',
+           "alien_laser": 'music/laser_alien.ogg',
+           "button": 'music/button.ogg',
+           "ending_beep": 'music/zap.ogg',
+           "explosion": 'music/explosion.wav',
+           "laser": 'music/laser.ogg',
+           "powerup": 'music/bonus.wav',
+           "star": 'music/coin.ogg'}
+
+
+class SoundBank:
+    """ Holds one decoded pygame Sound per effect. A Sound can be played on several channels at once, so
+    overlapping explosions or lasers share the same decoded buffer. """
+    def __init__(self, effects):
+        self.effects = effects
+        self.sounds = {}
+        # Stored as a 0 - 1 multiplier, as pygame expects
+        self.volume = 1.0
+
+    def load(self):
+        """ Decodes every effect that has not been loaded yet. Called once at startup. """
+        for name in self.effects:
+            self.get(name)
+
+    def get(self, name):
+        """ Returns the shared Sound for an effect, decoding it first if needed. """
+        sound = self.sounds.get(name)
+        if sound is None:
+            sound = pygame.mixer.Sound(self.effects[name])
+            sound.set_volume(self.volume)
+            self.sounds[name] = sound
+        return sound
+
+    def play(self, name):
+        self.get(name).play()
+
+    def set_volume(self, volume):
+        """ Applies a sound volume setting (0 - 100) to every effect in the bank. """
+        self.volume = volume / 100
+        for sound in self.sounds.values():
+            sound.set_volume(self.volume)
+
+
+# The bank shared by the whole game
+bank = SoundBank(EFFECTS)
+
+
+def get(name):
+    """ Returns the shared Sound for the named effect. """
+    return bank.get(name)
+
+
+def play(name):
+    """ Plays the named effect at the current sound volume. """
+    bank.play(name)
+
+
+def set_volume(volume):
+    """ Sets the volume (0 - 100) of every sound effect. """
+    bank.set_volume(volume)
@@ -0,0 +1,70 @@
+""" A uniform grid (spatial hash) used as the broadphase for collision detection. The game scene rebuilds
+it once per tick, after movement, and collision checks only run pixel-perfect mask tests against sprites
+that share a grid cell, rather than against every member of a sprite group. """
+
+# Pygame
+import pygame
+
+
+class SpatialHash:
+    """ Buckets sprites into square cells by their rect. Sprites are stored in named layers (E.g.
+    "asteroids", "aliens") so a query only returns the kind of sprite being checked against. Anything
+    entirely outside bounds is left out, since nothing that can collide with it is ever there. """
+    def __init__(self, cell_size=128, bounds=pygame.Rect(-128, -128, 1024 + 256, 768 + 256)):
+        self.cell_size = cell_size
+        self.bounds = bounds
+        self.cells = {}
+
+        # Counters, so the saving over checking every sprite can be seen
+        self.sprites_indexed = 0
+        self.queries = 0
+        self.candidates_returned = 0
+
+    def rebuild(self, layers, placed=()):
+        """ Empties the grid and refills it. layers is a dict of layer name: iterable of sprites. placed is an
+        iterable of (layer name, sprite, rect) for sprites whose rects are already known, E.g. read in bulk
+        from an entity store, so sprite.rect isn't read for them. """
+        self.cells = {}
+        self.sprites_indexed = 0
+        for layer, sprites in layers.items():
+            for sprite in sprites:
+                self.insert(layer, sprite, sprite.rect)
+        for layer, sprite, rect in placed:
+            self.insert(layer, sprite, rect)
+
+    def insert(self, layer, sprite, rect):
+        """ Adds a sprite to every cell its rect touches, unless it is outside bounds. """
+        if not self.bounds.colliderect(rect):
+            return
+        self.sprites_indexed += 1
+        cell_size = self.cell_size
+        for cell_x in range(rect.left // cell_size, (rect.right - 1) // cell_size + 1):
+            for cell_y in range(rect.top // cell_size, (rect.bottom - 1) // cell_size + 1):
+                key = (layer, cell_x, cell_y)
+                cell = self.cells.get(key)
+                if cell is None:
+                    self.cells[key] = [sprite]
+                else:
+                    cell.append(sprite)
+
+    def query(self, rect, layer, margin=0):
+        """ Returns the live sprites in a layer that share a cell with rect, each once. margin grows the
+        area searched. """
+        self.queries += 1
+        area = rect.inflate(margin * 2, margin * 2)
+        cell_size = self.cell_size
+        found = {}
+        for cell_x in range(area.left // cell_size, (area.right - 1) // cell_size + 1):
+            for cell_y in range(area.top // cell_size, (area.bottom - 1) // cell_size + 1):
+                cell = self.cells.get((layer, cell_x, cell_y))
+                if cell is not None:
+                    for sprite in cell:
+                        found[sprite] = True
+        # Sprites killed earlier in the tick are still in the grid, so leave them out
+        candidates = [sprite for sprite in found if sprite.alive()]
+        self.candidates_returned += len(candidates)
+        return candidates
+
+    def reset_stats(self):
+        self.queries = 0
+        self.candidates_returned = 0
@@ -0,0 +1,54 @@
+""" Batched blitting. Rather than each sprite group making its own pass over the screen, the sprites (and any
+other surfaces) to be drawn are queued up in draw order and sent in a single Surface.blits call, with
+anything entirely off the screen left out. Most falling objects wait above the screen until it is their turn,
+so this also skips most of what is in a level's groups. """
+
+# Pygame
+import pygame
+
+
+SCREEN = pygame.Rect(0, 0, 1024, 768)
+
+
+class SpriteBatch:
+    """ Blits queued up until flush() sends them all to a surface at once. Sprites entirely outside bounds
+    are not queued. Counters show how many blits calls were made, and how many surfaces were blitted and
+    skipped. """
+    def __init__(self, bounds=SCREEN):
+        self.bounds = bounds
+        self.queue = []
+
+        self.calls = 0
+        self.blitted = 0
+        self.skipped = 0
+
+    def add_sprites(self, group):
+        """ Queues every sprite in a group that is at least partly within bounds, in the group's order.
+        Returns how many were queued. """
+        sprites = group.sprites()
+        rects = [sprite.rect for sprite in sprites]
+        visible = self.bounds.collidelistall(rects)
+        self.queue.extend((sprites[i].image, rects[i]) for i in visible)
+        self.skipped += len(sprites) - len(visible)
+        return len(visible)
+
+    def add(self, blits):
+        """ Queues a list of (surface, position) pairs, as Surface.blits takes. Returns how many there were. """
+        self.queue.extend(blits)
+        return len(blits)
+
+    def flush(self, surface):
+        """ Blits everything queued onto surface, in the order it was queued. """
+        if len(self.queue) > 0:
+            surface.blits(self.queue, False)
+            self.calls += 1
+            self.blitted += len(self.queue)
+            self.queue = []
+
+    def stats(self):
+        return {"calls": self.calls, "blitted": self.blitted, "skipped": self.skipped}
+
+    def reset_stats(self):
+        self.calls = 0
+        self.blitted = 0
+        self.skipped = 0
@@ -0,0 +1,113 @@
+""" Layers of small dots that move down the screen over the background, at different speeds to give an
+illusion of depth. Star positions, speeds and looks live in NumPy arrays and the whole layer is moved with a
+single vectorised step each tick. Each star is drawn by blitting a pre-rendered dot (a stamp) of its size and
+colour, with all of a layer's stamps going to the screen in one Surface.blits call, so a layer of thousands
+of stars costs little more than one of tens. """
+
+# Pygame
+import pygame
+# NumPy
+import numpy
+# Game modules
+import game_random
+import entity_store
+
+
+SCREEN_WIDTH = 1024
+SCREEN_HEIGHT = 768
+# How many different star colours a layer has. Each star is given one of them
+PALETTE_SIZE = 16
+
+
+def stamp(color, radius):
+    """ A dot the size of pygame.draw.circle(screen, color, center, radius), with a black colorkey. """
+    surface = pygame.Surface((radius * 2 + 1, radius * 2 + 1))
+    pygame.draw.circle(surface, color, (radius, radius), radius)
+    surface.set_colorkey((0, 0, 0), pygame.RLEACCEL)
+    return surface
+
+
+class Starfield:
+    """ count stars, each with a colour picked from the given channel ranges (a randrange style [min, max) for
+    red, green and blue), a radius from sizes and a speed from speeds. Stars start anywhere on the screen, and
+    once one falls off the bottom it is sent back just above the top at a new x. """
+    def __init__(self, count, reds=(230, 255), greens=(230, 255), blues=(230, 255), sizes=(1, 3), speeds=(1, 4)):
+        self.rng = numpy.random.default_rng(game_random.getrandbits(64))
+        self.count = count
+        self.x = self.rng.integers(0, SCREEN_WIDTH, count, numpy.int32)
+        self.y = self.rng.integers(0, SCREEN_HEIGHT, count, numpy.int32)
+        # Position before the last step, for drawing between ticks
+        self.previous_y = self.y.copy()
+        self.speed = self.rng.integers(*speeds, count, numpy.int32)
+        self.radius = self.rng.integers(*sizes, count, numpy.int32)
+        self.color_index = self.rng.integers(0, PALETTE_SIZE, count, numpy.int32)
+        self.sizes = sizes
+        self.palette = [tuple(int(self.rng.integers(*channel)) for channel in (reds, greens, blues))
+                        for i in range(PALETTE_SIZE)]
+        self.stamps = None
+        self.make_stamps()
+
+    def make_stamps(self):
+        """ Renders a stamp for every colour and size, and picks out each star's. """
+        stamps = []
+        for color in self.palette:
+            stamps.extend(stamp(color, radius) for radius in range(self.sizes[0], self.sizes[1]))
+        size_count = self.sizes[1] - self.sizes[0]
+        # Stamps are looked up for every star at once, so they are kept in an object array
+        self.stamps = numpy.empty(len(stamps), object)
+        for i, surface in enumerate(stamps):
+            self.stamps[i] = surface
+        self.stamp_index = self.color_index * size_count + (self.radius - self.sizes[0])
+
+    def set_color(self, color):
+        """ Makes every star the same colour, E.g. to fit a scene's theme. """
+        self.palette = [color] * PALETTE_SIZE
+        self.make_stamps()
+
+    def step(self):
+        self.previous_y = self.y.copy()
+        self.y += self.speed
+        fallen = self.y > SCREEN_HEIGHT
+        count = int(numpy.count_nonzero(fallen))
+        if count > 0:
+            self.y[fallen] = self.rng.integers(-100, 0, count, numpy.int32)
+            self.x[fallen] = self.rng.integers(0, SCREEN_WIDTH, count, numpy.int32)
+
+    def interpolate(self, alpha):
+        """ Moves every star alpha (0 to 1) of the way from where it was before the last step to where it is
+        now, leaving stars that were sent back to the top where they are. Returns the real positions, to be put
+        back with restore() once drawing is done. """
+        real = self.y
+        moved = self.y - self.previous_y
+        smoothed = self.previous_y + numpy.rint(moved * alpha).astype(numpy.int32)
+        self.y = numpy.where(numpy.abs(moved) > entity_store.TELEPORT_DISTANCE, self.y, smoothed)
+        return real
+
+    def restore(self, real):
+        self.y = real
+
+    def visible(self):
+        """ Indexes of the stars that are at least partly on the screen. """
+        radius = self.radius
+        return numpy.flatnonzero((self.y + radius >= 0) & (self.y - radius < SCREEN_HEIGHT))
+
+    def rects(self):
+        """ The area each star on the screen covers. """
+        visible = self.visible()
+        radius = self.radius[visible]
+        sides = (radius * 2 + 1).tolist()
+        return [pygame.Rect(x, y, side, side) for x, y, side in zip((self.x[visible] - radius).tolist(),
+                                                                   (self.y[visible] - radius).tolist(), sides)]
+
+    def blit_sequence(self):
+        """ A (stamp, position) pair for every star on the screen, for Surface.blits. """
+        visible = self.visible()
+        radius = self.radius[visible]
+        positions = zip((self.x[visible] - radius).tolist(), (self.y[visible] - radius).tolist())
+        return list(zip(self.stamps[self.stamp_index[visible]].tolist(), positions))
+
+    def draw(self, screen):
+        """ Draws every star on the screen, returning how many that was. """
+        sequence = self.blit_sequence()
+        screen.blits(sequence, False)
+        return len(sequence)
@@ -1,24 +1,27 @@
 """ A level for testing. """
 
-# Pygame
-import pygame
 # Game modules
+import asset_registry
 import game_scene
 import ui_scenes
 
 
 
 class TestLevel(game_scene.GameScene):
-    def __init__(self, ship):
+    def __init__(self, ship, settings):
+        self.settings = settings
         self.player = ship
-        super().__init__(pygame.image.load('assets/black_stars.png').convert())
+        self.player_2 = None
+        self.score = 0
+        self.lives = 3
+        super().__init__(asset_registry.load_image('assets/black_stars.png', alpha=False))
 
     def handle_events(self, events):
         super().handle_events(events)
 
     def update(self):
         super().update()
-        self.next_scene = ui_scenes.TitleScene()
+        self.next_scene = ui_scenes.TitleScene(self.settings)
 
     def draw(self, screen):
         super().draw(screen)
\ No newline at end of file
@@ -0,0 +1,28 @@
+""" Shared test setup. The game's modules sit at the top of the repository and load assets by paths relative
+to it, so the tests import and run from there, with Pygame started on SDL's dummy drivers. """
+
+# Standard library
+import os
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+os.chdir(ROOT)
+
+# Pytest
+import pytest
+# Game modules
+# headless imports ui_scenes before anything that imports a level
+import headless
+import game_random
+
+
+@pytest.fixture(scope="session", autouse=True)
+def pygame_started():
+    return headless.start()
+
+
+@pytest.fixture(autouse=True)
+def seeded():
+    """ Every test starts from the same session seed, so anything random is repeatable. """
+    game_random.seed(0)
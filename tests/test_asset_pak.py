@@ -0,0 +1,31 @@
+""" Tests for the memory-mapped pak archive. """
+
+# Pygame
+import pygame
+# Game modules
+import asset_pak
+
+
+def test_drawing_on_a_pak_image_leaves_the_file_alone(tmp_path):
+    path = str(tmp_path / "test.pak")
+    asset_pak.build(path, 'assets/explosion')
+    with open(path, 'rb') as f:
+        written = f.read()
+
+    pak = asset_pak.PakFile(path)
+    assert pak.open() is True
+    image_path = sorted(pak.entries)[0]
+    original = pygame.image.tobytes(pak.image(image_path), "RGBA")
+    image = pak.image(image_path)
+    image.fill((255, 0, 0, 255))
+    image.blit(pygame.Surface((4, 4)), (0, 0))
+    # The mapping can only be closed once no surfaces on it remain
+    del image
+    pak.close()
+
+    with open(path, 'rb') as f:
+        assert f.read() == written
+    reopened = asset_pak.PakFile(path)
+    reopened.open()
+    assert pygame.image.tobytes(reopened.image(image_path), "RGBA") == original
+    reopened.close()
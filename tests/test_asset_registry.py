@@ -0,0 +1,36 @@
+""" Tests for the shared image and mask registry. """
+
+# Pygame
+import pygame
+# Game modules
+import asset_registry
+import game_input
+import gameplay_items
+import headless
+
+
+def test_scenes_never_draw_on_registry_images():
+    """ Registry images are shared, and may be atlas subsurfaces or sit on the mapped pak file, so playing
+    and drawing every kind of scene must leave them exactly as they were loaded. """
+    screen = pygame.Surface((1024, 768))
+    script = headless.ScriptedInput(0)
+    game_input.use(script)
+    try:
+        for name in ("level_8", "boss_1", "boss_2", "training"):
+            scene = headless.build_scene(name, dict(headless.SETTINGS), gameplay_items.PlayerShip(), None)
+            for tick in range(300):
+                scene.handle_events(script.events(tick))
+                scene.update()
+                scene.draw_frame(screen, 0.5)
+    finally:
+        game_input.use(game_input.LiveInput())
+
+    registry = asset_registry.registry
+    for (path, alpha, angle), surface in registry.images.items():
+        if angle != 0:
+            continue
+        if alpha is True:
+            loaded = pygame.image.load(path).convert_alpha()
+        else:
+            loaded = pygame.image.load(path).convert()
+        assert pygame.image.tobytes(surface, "RGBA") == pygame.image.tobytes(loaded, "RGBA"), path
@@ -0,0 +1,154 @@
+""" Tests for the entity store that falling objects live in. """
+
+# Standard library
+import types
+# Pygame
+import pygame
+# Game modules
+import entity_store
+import game_random
+import gameplay_items
+
+
+IMAGE = pygame.Surface((10, 20))
+
+
+def make_scene():
+    """ Just enough of a game scene for falling objects to be made in. """
+    return types.SimpleNamespace(falling_objects=entity_store.EntityStore())
+
+
+def test_changing_rect_in_place_moves_the_object():
+    scene = make_scene()
+    store = scene.falling_objects
+    asteroid = gameplay_items.BrownAsteroid(scene)
+    index = asteroid.store_index
+
+    asteroid.update_pos(100, 200)
+    assert (store.x[index], store.y[index]) == (100, 200)
+    asteroid.rect.x = 150
+    asteroid.rect.y += 10
+    assert (store.x[index], store.y[index]) == (150, 210)
+    asteroid.rect.move_ip(-50, 40)
+    assert (store.x[index], store.y[index]) == (100, 250)
+    asteroid.rect.topleft = (5, 6)
+    assert (store.x[index], store.y[index]) == (5, 6)
+    asteroid.rect[0] = 7
+    assert store.x[index] == 7
+    asteroid.rect = asteroid.rect.move(1, 1)
+    assert (store.x[index], store.y[index]) == (8, 7)
+    assert asteroid.rect.topleft == (8, 7)
+
+
+def test_rects_made_from_a_rect_are_detached():
+    scene = make_scene()
+    store = scene.falling_objects
+    asteroid = gameplay_items.BrownAsteroid(scene)
+    asteroid.update_pos(100, 200)
+
+    moved = asteroid.rect.move(10, 10)
+    moved.x = 500
+    copied = asteroid.rect.copy()
+    copied.move_ip(30, 30)
+    assert (store.x[asteroid.store_index], store.y[asteroid.store_index]) == (100, 200)
+
+
+def test_old_rect_does_not_move_whatever_reuses_the_slot():
+    scene = make_scene()
+    store = scene.falling_objects
+    asteroid = gameplay_items.BrownAsteroid(scene)
+    rect = asteroid.rect
+    asteroid.kill()
+    store.step()
+
+    other = gameplay_items.GreyAsteroid(scene)
+    assert other.store_index == asteroid.store_index
+    other.update_pos(300, 400)
+    rect.x = 0
+    assert (store.x[other.store_index], store.y[other.store_index]) == (300, 400)
+
+
+def test_set_image_resizes_the_object():
+    scene = make_scene()
+    store = scene.falling_objects
+    asteroid = gameplay_items.StrongAsteroid(scene)
+    asteroid.update_pos(10, 20)
+    asteroid.image = asteroid.image.subsurface((0, 0, 12, 8))
+    assert asteroid.rect == (10, 20, 12, 8)
+    assert store.images[asteroid.store_index] is asteroid.image
+
+
+def add_object(store, x, y, speed=5, respawn_min=-300, respawn_max=-100, layer="player"):
+    sprite = types.SimpleNamespace(store_index=None)
+    sprite.store_index = store.add(sprite, IMAGE, x, y, speed, respawn_min, respawn_max, layer=layer)
+    return sprite
+
+
+def test_step_moves_active_objects_only():
+    store = entity_store.EntityStore()
+    moving = add_object(store, 10, 100, speed=5)
+    stopped = add_object(store, 20, 100, speed=5)
+    store.remove(stopped)
+    store.step()
+    assert store.y[moving.store_index] == 105
+    assert store.y[stopped.store_index] == 100
+    assert store.previous_y[moving.store_index] == 100
+
+
+def test_objects_wrap_back_above_the_screen():
+    store = entity_store.EntityStore()
+    falling = [add_object(store, 500, entity_store.SCREEN_HEIGHT - 2, speed=5) for i in range(50)]
+    staying = add_object(store, 500, entity_store.SCREEN_HEIGHT - 10, speed=5)
+    store.step()
+    for sprite in falling:
+        assert -300 <= store.y[sprite.store_index] < -100
+        assert 0 <= store.x[sprite.store_index] < entity_store.SCREEN_WIDTH
+    assert len(set(store.x[[sprite.store_index for sprite in falling]].tolist())) > 1
+    assert (store.x[staying.store_index], store.y[staying.store_index]) == (500, entity_store.SCREEN_HEIGHT - 5)
+
+
+def test_wrapping_is_repeatable_from_the_session_seed():
+    positions = []
+    for attempt in range(2):
+        game_random.seed(3)
+        store = entity_store.EntityStore()
+        sprites = [add_object(store, 0, entity_store.SCREEN_HEIGHT) for i in range(10)]
+        store.step()
+        positions.append([(int(store.x[sprite.store_index]), int(store.y[sprite.store_index]))
+                          for sprite in sprites])
+    assert positions[0] == positions[1]
+
+
+def test_respawn_sends_one_object_back_above_the_screen():
+    store = entity_store.EntityStore()
+    collected = add_object(store, 300, 400, respawn_min=-5000, respawn_max=-200)
+    other = add_object(store, 300, 400)
+    store.respawn(collected.store_index)
+    assert -5000 <= store.y[collected.store_index] < -200
+    assert (store.x[other.store_index], store.y[other.store_index]) == (300, 400)
+
+
+def test_freed_slots_are_reused_after_the_next_step():
+    store = entity_store.EntityStore(capacity=2)
+    first = add_object(store, 0, 0)
+    add_object(store, 0, 0)
+    store.remove(first)
+    # Still readable in the tick it was removed in
+    assert add_object(store, 0, 0).store_index == 2
+    store.step()
+    assert add_object(store, 0, 0).store_index == first.store_index
+    assert len(store) == 3
+    # Grown once, for the third object
+    assert len(store.x) == 4
+
+
+def test_views_only_see_their_layer_on_screen():
+    store = entity_store.EntityStore()
+    on_screen = add_object(store, 100, 100)
+    add_object(store, 100, -500)
+    add_object(store, 200, 200, layer="pickups")
+    partly_on = add_object(store, -5, 760)
+    view = entity_store.StoreView(store, "player")
+    assert view.visible().tolist() == [on_screen.store_index, partly_on.store_index]
+    assert view.blit_sequence() == [(IMAGE, (100, 100)), (IMAGE, (-5, 760))]
+    assert view.rects() == [pygame.Rect(100, 100, 10, 20), pygame.Rect(0, 760, 5, 8)]
@@ -0,0 +1,84 @@
+""" Tests for levels described in levels/*.json. """
+
+# Standard library
+import json
+# Pytest
+import pytest
+# Game modules
+import gameplay_items
+import headless
+import level_loader
+import ui_scenes
+
+
+@pytest.fixture
+def level_directory(tmp_path, monkeypatch):
+    """ An empty directory to write level files into, read in place of levels/. """
+    monkeypatch.setattr(level_loader, "LEVEL_DIRECTORY", str(tmp_path))
+    monkeypatch.setattr(level_loader, "definitions", {})
+    return tmp_path
+
+
+def write_level(directory, name, data):
+    with open(str(directory / "{0}.json".format(name)), 'w') as f:
+        json.dump(data, f)
+
+
+def test_level_file_compiles_to_a_tick_timeline(level_directory):
+    write_level(level_directory, "test", {
+        "background": "assets/black_stars.png",
+        "length": 100,
+        "initial": [{"type": "BrownAsteroid", "count": 2}],
+        "spawns": [{"type": "GreyAsteroid", "every": 30},
+                   {"type": "Alien", "every": 20, "start": 10},
+                   {"type": "MedAsteroid", "every": 50, "start": 30}],
+        "pools": {"laser": 4},
+        "next": "boss_1.BossOne"})
+    definition = level_loader.load("test")
+    assert definition.length == 100
+    assert definition.initial == (("BrownAsteroid", 2),)
+    assert definition.pool_sizes == {"laser": 4}
+    # Types due on the same tick keep the order they are listed in
+    assert definition.timeline == ((10, ("Alien",)),
+                                   (30, ("GreyAsteroid", "Alien", "MedAsteroid")),
+                                   (50, ("Alien",)),
+                                   (60, ("GreyAsteroid",)),
+                                   (70, ("Alien",)),
+                                   (80, ("MedAsteroid",)),
+                                   (90, ("GreyAsteroid", "Alien")))
+    assert level_loader.load("test") is definition
+
+
+def test_unknown_sprite_type_and_bad_interval_are_rejected(level_directory):
+    write_level(level_directory, "unknown", {"background": "assets/black_stars.png", "next": "level_2",
+                                             "spawns": [{"type": "Comet", "every": 10}]})
+    write_level(level_directory, "never", {"background": "assets/black_stars.png", "next": "level_2",
+                                           "spawns": [{"type": "Alien", "every": 0}]})
+    with pytest.raises(ValueError):
+        level_loader.load("unknown")
+    with pytest.raises(ValueError):
+        level_loader.load("never")
+
+
+def test_data_level_spawns_on_its_timeline(level_directory):
+    write_level(level_directory, "short", {
+        "background": "assets/black_stars.png",
+        "length": 40,
+        "initial": [{"type": "BrownAsteroid", "count": 3}],
+        "spawns": [{"type": "GreyAsteroid", "every": 15}],
+        "next": "boss_1.BossOne"})
+    level = level_loader.resolve("short")(dict(headless.SETTINGS), gameplay_items.PlayerShip(), None, 0, 3)
+    assert len(level.asteroids) == 3
+    for tick in range(1, 31):
+        level.scheduler.run(tick)
+    assert len(level.asteroids) == 5
+    level.scheduler.run(40)
+    assert isinstance(level.next_scene, ui_scenes.LevelCompleteScene)
+
+
+def test_every_shipped_level_compiles():
+    name = "level_1"
+    while not name.startswith("boss"):
+        definition = level_loader.load(name)
+        assert len(definition.timeline) > 0
+        name = definition.next_level
@@ -0,0 +1,61 @@
+""" Tests for the sprite pools. """
+
+# Pygame
+import pygame
+# Game modules
+import gameplay_items
+import object_pool
+
+
+class Dot(gameplay_items.PooledSprite):
+    """ The smallest pooled sprite. """
+    def __init__(self):
+        super().__init__()
+        self.spawned_at = None
+
+    def spawn(self, x, y):
+        self.spawned_at = (x, y)
+
+
+def test_pool_is_filled_up_front():
+    pool = object_pool.ObjectPool(Dot, 3)
+    assert pool.stats() == {"created": 3, "free": 3, "in_use": 0, "high_water": 0, "misses": 0}
+
+
+def test_acquire_spawns_and_reuses_released_objects():
+    pool = object_pool.ObjectPool(Dot, 1)
+    dot = pool.acquire(1, 2)
+    assert dot.spawned_at == (1, 2)
+    dot.kill()
+    again = pool.acquire(3, 4)
+    assert again is dot
+    assert again.spawned_at == (3, 4)
+    assert pool.stats()["created"] == 1
+
+
+def test_releasing_twice_does_not_hand_an_object_out_twice():
+    pool = object_pool.ObjectPool(Dot, 2)
+    group = pygame.sprite.Group()
+    dot = pool.acquire(0, 0)
+    group.add(dot)
+    dot.kill()
+    dot.kill()
+    pool.release(dot)
+    assert pool.stats()["in_use"] == 0
+    assert len(pool.free) == 2
+    first = pool.acquire(0, 0)
+    second = pool.acquire(0, 0)
+    assert first is not second
+
+
+def test_high_water_mark_and_misses():
+    pool = object_pool.ObjectPool(Dot, 2)
+    dots = [pool.acquire(0, 0) for i in range(5)]
+    for dot in dots[:4]:
+        dot.kill()
+    pool.acquire(0, 0)
+    stats = pool.stats()
+    assert stats["high_water"] == 5
+    assert stats["misses"] == 3
+    assert stats["created"] == 5
+    assert stats["in_use"] == 2
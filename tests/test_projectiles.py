@@ -0,0 +1,60 @@
+""" Tests for the projectile manager. """
+
+# Pygame
+import pygame
+# Game modules
+import projectiles
+
+
+class Shot(pygame.sprite.Sprite):
+    """ Moves by a fixed step each tick. """
+    def __init__(self, x, y, x_speed=0, y_speed=-10):
+        super().__init__()
+        self.rect = pygame.Rect(x, y, 4, 10)
+        self.x_speed = x_speed
+        self.y_speed = y_speed
+
+    def update(self):
+        self.rect.move_ip(self.x_speed, self.y_speed)
+
+
+def test_projectiles_are_reclaimed_once_off_screen():
+    manager = projectiles.ProjectileManager(bounds=pygame.Rect(0, 0, 100, 100))
+    owner = pygame.sprite.Group()
+    leaving = Shot(50, 5)
+    staying = Shot(50, 80)
+    manager.add(leaving, owner)
+    manager.add(staying, owner)
+    manager.update()
+    assert leaving.alive() is True
+    manager.update()
+    assert leaving.alive() is False
+    assert staying.alive() is True
+    assert list(owner) == [staying]
+    assert manager.stats() == {"live": 1, "enemy_lasers": 0, "fired": 2, "left_screen": 1, "expired": 0}
+
+
+def test_projectiles_expire_after_their_lifetime():
+    manager = projectiles.ProjectileManager(bounds=pygame.Rect(0, 0, 100, 100), max_lifetime=3)
+    hovering = Shot(50, 50, y_speed=0)
+    manager.add_enemy_laser(hovering)
+    for tick in range(3):
+        manager.update()
+    assert hovering.alive() is True
+    manager.update()
+    assert hovering.alive() is False
+    assert manager.expired == 1
+    assert len(manager) == 0
+
+
+def test_clear_enemy_lasers_leaves_player_lasers():
+    manager = projectiles.ProjectileManager()
+    player_lasers = pygame.sprite.Group()
+    player_laser = Shot(100, 100)
+    manager.add(player_laser, player_lasers)
+    for x in range(3):
+        manager.add_enemy_laser(Shot(x * 10, 100, y_speed=10))
+    manager.clear_enemy_lasers()
+    assert len(manager.enemy_lasers) == 0
+    assert len(manager) == 1
+    assert player_laser.alive() is True
@@ -0,0 +1,72 @@
+""" Tests for the tick scheduler. """
+
+# Game modules
+import scheduler
+
+
+def nothing():
+    pass
+
+
+def run_ticks(events, first, last):
+    """ Runs the scheduler for every tick from first to last, returning the ticks anything ran on. """
+    busy = []
+    for tick in range(first, last + 1):
+        if events.run(tick) > 0:
+            busy.append(tick)
+    return busy
+
+
+def test_events_on_the_same_tick_run_in_registration_order():
+    events = scheduler.Scheduler(seed=1)
+    ran = []
+    events.at(5, ran.append, "b")
+    events.at(3, ran.append, "first")
+    events.at(5, ran.append, "c")
+    events.every(5, ran.append, "every")
+    events.at(5, ran.append, "d")
+    run_ticks(events, 0, 5)
+    assert ran == ["first", "b", "c", "every", "d"]
+
+
+def test_late_events_still_run_in_tick_order():
+    events = scheduler.Scheduler(seed=1)
+    ran = []
+    events.at(4, ran.append, 4)
+    events.at(2, ran.append, 2)
+    events.at(9, ran.append, 9)
+    assert events.run(5) == 2
+    assert ran == [2, 4]
+    assert len(events) == 1
+
+
+def test_recurring_event_runs_every_interval():
+    events = scheduler.Scheduler(seed=1)
+    events.every(10, nothing, start=3)
+    assert run_ticks(events, 0, 49) == [3, 13, 23, 33, 43]
+
+
+def jittered_ticks(seed):
+    events = scheduler.Scheduler(seed=seed)
+    events.every(20, nothing, jitter=5)
+    return run_ticks(events, 0, 999)
+
+
+def test_jitter_is_repeatable_with_a_seed():
+    ticks = jittered_ticks(7)
+    assert ticks == jittered_ticks(7)
+    assert ticks != jittered_ticks(8)
+    gaps = [later - earlier for earlier, later in zip(ticks, ticks[1:])]
+    assert min(gaps) >= 15 and max(gaps) <= 25
+    assert len(set(gaps)) > 1
+
+
+def test_cancelled_event_does_not_run_again():
+    events = scheduler.Scheduler(seed=1)
+    ran = []
+    event = events.every(2, ran.append, "tick", start=2)
+    run_ticks(events, 0, 4)
+    events.cancel(event)
+    run_ticks(events, 5, 10)
+    assert ran == ["tick", "tick"]
+    assert len(events) == 0
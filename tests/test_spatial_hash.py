@@ -0,0 +1,66 @@
+""" Tests for the collision broadphase. """
+
+# Pygame
+import pygame
+# Game modules
+import spatial_hash
+
+
+def box(x, y, width=10, height=10):
+    sprite = pygame.sprite.Sprite(pygame.sprite.Group())
+    sprite.rect = pygame.Rect(x, y, width, height)
+    return sprite
+
+
+def test_query_finds_sprites_in_neighbouring_cells():
+    grid = spatial_hash.SpatialHash(cell_size=100)
+    left = box(90, 50)
+    right = box(105, 50)
+    far = box(500, 500)
+    grid.rebuild({"asteroids": [left, right, far]})
+    # Straddles the boundary between the first two columns of cells
+    found = grid.query(pygame.Rect(95, 55, 10, 10), "asteroids")
+    assert set(found) == {left, right}
+    # Candidates are whatever shares a cell, whether or not the rects overlap
+    assert grid.query(pygame.Rect(10, 10, 5, 5), "asteroids") == [left]
+    assert grid.query(pygame.Rect(300, 300, 5, 5), "asteroids") == []
+
+
+def test_sprite_spanning_cells_is_returned_once():
+    grid = spatial_hash.SpatialHash(cell_size=100)
+    big = box(50, 50, 200, 200)
+    grid.rebuild({"asteroids": [big]})
+    assert grid.query(pygame.Rect(0, 0, 400, 400), "asteroids") == [big]
+    assert grid.query(pygame.Rect(240, 240, 5, 5), "asteroids") == [big]
+
+
+def test_sprite_exactly_on_a_cell_edge_is_only_in_one_cell():
+    grid = spatial_hash.SpatialHash(cell_size=100)
+    edge = box(100, 0, 100, 100)
+    grid.rebuild({"asteroids": [edge]})
+    assert grid.query(pygame.Rect(0, 0, 100, 100), "asteroids") == []
+    assert grid.query(pygame.Rect(199, 99, 1, 1), "asteroids") == [edge]
+
+
+def test_negative_positions_and_margin():
+    grid = spatial_hash.SpatialHash(cell_size=100)
+    above = box(-50, -60)
+    grid.rebuild({"asteroids": [above]})
+    assert grid.query(pygame.Rect(-40, 10, 5, 5), "asteroids") == []
+    assert grid.query(pygame.Rect(-40, 10, 5, 5), "asteroids", margin=20) == [above]
+
+
+def test_layers_bounds_placed_sprites_and_dead_sprites():
+    grid = spatial_hash.SpatialHash(cell_size=100, bounds=pygame.Rect(0, 0, 1000, 1000))
+    asteroid = box(10, 10)
+    alien = box(10, 10)
+    outside = box(-500, 10)
+    dead = box(20, 20)
+    placed = box(0, 0)
+    grid.rebuild({"asteroids": [asteroid, outside, dead], "aliens": [alien]},
+                 [("asteroids", placed, pygame.Rect(30, 30, 10, 10))])
+    dead.kill()
+    assert grid.sprites_indexed == 4
+    area = pygame.Rect(0, 0, 50, 50)
+    assert set(grid.query(area, "asteroids")) == {asteroid, placed}
+    assert grid.query(area, "aliens") == [alien]
@@ -0,0 +1,49 @@
+""" Tests for the shared font registry and rendered text cache. """
+
+# Game modules
+import constants
+import text_cache
+
+
+def test_fonts_are_shared_by_face_and_size():
+    cache = text_cache.TextCache()
+    assert cache.font(20) is cache.font(20)
+    assert cache.font(20) is not cache.font(21)
+    assert len(cache.fonts) == 2
+
+
+def test_rendered_text_is_reused():
+    cache = text_cache.TextCache()
+    first = cache.render("Score: 10", 25)
+    assert cache.render("Score: 10", 25, constants.WHITE) is first
+    assert cache.render("Score: 10", 25, list(constants.WHITE)) is first
+    assert cache.render("Score: 10", 26) is not first
+    assert cache.render("Score: 10", 25, constants.BRIGHT_GREEN) is not first
+    assert cache.render("Score: 10", 25, antialias=False) is not first
+    stats = cache.stats()
+    assert (stats["text_hits"], stats["text_misses"], stats["text_surfaces"]) == (2, 4, 4)
+
+
+def test_least_recently_used_text_is_dropped_over_the_limit():
+    probe = text_cache.TextCache().render("line 0", 25)
+    size = probe.get_pitch() * probe.get_height()
+    cache = text_cache.TextCache(memory_limit=size * 3)
+    oldest = cache.render("line 0", 25)
+    cache.render("line 1", 25)
+    cache.render("line 2", 25)
+    # Using line 0 again makes line 1 the least recently used
+    assert cache.render("line 0", 25) is oldest
+    cache.render("line 3", 25)
+    assert cache.stats()["text_evictions"] == 1
+    assert cache.render("line 0", 25) is oldest
+    assert cache.memory <= cache.memory_limit
+    misses = cache.misses
+    cache.render("line 1", 25)
+    assert cache.misses == misses + 1
+
+
+def test_text_bigger_than_the_limit_is_still_returned():
+    cache = text_cache.TextCache(memory_limit=1)
+    surface = cache.render("Much too long for the cache", 25)
+    assert cache.render("Much too long for the cache", 25) is surface
+    assert len(cache.surfaces) == 1
@@ -0,0 +1,88 @@
+""" A process-wide registry of fonts and cache of rendered text. Loading a font reads and parses the font
+file, and rendering text rasterises every glyph, so menus and widgets that draw the same labels every frame
+share one font per face and size, and reuse the surface rendered for each piece of text. The least recently
+used surfaces are dropped once the cache holds more than its memory limit. """
+
+# Pygame
+import pygame
+# Standard library
+import collections
+# Game modules
+import constants
+
+
+# Most bytes of rendered text kept. Menu labels are small, so this holds every label in the game many times over
+MEMORY_LIMIT = 4 * 1024 * 1024
+
+
+class TextCache:
+    """ Holds one pygame Font per (face, size), and rendered text surfaces by (text, face, size, color,
+    antialias). face is a font file path, or None for pygame's default font. Surfaces handed out are shared,
+    so they must be treated as read-only. Hit and miss counters show how often text had to be rendered. """
+    def __init__(self, memory_limit=MEMORY_LIMIT):
+        self.fonts = {}
+        self.surfaces = collections.OrderedDict()
+        self.memory_limit = memory_limit
+        self.memory = 0
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def font(self, size, face=None):
+        """ Returns the shared Font for a face and size, loading it the first time it is asked for. """
+        key = (face, size)
+        font = self.fonts.get(key)
+        if font is None:
+            font = pygame.font.Font(face, size)
+            self.fonts[key] = font
+        return font
+
+    def render(self, text, size, color=constants.WHITE, antialias=True, face=None):
+        """ Returns a surface with the text rendered on it, rendering it only if it isn't cached. """
+        key = (text, face, size, tuple(color), antialias)
+        surface = self.surfaces.get(key)
+        if surface is not None:
+            self.hits += 1
+            self.surfaces.move_to_end(key)
+            return surface
+
+        self.misses += 1
+        surface = self.font(size, face).render(text, antialias, color)
+        self.surfaces[key] = surface
+        self.memory += surface.get_pitch() * surface.get_height()
+        # Drop the least recently used text until back under the limit, always keeping what was just rendered
+        while self.memory > self.memory_limit and len(self.surfaces) > 1:
+            old_key, old_surface = self.surfaces.popitem(last=False)
+            self.memory -= old_surface.get_pitch() * old_surface.get_height()
+            self.evictions += 1
+        return surface
+
+    def clear(self):
+        """ Drops every rendered surface. Fonts are kept. """
+        self.surfaces.clear()
+        self.memory = 0
+
+    def stats(self):
+        """ Returns the hit, miss and eviction counters, and how many fonts, surfaces and bytes are held. """
+        return {"text_hits": self.hits, "text_misses": self.misses, "text_evictions": self.evictions,
+                "fonts": len(self.fonts), "text_surfaces": len(self.surfaces), "text_bytes": self.memory}
+
+    def reset_stats(self):
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+
+# The cache shared by the whole game
+cache = TextCache()
+
+
+def font(size, face=None):
+    """ Returns the shared Font for the given size of a face (pygame's default font if face is None). """
+    return cache.font(size, face)
+
+
+def render(text, size, color=constants.WHITE, antialias=True, face=None):
+    """ Returns a shared surface of the text rendered in the given size and color. """
+    return cache.render(text, size, color, antialias, face)
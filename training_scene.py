@@ -1,11 +1,10 @@
 """ A scene for the 'training' game mode. Inherits from the game_scene but with the init method overriden
 to allow for player chosen numbers of enemies, powerups etc. """
 
-# Pygame
-import pygame
 # Standard library
 import os
 # Game modules
+import asset_registry
 import game_scene
 import gameplay_items
 import scene_tools
@@ -21,7 +20,8 @@ class TrainingScene(game_scene.GameScene):
         self.player = ship
         self.player_2 = ship_2
         self.score = 0
-        super().__init__(pygame.image.load('assets/training_background.png').convert())
+        super().__init__(asset_registry.load_image('assets/training_background.png', alpha=False))
+        self.add_to_layer("hud", self.draw_text)
         self.next_scene = self
         # Getting the user choices
         self.brown_asteroids_toggle = training_choices[0]
@@ -45,25 +45,23 @@ class TrainingScene(game_scene.GameScene):
         self.health = training_choices[14]
 
         # Make stars green to fit with the simulator theme
-        for star in self.top_stars:
-            star.color = constants.BRIGHT_GREEN
-        for star in self.bottom_stars:
-            star.color = constants.BRIGHT_GREEN
+        self.top_stars.set_color(constants.BRIGHT_GREEN)
+        self.bottom_stars.set_color(constants.BRIGHT_GREEN)
 
         # Create brown asteroids if the option is selected
         if self.brown_asteroids_toggle == 0:
             scene_tools.initial_falling_objects(self.brown_asteroid_count, gameplay_items.BrownAsteroid,
-                                                self.all_sprites, self.asteroids, argument=self)
+                                                self.asteroids, argument=self)
 
         # Create grey asteroids if the option is selected
         if self.grey_asteroids_toggle == 0:
             scene_tools.initial_falling_objects(self.grey_asteroid_count, gameplay_items.GreyAsteroid,
-                                                self.all_sprites, self.asteroids, argument=self)
+                                                self.asteroids, argument=self)
 
         # Create small asteroids if the option is selected
         if self.small_asteroids_toggle == 0:
             scene_tools.initial_falling_objects(self.small_asteroid_count, gameplay_items.MedAsteroid,
-                                                self.all_sprites, self.asteroids, argument=self)
+                                                self.asteroids, argument=self)
 
         # Create aliens if the option is selected
         if self.alien_toggle == 0:
@@ -75,44 +73,37 @@ class TrainingScene(game_scene.GameScene):
             for powerup in self.pups:
                 powerup.kill()
 
-    def handle_events(self, events):
-        super().handle_events(events)
-
-    def update(self):
-        super().update()
-
         # Add new brown asteroids every x seconds if option is selected
         if self.brown_asteroids_toggle == 0:
-            scene_tools.add_falling_object(self.timer, self.brown_asteroid_seconds * 60, gameplay_items.BrownAsteroid,
-                                           self.all_sprites, self.asteroids, argument=self)
+            scene_tools.schedule_falling_object(self.scheduler, self.brown_asteroid_seconds * 60,
+                                                gameplay_items.BrownAsteroid, self.asteroids, argument=self)
 
         # Add new grey asteroids every x seconds if option is selected
         if self.grey_asteroids_toggle == 0:
-            scene_tools.add_falling_object(self.timer, self.grey_asteroid_seconds * 60, gameplay_items.GreyAsteroid,
-                                           self.all_sprites, self.asteroids, argument=self)
-
+            scene_tools.schedule_falling_object(self.scheduler, self.grey_asteroid_seconds * 60,
+                                                gameplay_items.GreyAsteroid, self.asteroids, argument=self)
 
         # Add new small asteroids every x seconds if option is selected
         if self.small_asteroids_toggle == 0:
-            scene_tools.add_falling_object(self.timer, self.small_asteroid_seconds * 60, gameplay_items.MedAsteroid,
-                                           self.all_sprites, self.asteroids, argument=self)
+            scene_tools.schedule_falling_object(self.scheduler, self.small_asteroid_seconds * 60,
+                                                gameplay_items.MedAsteroid, self.asteroids, argument=self)
 
         # Add new alien every x seconds if option is selected
         if self.alien_toggle == 0:
-            scene_tools.add_falling_object(self.timer, self.alien_seconds * 60, gameplay_items.Alien, self.aliens,
-                                           argument=self)
+            scene_tools.schedule_falling_object(self.scheduler, self.alien_seconds * 60, gameplay_items.Alien,
+                                                self.aliens, argument=self)
+
+        # The simulation always lasts the same length of time
+        self.scheduler.at(5000, self.training_complete)
 
-        if self.timer == 5000:
-            self.next_scene = ui_scenes.TrainingGameOverScene(self.score, "win", self.settings)
+    def handle_events(self, events):
+        super().handle_events(events)
+
+    def update(self):
+        super().update()
 
         if self.lives == 0:
             self.next_scene = ui_scenes.TrainingGameOverScene(self.score, "lose", self.settings)
 
-    def draw(self, screen):
-        super().draw(screen)
-        self.all_sprites.draw(screen)
-        self.collectible_stars.draw(screen)
-        for alien in self.aliens:
-            alien.draw_lasers(screen)
-        self.aliens.draw(screen)
-        game_scene.GameScene.draw_text(self, screen)
\ No newline at end of file
+    def training_complete(self):
+        self.next_scene = ui_scenes.TrainingGameOverScene(self.score, "win", self.settings)
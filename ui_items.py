@@ -5,6 +5,8 @@ import pygame
 # Game modules
 import constants
 import scene_tools
+import game_input
+import text_cache
 
 
 class Button:
@@ -16,7 +18,7 @@ class Button:
         self.height = height
         self.x = x
         self.y = y
-        self.font = pygame.font.Font(None, text_size)
+        self.text_size = text_size
 
         # None input attributes
         self.mouse_over = False
@@ -26,8 +28,8 @@ class Button:
                                                                          self.x + self.width, self.y + self.height))
 
     def draw_button(self, screen):
-        render = self.font.render(self.text, True, (255, 255, 255))
-        text_size = self.font.size(self.text)
+        render = text_cache.render(self.text, self.text_size, constants.WHITE)
+        text_size = render.get_size()
         text_width = text_size[0]
         x = (self.width / 2) - (text_width / 2)
         text_height = text_size[1]
@@ -92,14 +94,14 @@ class Popup:
 class Tooltip(Popup):
     """ A coloured box that displays some text. Positioned next to the mouse cursor."""
     def __init__(self, text, width, height, bg_color=constants.LIGHT_GREY_2):
-        x = pygame.mouse.get_pos()[0]
-        y = pygame.mouse.get_pos()[1]
+        x = game_input.mouse_pos()[0]
+        y = game_input.mouse_pos()[1]
         super().__init__(text, width, height, x, y, bg_color=bg_color)
         self.visible = False
 
     def update(self):
-        self.x = pygame.mouse.get_pos()[0]
-        self.y = pygame.mouse.get_pos()[1]
+        self.x = game_input.mouse_pos()[0]
+        self.y = game_input.mouse_pos()[1]
 
     def draw(self, screen):
         if self.visible is True:
@@ -180,11 +182,11 @@ class NumberSelect:
                                                     constants.DARK_GREY)
         self.decrease_button = RectangleHoverButton("", 55, 30, self.x, self.y + 75, constants.LIGHT_GREY,
                                                     constants.DARK_GREY)
-        self.font = pygame.font.Font(None, 25)
+        self.text_size = 25
 
         self.text = text
         if text is not None:
-            self.text_render = self.font.render(text, True, constants.WHITE)
+            self.text_render = text_cache.render(text, self.text_size, constants.WHITE)
 
     def handle_events(self, events):
         for event in events:
@@ -206,7 +208,7 @@ class NumberSelect:
         self.decrease_button.draw_button(screen)
         pygame.draw.rect(screen, constants.LIGHT_GREY_2, (self.x, self.y + 30, 55, 45))
         value = str(self.value)
-        render = self.font.render(value, True, constants.WHITE)
+        render = text_cache.render(value, self.text_size, constants.WHITE)
         text_rect = render.get_rect()
         x = ((55 / 2) - (text_rect[2] / 2)) + self.x
         y = (45 / 2) - (text_rect[3] / 2) + self.y + 31
@@ -233,9 +235,9 @@ class OptionButton:
 
         self.text_1 = text_1
         self.text_2 = text_2
-        self.font = pygame.font.Font(None, 25)
-        self.text_1_render = self.font.render(self.text_1, True, constants.WHITE)
-        self.text_2_render = self.font.render(self.text_2, True, constants.WHITE)
+        self.text_size = 25
+        self.text_1_render = text_cache.render(self.text_1, self.text_size, constants.WHITE)
+        self.text_2_render = text_cache.render(self.text_2, self.text_size, constants.WHITE)
 
     def handle_events(self, events):
         for event in events:
@@ -291,7 +293,6 @@ class HealthBar:
 
         # Text
         self.text_size = 25
-        self.font = pygame.font.Font(None, self.text_size)
 
     def update(self):
         bar_percentage = (self.current_health / self.full_health)
@@ -301,7 +302,7 @@ class HealthBar:
         pygame.draw.rect(screen, constants.HEALTH_RED, (self.x, self.y, self.width, self.height))
         pygame.draw.rect(screen, constants.HEALTH_GREEN, (self.x, self.y, self.current_health_bar_width, self.height))
 
-        health_render = self.font.render(str(self.current_health), True, constants.WHITE)
+        health_render = text_cache.render(str(self.current_health), self.text_size, constants.WHITE)
         health_render_rect = health_render.get_rect()
         x = self.x + ((self.width / 2) - (health_render_rect.width / 2))
         y = self.y + ((self.height / 2) - (health_render_rect.height / 2))
@@ -321,8 +322,8 @@ class Slider:
 
         self.thickness = 5
 
-        # Font
-        self.font = pygame.font.Font(None, 25)
+        # Text
+        self.text_size = 25
 
         # What percentage of the bar is the starting value
         self.value_percentage = (self.value - self.min_value) / (self.max_value - self.min_value)
@@ -342,13 +343,13 @@ class Slider:
         if event.type == pygame.MOUSEBUTTONDOWN:
             if self.mouse_over_grabbable is True:
                 self.grabbable_clicked = True
-                self.mouse_x_on_click = pygame.mouse.get_pos()[0]
+                self.mouse_x_on_click = game_input.mouse_pos()[0]
         elif event.type == pygame.MOUSEBUTTONUP:
             self.grabbable_clicked = False
 
     def update(self):
         # Check if the mouse is over the grabbable
-        if (self.grabbable_rect[0] < pygame.mouse.get_pos()[0] < self.grabbable_rect[0] + self.grabbable_rect[2]) and (self.grabbable_rect[1] < pygame.mouse.get_pos()[1] < self.grabbable_rect[1] + self.grabbable_rect[3]):
+        if (self.grabbable_rect[0] < game_input.mouse_pos()[0] < self.grabbable_rect[0] + self.grabbable_rect[2]) and (self.grabbable_rect[1] < game_input.mouse_pos()[1] < self.grabbable_rect[1] + self.grabbable_rect[3]):
             self.mouse_over_grabbable = True
         else:
             self.mouse_over_grabbable = False
@@ -361,7 +362,7 @@ class Slider:
 
         # Every tick, find out how far the mouse moves, move the grabbable by the same amount
         if self.mouse_x_on_click is not None and self.grabbable_clicked is True:
-            grabbable_movement = pygame.mouse.get_pos()[0] - self.mouse_x_on_click
+            grabbable_movement = game_input.mouse_pos()[0] - self.mouse_x_on_click
             new_grabbable_pos = self.grabbable_rect[0] + grabbable_movement
             # Keep grabbale within the line
             if new_grabbable_pos < self.x - 2:
@@ -369,7 +370,7 @@ class Slider:
             elif new_grabbable_pos + self.grabbable_rect[2] > self.x + self.width + 3:
                 new_grabbable_pos = self.x + self.width - self.grabbable_rect[2] + 3
             self.grabbable_rect[0] = new_grabbable_pos
-            self.mouse_x_on_click = pygame.mouse.get_pos()[0]
+            self.mouse_x_on_click = game_input.mouse_pos()[0]
             grabbable_movement = 0
 
         # How many pixels along the bar is the centre of the grabbable
@@ -387,5 +388,5 @@ class Slider:
         pygame.draw.rect(screen, self.grabbable_color, self.grabbable_rect)
 
         # Draw text
-        value_render = self.font.render(str(round(self.value)), True, constants.WHITE)
+        value_render = text_cache.render(str(round(self.value)), self.text_size, constants.WHITE)
         screen.blit(value_render, (self.x + self.width + 10, self.y - 5))
\ No newline at end of file
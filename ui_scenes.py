@@ -6,6 +6,7 @@ import pygame
 import datetime
 import pickle
 # Game modules
+import asset_registry
 import ui_items
 import constants
 import generic_scene
@@ -14,10 +15,40 @@ import level_1
 import training_scene
 import customisation_scene
 import settings_scene
+import sound_bank
+import game_input
+import text_cache
 # Third party Pygame modules
 import eztext
 
 
+# Single player and multiplayer high-scores, each a list of [name, score, date]
+HIGHSCORES_PATH = 'asteroid-attack-program-highscores.p'
+
+
+def load_highscores():
+    """ Returns [single player, multiplayer] high-scores, each sorted highest first. If there is no
+    high-scores file yet (ie the game has been started for the first time) or it is empty, both are blank. """
+    try:
+        with open(HIGHSCORES_PATH, 'rb') as f:
+            highscores = pickle.load(f)
+    except (FileNotFoundError, EOFError):
+        highscores = [[], []]
+    return [sort_highscores(highscores[0]), sort_highscores(highscores[1])]
+
+
+def sort_highscores(highscores):
+    return sorted(highscores, key=lambda item: item[1], reverse=True)
+
+
+def save_highscores(highscores):
+    try:
+        with open(HIGHSCORES_PATH, 'wb') as f:
+            pickle.dump(highscores, f)
+    except OSError:
+        pass
+
+
 class OpeningScene(generic_scene.GenericScene):
     """ The initial screen. Displays the UnderSand logo and loads the settings file. """
     def __init__(self):
@@ -33,13 +64,19 @@ class OpeningScene(generic_scene.GenericScene):
             # and populate it with the default settings, then save the file
             f = open('asteroid-attack-program-settings.p', 'wb')
             self.settings = {"sound_volume": 50, "music_volume": 50, "menu_music_playing": False,
-                             "level_music_playing": False}
+                             "level_music_playing": False, "explosion_frame_step": 1}
             pickle.dump(self.settings, f)
             f.close()
 
         self.settings['menu_music_playing'] = False
         self.settings['level_music_playing'] = False
 
+        # Decode every sound effect up front so nothing is loaded from disk mid-game
+        sound_bank.bank.load()
+        sound_bank.set_volume(self.settings['sound_volume'])
+        # Likewise the explosion animation, which every level shares
+        asset_registry.load_frames('assets/explosion', self.settings.get('explosion_frame_step', 1))
+
         # Load and play the waves sound
         self.waves = pygame.mixer.Sound('music/waves.ogg')
         self.waves.set_volume(self.settings['music_volume'] / 100)
@@ -113,8 +150,7 @@ class TitleScene(generic_scene.GenericScene):
         self.background = pygame.image.load('assets/title_bg.png').convert()
 
         # Buttons sound
-        self.button_sound = pygame.mixer.Sound('music/button.ogg')
-        self.button_sound.set_volume(self.settings['sound_volume'] / 100)
+        self.button_sound = sound_bank.get("button")
 
         # Creating and centering logo
         self.logo = pygame.image.load('assets/asteroid_attack_logo.png').convert_alpha()
@@ -155,7 +191,7 @@ class TitleScene(generic_scene.GenericScene):
         # Pass the mouse location to the button objects.
         # They will then update self.mouse_over to be True or False
         for button in self.buttons:
-            button.mouse_on_button(pygame.mouse.get_pos())
+            button.mouse_on_button(game_input.mouse_pos())
         self.timer += 1
 
     def draw(self, screen):
@@ -178,25 +214,11 @@ class HighScoresScene(generic_scene.GenericScene):
         self.highscore_to_highlight = highscore_to_highlight
         # Is the score to be highlighted single or multiplayer, so the correct tab is opened
         self.list_showing = players
-        # Open the highscores list and store in highscores_list. If there is no highscores file (ie
-        # the game has been started for the first time), make a blank list.
-        try:
-            f = open('asteroid-attack-program-highscores.p', 'rb')
-            self.highscore_list = pickle.load(f)
-            f.close()
-        except FileNotFoundError:
-            self.highscore_list = [[], []]
-
+        self.highscore_list = load_highscores()
         self.single_highscores = self.highscore_list[0]
         self.multi_highscores = self.highscore_list[1]
-
-        # Sort key to be passed to the sorted function
-        def sort_by(item):
-            return item[1]
-
-        # Sort the highscores for display
-        self.single_highscores = sorted(self.single_highscores, key=sort_by, reverse=True)
-        self.multi_highscores = sorted(self.multi_highscores, key=sort_by, reverse=True)
+        # Each tab's table is rendered once, by list_showing. Cleared when the high-scores change
+        self.tables = {}
 
         # Buttons
         self.return_button = ui_items.RectangleHoverButton("Return", 300, 90, 202, 640, constants.LIGHT_GREY,
@@ -218,10 +240,9 @@ class HighScoresScene(generic_scene.GenericScene):
             self.multi_button.hover_color = constants.LIGHT_GREY
 
         self.buttons = [self.return_button, self.clear_button, self.single_button, self.multi_button]
-        self.button_sound = pygame.mixer.Sound('music/button.ogg')
-        self.button_sound.set_volume(self.settings['sound_volume'] / 100)
+        self.button_sound = sound_bank.get("button")
 
-        self.font = pygame.font.Font(None, 25)
+        self.font = text_cache.font(25)
 
         self.confirmation_popup = ui_items.Modal(["Are you sure you want to delete",
                                                   "all high-scores?",
@@ -257,12 +278,10 @@ class HighScoresScene(generic_scene.GenericScene):
                     if self.confirmation_popup.button_1.mouse_over is True:
                         self.button_sound.play()
                         self.highscore_list = [[], []]
-                        try:
-                            f = open('asteroid-attack-program-highscores.p', 'wb')
-                            pickle.dump(self.highscore_list, f)
-                            f.close()
-                        except:
-                            pass
+                        self.single_highscores = self.highscore_list[0]
+                        self.multi_highscores = self.highscore_list[1]
+                        self.tables.clear()
+                        save_highscores(self.highscore_list)
                         self.show_popup = False
                     elif self.confirmation_popup.button_2.mouse_over is True:
                         self.show_popup = False
@@ -270,68 +289,43 @@ class HighScoresScene(generic_scene.GenericScene):
     def update(self):
         if self.show_popup is False:
             for button in self.buttons:
-                button.mouse_on_button(pygame.mouse.get_pos())
+                button.mouse_on_button(game_input.mouse_pos())
         else:
-            self.confirmation_popup.update(pygame.mouse.get_pos())
+            self.confirmation_popup.update(game_input.mouse_pos())
+
+    def render_table(self, highscores):
+        """ Renders the highscores section (background included) to a surface, with the highlighted score
+        in green. """
+        table = pygame.Surface((420, 480))
+        table.fill(constants.DARK_GREY)
+        if len(highscores) == 0:
+            scene_tools.multiline_text(["No high-scores yet!", "Why don't you play and see how you do?"],
+                                       340 - 300, 160 - 110, table, constants.WHITE, 25)
+            return table
+        y = 160 - 110
+        for rank, score in enumerate(highscores, 1):
+            if score == self.highscore_to_highlight:
+                color = constants.BRIGHT_GREEN
+            else:
+                color = constants.WHITE
+            x = 367 - 300
+            for text, offset in (("{0!s}.".format(rank), 0), (score[0], 40), (score[1], 170), (score[2], 230)):
+                table.blit(self.font.render("{0!s}".format(text), True, color), (x + offset, y))
+            y += 40
+        return table
 
     def draw(self, screen):
         screen.fill(constants.DARKER_GREY)
-        # Highscores section background
-        pygame.draw.rect(screen, constants.DARK_GREY, (300, 110, 420, 480))
         for button in self.buttons:
             button.draw_button(screen)
-        if self.list_showing == "single":
-            if len(self.single_highscores) > 0:
-                y = 160
-                rank = 1
-                for score in self.single_highscores:
-                    if score == self.highscore_to_highlight:
-                        color = constants.BRIGHT_GREEN
-                    else:
-                        color = constants.WHITE
-                    rank_text = "{0!s}.".format(rank)
-                    rank_render = self.font.render(rank_text, True, color)
-                    screen.blit(rank_render, (367, y))
-                    name_text = "{0!s}".format(score[0])
-                    name_render = self.font.render(name_text, True, color)
-                    screen.blit(name_render, (367 + 40, y))
-                    score_text = "{0!s}".format(score[1])
-                    score_render = self.font.render(score_text, True, color)
-                    screen.blit(score_render, (367 + 170, y))
-                    date_text = "{0!s}".format(score[2])
-                    date_render = self.font.render(date_text, True, color)
-                    screen.blit(date_render, (367 + 230, y))
-                    y += 40
-                    rank += 1
+        table = self.tables.get(self.list_showing)
+        if table is None:
+            if self.list_showing == "single":
+                table = self.render_table(self.single_highscores)
             else:
-                scene_tools.multiline_text(["No high-scores yet!", "Why don't you play and see how you do?"],
-                                           340, 160, screen, constants.WHITE, 25)
-        elif self.list_showing == "multi":
-            if len(self.multi_highscores) > 0:
-                y = 160
-                rank = 1
-                for score in self.multi_highscores:
-                    if score == self.highscore_to_highlight:
-                        color = constants.GREEN
-                    else:
-                        color = constants.WHITE
-                    rank_text = "{0!s}.".format(rank)
-                    rank_render = self.font.render(rank_text, True, color)
-                    screen.blit(rank_render, (367, y))
-                    name_text = "{0!s}".format(score[0])
-                    name_render = self.font.render(name_text, True, color)
-                    screen.blit(name_render, (367 + 40, y))
-                    score_text = "{0!s}".format(score[1])
-                    score_render = self.font.render(score_text, True, color)
-                    screen.blit(score_render, (367 + 170, y))
-                    date_text = "{0!s}".format(score[2])
-                    date_render = self.font.render(date_text, True, color)
-                    screen.blit(date_render, (367 + 230, y))
-                    y += 40
-                    rank += 1
-            else:
-                scene_tools.multiline_text(["No high-scores yet!", "Why don't you play and see how you do?"],
-                                           340, 160, screen, constants.WHITE, 25)
+                table = self.render_table(self.multi_highscores)
+            self.tables[self.list_showing] = table
+        screen.blit(table, (300, 110))
         if self.show_popup is True:
             self.confirmation_popup.draw(screen)
 
@@ -356,8 +350,7 @@ class GameModeSelectionScene(generic_scene.GenericScene):
                                                            constants.DARK_GREY)
         self.buttons = [self.campaign_button, self.training_button, self.return_button]
 
-        self.button_sound = pygame.mixer.Sound('music/button.ogg')
-        self.button_sound.set_volume(self.settings['sound_volume'] / 100)
+        self.button_sound = sound_bank.get("button")
 
     def handle_events(self, events):
         for event in events:
@@ -375,7 +368,7 @@ class GameModeSelectionScene(generic_scene.GenericScene):
 
     def update(self):
         for button in self.buttons:
-            button.mouse_on_button(pygame.mouse.get_pos())
+            button.mouse_on_button(game_input.mouse_pos())
 
     def draw(self, screen):
         screen.fill(constants.DARKER_GREY)
@@ -401,7 +394,7 @@ class PlayerNumberScene(generic_scene.GenericScene):
         self.game_mode = game_mode
 
         # Check if there is a joystick connected. To be used to check whether multiplaer can be selected.
-        self.joystick_count = pygame.joystick.get_count()
+        self.joystick_count = game_input.joystick_count()
         if self.joystick_count >= 1:
             self.joystick_connected = True
         else:
@@ -415,8 +408,7 @@ class PlayerNumberScene(generic_scene.GenericScene):
             self.multi_button = ui_items.RectangleHoverButton("Two Players", 300, 90, 362, 500, color=constants.DARK_GREY)
         self.return_button = ui_items.RectangleHoverButton("Return", 300, 90, 362, 600)
         self.buttons = [self.single_button, self.multi_button, self.return_button]
-        self.button_sound = pygame.mixer.Sound('music/button.ogg')
-        self.button_sound.set_volume(self.settings['sound_volume'] / 100)
+        self.button_sound = sound_bank.get("button")
 
         # Tooltip
         self.multi_tip = ui_items.Tooltip(["No joystick", "detected"], 130, 70)
@@ -438,7 +430,7 @@ class PlayerNumberScene(generic_scene.GenericScene):
 
     def update(self):
         for button in self.buttons:
-            button.mouse_on_button(pygame.mouse.get_pos())
+            button.mouse_on_button(game_input.mouse_pos())
         self.multi_tip.update()
 
         if self.multi_button.mouse_over is True:
@@ -469,8 +461,7 @@ class TrainingSetupScene(generic_scene.GenericScene):
         self.return_button = ui_items.RectangleHoverButton("Return", 300, 90, 202 + 20 + 300, 640, constants.DARKER_RED,
                                                            constants.DARK_RED)
         self.buttons = [self.start_button, self.return_button]
-        self.button_sound = pygame.mixer.Sound('music/button.ogg')
-        self.button_sound.set_volume(self.settings['sound_volume'] / 100)
+        self.button_sound = sound_bank.get("button")
 
         self.column_1_x = 20
         self.column_spacing = 300
@@ -551,11 +542,11 @@ class TrainingSetupScene(generic_scene.GenericScene):
 
     def update(self):
         for button in self.buttons:
-            button.mouse_on_button(pygame.mouse.get_pos())
+            button.mouse_on_button(game_input.mouse_pos())
 
         for list in self.all_components:
             for component in list:
-                component.update(pygame.mouse.get_pos())
+                component.update(game_input.mouse_pos())
 
     def draw(self, screen):
         screen.fill(constants.DARKER_GREY)
@@ -593,8 +584,7 @@ class InstructionsScene(generic_scene.GenericScene):
                                                            constants.DARK_GREY)
         self.acknowledgements_button = ui_items.RectangleHoverButton("Acknowledgements", 300, 90, 522, 640, constants.LIGHT_GREY,
                                                                      constants.DARK_GREY)
-        self.button_sound = pygame.mixer.Sound('music/button.ogg')
-        self.button_sound.set_volume(self.settings['sound_volume'] / 100)
+        self.button_sound = sound_bank.get("button")
 
     def handle_events(self, events):
         for event in events:
@@ -606,8 +596,8 @@ class InstructionsScene(generic_scene.GenericScene):
                 self.next_scene = AcknowledgementsScene(self.settings)
 
     def update(self):
-        self.return_button.mouse_on_button(pygame.mouse.get_pos())
-        self.acknowledgements_button.mouse_on_button(pygame.mouse.get_pos())
+        self.return_button.mouse_on_button(game_input.mouse_pos())
+        self.acknowledgements_button.mouse_on_button(game_input.mouse_pos())
 
     def draw(self, screen):
         screen.fill(constants.DARKER_GREY)
@@ -641,8 +631,7 @@ class AcknowledgementsScene(generic_scene.GenericScene):
 
         self.return_button = ui_items.RectangleHoverButton("Return", 300, 90, 362, 640, constants.LIGHT_GREY,
                                                            constants.DARK_GREY)
-        self.button_sound = pygame.mixer.Sound('music/button.ogg')
-        self.button_sound.set_volume(self.settings['sound_volume'] / 100)
+        self.button_sound = sound_bank.get("button")
 
     def handle_events(self, events):
         for event in events:
@@ -651,7 +640,7 @@ class AcknowledgementsScene(generic_scene.GenericScene):
                 self.next_scene = InstructionsScene(self.settings)
 
     def update(self):
-        self.return_button.mouse_on_button(pygame.mouse.get_pos())
+        self.return_button.mouse_on_button(game_input.mouse_pos())
 
     def draw(self, screen):
         screen.fill(constants.DARKER_GREY)
@@ -795,31 +784,12 @@ class GameOverScene(generic_scene.GenericScene):
             self.players = "single"
         else:
             self.players = "multi"
-        try:
-            f = open('asteroid-attack-program-highscores.p', 'rb')
-            self.high_scores_list = pickle.load(f)
-            f.close()
-        except FileNotFoundError:
-            f = open('asteroid-attack-program-highscores.p', 'wb')
-            f.close()
-            self.high_scores_list = [[], []]
-        except EOFError:
-            self.high_scores_list = [[], []]
-
-        # Sort by score (second item)
-        def sort_by(item):
-            return item[1]
-
+        self.high_scores_list = load_highscores()
         if self.players == "single":
-            # If it's a single player game that has just finished, sort the first list in self.high_scores_list
-            # which is for single player
-            self.high_scores_list[0] = sorted(self.high_scores_list[0], key=sort_by, reverse=True)
-            # Set self.high_scores_mod, which will be manipulated
+            # If it's a single player game that has just finished, the first list is manipulated
             self.high_scores_mod = self.high_scores_list[0]
         else:
-            # Otherwise, sort the second list, which is for multiplayer
-            self.high_scores_list[1] = sorted(self.high_scores_list[1], key=sort_by, reverse=True)
-            # Set self.high_scores_mod
+            # Otherwise, the second list, which is for multiplayer
             self.high_scores_mod = self.high_scores_list[1]
 
         # Find the lowest highscore
@@ -865,8 +835,7 @@ class GameOverScene(generic_scene.GenericScene):
         else:
             self.return_button = ui_items.RectangleHoverButton("Return", 300, 100, 362, 620, constants.LIGHT_GREY,
                                                       constants.DARK_GREY)
-        self.button_sound = pygame.mixer.Sound('music/button.ogg')
-        self.button_sound.set_volume(self.settings['sound_volume'] / 100)
+        self.button_sound = sound_bank.get("button")
 
     def handle_events(self, events):
         for event in events:
@@ -881,7 +850,7 @@ class GameOverScene(generic_scene.GenericScene):
             self.textbox.update(events)
 
     def update(self):
-        self.return_button.mouse_on_button(pygame.mouse.get_pos())
+        self.return_button.mouse_on_button(game_input.mouse_pos())
         if self.new_high_score is True:
             self.name = self.textbox.value
 
@@ -894,16 +863,12 @@ class GameOverScene(generic_scene.GenericScene):
         # Cut off the last high score, since a new one is being added
         self.high_scores_mod = self.high_scores_mod[:9]
         self.high_scores_mod.append(self.score)
+        self.high_scores_mod = sort_highscores(self.high_scores_mod)
         if self.players == "single":
             new_high_scores = [self.high_scores_mod, self.high_scores_list[1]]
         else:
             new_high_scores = [self.high_scores_list[0], self.high_scores_mod]
-        try:
-            f = open('asteroid-attack-program-highscores.p', 'wb')
-            pickle.dump(new_high_scores, f)
-            f.close()
-        except:
-            pass
+        save_highscores(new_high_scores)
 
     def draw(self, screen):
         screen.fill(constants.DARKER_GREY)
@@ -946,8 +911,7 @@ class TrainingGameOverScene(generic_scene.GenericScene):
 
         self.return_button = ui_items.RectangleHoverButton("Return", 300, 90, 362, 640, constants.LIGHT_GREY,
                                                            constants.DARK_GREY)
-        self.button_sound = pygame.mixer.Sound('music/button.ogg')
-        self.button_sound.set_volume(self.settings['sound_volume'] / 100)
+        self.button_sound = sound_bank.get("button")
 
     def handle_events(self, events):
         for event in events:
@@ -956,7 +920,7 @@ class TrainingGameOverScene(generic_scene.GenericScene):
                 self.next_scene = TitleScene(self.settings)
 
     def update(self):
-        self.return_button.mouse_on_button(pygame.mouse.get_pos())
+        self.return_button.mouse_on_button(game_input.mouse_pos())
 
     def draw(self, screen):
         screen.fill(constants.DARKER_GREY)